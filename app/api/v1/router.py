@@ -1,17 +1,54 @@
-from fastapi import APIRouter, HTTPException, Depends
-from typing import Dict, Any
+import asyncio
+import json
+from datetime import datetime, timezone
+from fastapi import APIRouter, HTTPException, Depends, Header, Request, Response, Query
+from fastapi.responses import StreamingResponse
+from typing import Dict, Any, List, Optional
 from app.models.payload import SeaTunnelRequest
-from app.models.job import JobConfig, JobResponse
+from app.models.job import (
+    JobConfig, JobResponse, BatchJobItemResult, BatchJobResponse, JobPlan, ShardedJobResponse,
+    CDCTuningReport, SubmissionStatus, ClusterCapacity, JobListResponse, JobStatusRequest, JobStatusResponse,
+)
 from app.services.job_service import JobService
-from app.client.http_client import SeaTunnelClient
-from app.utils.mapper import parse_job
+from app.services.job_planner import JobPlanner
+from app.services.cdc_tuning import CDCTuner, CDCTuningController
+from app.services.cluster_registry import ClusterRegistry, UnknownClusterError
+from app.services.idempotency import IdempotencyConflict, SubmissionDeduplicator
+from app.services.job_watcher import JobStatusBroker
+from app.services.submission_queue import SubmissionQueue, SubmissionQueueFull
+from app.config.setting import settings
+from app.client.http_client import AsyncSeaTunnelClient
+from app.utils.mapper import compile_job
 # Create router
 api_router = APIRouter(tags=["jobs"])
 
-# Dependency to get job service
-def get_job_service():
-    client = SeaTunnelClient()
-    return JobService(client)
+# Dependencies handing out the app-scoped client and service (see app.main lifespan)
+def get_seatunnel_client(request: Request) -> AsyncSeaTunnelClient:
+    return request.app.state.seatunnel_client
+
+def get_job_service(request: Request) -> JobService:
+    return request.app.state.job_service
+
+def get_job_broker(request: Request) -> JobStatusBroker:
+    return request.app.state.job_broker
+
+def get_job_planner(request: Request) -> JobPlanner:
+    return request.app.state.job_planner
+
+def get_cdc_tuner(request: Request) -> CDCTuner:
+    return request.app.state.cdc_tuner
+
+def get_cdc_controller(request: Request) -> CDCTuningController:
+    return request.app.state.cdc_controller
+
+def get_submission_queue(request: Request) -> SubmissionQueue:
+    return request.app.state.submission_queue
+
+def get_deduplicator(request: Request) -> SubmissionDeduplicator:
+    return request.app.state.deduplicator
+
+def get_clusters(request: Request) -> ClusterRegistry:
+    return request.app.state.clusters
 
 # @api_router.post("/jobs", response_model=JobResponse)
 # async def create_job(
@@ -27,6 +64,131 @@ def get_job_service():
 #     except Exception as e:
 #         raise HTTPException(status_code=500, detail=str(e))
 
+@api_router.get("/jobs/events")
+async def stream_job_events(
+    request: Request,
+    job_ids: List[str] = Query(..., min_length=1),
+    broker: JobStatusBroker = Depends(get_job_broker)
+):
+    """
+    Stream status changes of one or more jobs as Server-Sent Events.
+    Each event carries only the fields that changed; the stream ends once every job is final.
+    """
+    async def events():
+        pending = set(job_ids)
+        async with broker.subscribe(job_ids) as queue:
+            while pending:
+                try:
+                    event = await asyncio.wait_for(queue.get(), timeout=settings.JOB_STREAM_HEARTBEAT)
+                except asyncio.TimeoutError:
+                    if await request.is_disconnected():
+                        return
+                    yield ": keepalive\n\n"
+                    continue
+                kind = "error" if "error" in event else "status"
+                yield f"event: {kind}\ndata: {json.dumps(event, default=str)}\n\n"
+                if event.get("final"):
+                    pending.discard(event["jobId"])
+        yield "event: end\ndata: {}\n\n"
+
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+@api_router.post("/jobs/submissions", response_model=SubmissionStatus, status_code=202)
+async def enqueue_job(
+    request: SeaTunnelRequest,
+    response: Response,
+    idempotency_key: Optional[str] = Header(None, alias="Idempotency-Key"),
+    queue: SubmissionQueue = Depends(get_submission_queue),
+    dedup: SubmissionDeduplicator = Depends(get_deduplicator),
+    clusters: ClusterRegistry = Depends(get_clusters)
+):
+    """
+    Validate and map a job, then queue its submission to the master.
+    Returns a tracking status right away, or 429 when the queue is full.
+    A repeated submission returns the original job's status with 200.
+    """
+    try:
+        clusters.check(request.cluster)
+        config = compile_job(request)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+    async def submit():
+        status = queue.submit(config)
+        return {"job_id": status.job_id, "name": status.name, "tracking_id": status.tracking_id}
+
+    try:
+        record, replayed = await dedup.submit_once(config["config"], idempotency_key, submit)
+    except IdempotencyConflict as e:
+        raise HTTPException(status_code=422, detail=str(e))
+    except SubmissionQueueFull as e:
+        raise HTTPException(status_code=429, detail=str(e), headers={"Retry-After": str(e.retry_after)})
+    status = queue.get(record["tracking_id"]) if record.get("tracking_id") else None
+    if replayed:
+        response.status_code = 200
+        response.headers["Idempotent-Replayed"] = "true"
+        if status is None:
+            # Submitted synchronously, or long enough ago that the queue forgot it
+            return SubmissionStatus(
+                tracking_id=record.get("tracking_id") or record["job_id"],
+                state="SUBMITTED",
+                job_id=record["job_id"],
+                name=record["name"],
+                queued_at=datetime.fromtimestamp(record["created"], timezone.utc).isoformat(),
+            )
+    response.headers["Location"] = f"/api/v1/jobs/submissions/{status.tracking_id}"
+    return status
+
+@api_router.get("/jobs/submissions/{tracking_id}", response_model=SubmissionStatus)
+async def get_submission(
+    tracking_id: str,
+    queue: SubmissionQueue = Depends(get_submission_queue)
+):
+    """
+    Get the progress of a queued submission.
+    """
+    status = queue.get(tracking_id)
+    if status is None:
+        raise HTTPException(status_code=404, detail=f"Submission not found: {tracking_id}")
+    return status
+
+@api_router.get("/jobs", response_model=JobListResponse)
+async def list_jobs(
+    state: Optional[List[str]] = Query(None),
+    name: Optional[str] = None,
+    offset: int = Query(0, ge=0),
+    limit: int = Query(50, ge=1, le=1000),
+    job_service: JobService = Depends(get_job_service)
+):
+    """
+    List jobs, newest first, filtered by state(s) and a name substring.
+    Served from one cached scan of the clusters' running and finished jobs.
+    """
+    try:
+        total, jobs = await job_service.list_jobs(state, name, offset, limit)
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+    return JobListResponse(total=total, offset=offset, limit=limit, jobs=jobs)
+
+@api_router.post("/jobs/status", response_model=JobStatusResponse)
+async def get_jobs_status(
+    body: JobStatusRequest,
+    job_service: JobService = Depends(get_job_service)
+):
+    """
+    Get the status of many jobs in one call, from the same cached scan as GET /jobs.
+    """
+    try:
+        return await job_service.jobs_status(body.job_ids)
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
 @api_router.get("/jobs/{job_id}", response_model=Dict[str, Any])
 async def get_job(
     job_id: str,
@@ -36,7 +198,7 @@ async def get_job(
     Get information about a specific job by ID.
     """
     try:
-        return job_service.get_job(job_id)
+        return await job_service.get_job(job_id)
     except Exception as e:
         raise HTTPException(status_code=404, detail=f"Job not found: {str(e)}")
 
@@ -47,7 +209,7 @@ async def stop_job(
     job_service: JobService = Depends(get_job_service)
 ):
     try:
-        job_service.stop_job(job_id, save_point)
+        await job_service.stop_job(job_id, save_point)
         return {"message": f"Job {job_id} stopped successfully"}
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
@@ -57,15 +219,173 @@ async def stop_job(
 @api_router.post("/jobs")
 async def create_job(
     request: SeaTunnelRequest,
-    job_service: JobService = Depends(get_job_service)
+    response: Response,
+    tune: bool = False,
+    idempotency_key: Optional[str] = Header(None, alias="Idempotency-Key"),
+    job_service: JobService = Depends(get_job_service),
+    broker: JobStatusBroker = Depends(get_job_broker),
+    tuner: CDCTuner = Depends(get_cdc_tuner),
+    controller: CDCTuningController = Depends(get_cdc_controller),
+    dedup: SubmissionDeduplicator = Depends(get_deduplicator)
 ):
 
     try:
-        # result = job_service.create_job(name="api-job", config=request)
-        job = parse_job(request)
-        result = job.dict(by_alias=True, exclude_none=True)
-        job_service.create_job("demo",result)
+        report = await tuner.tune(request) if tune else None
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+    async def submit():
+        created = await job_service.create_job("demo", result)
+        broker.mark_submitted(created.job_id)
+        if report is not None and settings.CDC_CONTROLLER_ENABLED:
+            controller.watch(created.job_id, request, report)
+        return {"job_id": created.job_id, "name": result["jobName"], "cluster": created.cluster}
+
+    try:
+        result = compile_job(request, tuning=report.tuning if report else None)
+        record, replayed = await dedup.submit_once(result["config"], idempotency_key, submit)
+        if replayed:
+            # The original job, not a second pipeline on the same stream
+            response.headers["Idempotent-Replayed"] = "true"
+            return {**result, "jobId": record["job_id"], "jobName": record["name"], "cluster": record.get("cluster")}
         
-        return result
+        return {**result, "cluster": record["cluster"]}
+    except IdempotencyConflict as e:
+        raise HTTPException(status_code=422, detail=str(e))
+    except UnknownClusterError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
\ No newline at end of file
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@api_router.post("/jobs/tune", response_model=CDCTuningReport)
+async def tune_job(
+    request: SeaTunnelRequest,
+    jobs: int = Query(1, ge=1),
+    tuner: CDCTuner = Depends(get_cdc_tuner)
+):
+    """
+    Preview the read limits and checkpoint interval a CDC source would be submitted with,
+    for one of ``jobs`` jobs sharing the submission's load budget.
+    """
+    try:
+        return await tuner.tune(request, jobs)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@api_router.post("/jobs/batch", response_model=BatchJobResponse)
+async def create_jobs_batch(
+    requests: List[SeaTunnelRequest],
+    job_service: JobService = Depends(get_job_service),
+    broker: JobStatusBroker = Depends(get_job_broker)
+):
+    """
+    Create many SeaTunnel jobs at once. Each item succeeds or fails on its own.
+    """
+    # Mapping is CPU-bound; keep it off the event loop
+    compiled = await asyncio.gather(
+        *(asyncio.to_thread(compile_job, request) for request in requests),
+        return_exceptions=True,
+    )
+
+    results: List[BatchJobItemResult] = [None] * len(requests)
+    valid_indexes = []
+    for index, item in enumerate(compiled):
+        if isinstance(item, Exception):
+            results[index] = BatchJobItemResult(index=index, status="FAILED", error=str(item))
+        else:
+            valid_indexes.append(index)
+
+    try:
+        submitted = await job_service.create_jobs([compiled[i] for i in valid_indexes])
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+    for index, item in zip(valid_indexes, submitted):
+        results[index] = item.copy(update={"index": index})
+        if item.status == "SUBMITTED":
+            broker.mark_submitted(item.job_id)
+
+    failed = sum(1 for item in results if item.status == "FAILED")
+    return BatchJobResponse(submitted=len(results) - failed, failed=failed, results=results)
+
+
+@api_router.post("/jobs/plan", response_model=JobPlan)
+async def plan_jobs(
+    request: SeaTunnelRequest,
+    max_jobs: Optional[int] = Query(None, ge=1),
+    max_parallelism: Optional[int] = Query(None, ge=1),
+    planner: JobPlanner = Depends(get_job_planner)
+):
+    """
+    Preview how a multi-table CDC source would be split into size-balanced jobs.
+    """
+    try:
+        return await planner.plan(request, max_jobs, max_parallelism)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@api_router.post("/jobs/sharded", response_model=ShardedJobResponse)
+async def create_sharded_jobs(
+    request: SeaTunnelRequest,
+    max_jobs: Optional[int] = Query(None, ge=1),
+    max_parallelism: Optional[int] = Query(None, ge=1),
+    tune: bool = False,
+    planner: JobPlanner = Depends(get_job_planner),
+    job_service: JobService = Depends(get_job_service),
+    broker: JobStatusBroker = Depends(get_job_broker),
+    tuner: CDCTuner = Depends(get_cdc_tuner),
+    controller: CDCTuningController = Depends(get_cdc_controller)
+):
+    """
+    Plan a multi-table CDC source as in /jobs/plan and submit one job per shard.
+    With ``tune``, the shards split the submission's load budget between them.
+    """
+    try:
+        plan = await planner.plan(request, max_jobs, max_parallelism)
+        shard_requests = planner.shard_requests(request, plan)
+        reports = (
+            await asyncio.gather(*(tuner.tune(shard_request, len(plan.shards)) for shard_request in shard_requests))
+            if tune else [None] * len(shard_requests)
+        )
+        configs = []
+        for shard, shard_request, report in zip(plan.shards, shard_requests, reports):
+            config = compile_job(
+                shard_request,
+                parallelism=shard.parallelism,
+                tuning=report.tuning if report else None,
+            )
+            config["jobName"] = f"{config['jobName']}-shard-{shard.index}"
+            configs.append(config)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+    try:
+        results = await job_service.create_jobs(configs)
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+    for item, shard, shard_request, report in zip(results, plan.shards, shard_requests, reports):
+        if item.status == "SUBMITTED":
+            broker.mark_submitted(item.job_id)
+            if report is not None and settings.CDC_CONTROLLER_ENABLED:
+                controller.watch(item.job_id, shard_request, report, parallelism=shard.parallelism)
+
+    failed = sum(1 for item in results if item.status == "FAILED")
+    return ShardedJobResponse(plan=plan, submitted=len(results) - failed, failed=failed, results=results)
+
+
+@api_router.get("/clusters", response_model=List[ClusterCapacity])
+async def list_clusters(clusters: ClusterRegistry = Depends(get_clusters)):
+    """
+    Capacity of every configured SeaTunnel cluster, as seen by job placement.
+    """
+    return await clusters.capacities()
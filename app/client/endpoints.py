@@ -0,0 +1,133 @@
+import random
+import time
+from typing import Any, Collection, Dict, List, Optional
+
+from app.config.setting import settings
+from app.utils.metrics import UPSTREAM_ENDPOINT_STATE
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+_STATE_VALUES = {CLOSED: 0, HALF_OPEN: 1, OPEN: 2}
+
+
+class Endpoint:
+    """One SeaTunnel REST address with its circuit breaker and health.
+
+    After ``failure_threshold`` consecutive failures the breaker opens and
+    the endpoint gets no traffic for ``open_seconds``. It then lets a single
+    trial request through (half-open): success closes it, failure opens it
+    again. A passing health probe also lets an open endpoint try again early.
+    """
+
+    def __init__(self, url: str, failure_threshold: Optional[int] = None, open_seconds: Optional[float] = None):
+        self.url = url
+        self.failure_threshold = failure_threshold or settings.ENDPOINT_FAILURE_THRESHOLD
+        self.open_seconds = open_seconds or settings.ENDPOINT_OPEN_SECONDS
+        self.state = CLOSED
+        self.healthy = True
+        self.failures = 0
+        self.opened_at = 0.0
+        self.in_flight = 0
+        self._trial_in_flight = False
+        # Smoothed response time, used to prefer the fastest node
+        self.latency = 0.0
+        self._publish()
+
+    def _publish(self) -> None:
+        UPSTREAM_ENDPOINT_STATE.labels(self.url).set(_STATE_VALUES[self.state])
+
+    def available(self) -> bool:
+        if self.state == OPEN and time.monotonic() - self.opened_at >= self.open_seconds:
+            self.state = HALF_OPEN
+            self._publish()
+        if self.state == HALF_OPEN:
+            return not self._trial_in_flight
+        return self.state == CLOSED
+
+    def acquire(self) -> None:
+        self.in_flight += 1
+        if self.state == HALF_OPEN:
+            self._trial_in_flight = True
+
+    def release(self) -> None:
+        self.in_flight -= 1
+        if self.in_flight == 0:
+            # A trial that ended without a verdict (e.g. a cancelled hedge) frees the slot
+            self._trial_in_flight = False
+
+    def observe_latency(self, latency: float) -> None:
+        self.latency = latency if self.latency == 0.0 else 0.8 * self.latency + 0.2 * latency
+
+    def record_success(self, latency: float) -> None:
+        self.observe_latency(latency)
+        self.failures = 0
+        self.healthy = True
+        if self.state != CLOSED:
+            self.state = CLOSED
+            self._trial_in_flight = False
+            self._publish()
+
+    def record_failure(self) -> None:
+        self.failures += 1
+        self._trial_in_flight = False
+        if self.state == HALF_OPEN or self.failures >= self.failure_threshold:
+            self.state = OPEN
+            self.opened_at = time.monotonic()
+            self._publish()
+
+    def record_probe(self, ok: bool) -> None:
+        self.healthy = ok
+        if ok and self.state == OPEN:
+            self.state = HALF_OPEN
+            self._publish()
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "url": self.url,
+            "state": self.state,
+            "healthy": self.healthy,
+            "consecutive_failures": self.failures,
+            "in_flight": self.in_flight,
+            "latency_ms": round(self.latency * 1000, 2),
+        }
+
+
+class EndpointPool:
+    """Chooses which SeaTunnel endpoint serves the next call"""
+
+    def __init__(self, urls: List[str]):
+        if not urls:
+            raise ValueError("At least one SeaTunnel endpoint is required")
+        self.endpoints = [Endpoint(url) for url in urls]
+
+    def __len__(self) -> int:
+        return len(self.endpoints)
+
+    def select(self, exclude: Collection[Endpoint] = ()) -> Optional[Endpoint]:
+        """The least loaded, fastest endpoint whose breaker admits a call, or None.
+
+        Endpoints failing their health probe are used only when no healthy
+        one is left; ``exclude`` (those already tried) likewise.
+        """
+        candidates = [endpoint for endpoint in self.endpoints if endpoint.available()]
+        for preferred in (
+            [e for e in candidates if e.healthy and e not in exclude],
+            [e for e in candidates if e not in exclude],
+            candidates,
+        ):
+            if preferred:
+                # Shuffle first so ties do not always land on the same node
+                random.shuffle(preferred)
+                return min(preferred, key=lambda e: (e.in_flight, e.latency))
+        return None
+
+    def stats(self) -> List[Dict[str, Any]]:
+        return [endpoint.stats() for endpoint in self.endpoints]
+
+
+def backoff_delay(attempt: int) -> float:
+    """Full-jitter exponential backoff before retry number ``attempt`` (1-based)"""
+    ceiling = min(settings.RETRY_BACKOFF_MAX, settings.RETRY_BACKOFF_BASE * 2 ** (attempt - 1))
+    return random.uniform(0, ceiling)
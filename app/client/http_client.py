@@ -1,72 +1,307 @@
-
-import requests
-from typing import Optional, Dict, Any
+import asyncio
+import time
+import httpx
+from typing import Optional, Dict, Any, List, Set
 from app.config.setting import settings  # import your SETTINGS instance
-import json
+from app.client.endpoints import Endpoint, EndpointPool, backoff_delay
+from app.utils.metrics import UPSTREAM_ERRORS, UPSTREAM_LATENCY, UPSTREAM_RETRIES, upstream_endpoint
+from app.utils.profiling import phase
+
+
+class SeaTunnelAPIError(Exception):
+    """Raised when a call to the SeaTunnel REST API fails"""
+
+    def __init__(self, message: str, status_code: Optional[int] = None, body: Optional[str] = None):
+        super().__init__(message)
+        self.status_code = status_code
+        self.body = body
+
+
+def _normalize_base_url(raw_url: str) -> str:
+    return raw_url.rstrip('/').split('/submit-job')[0]
+
+
+def _format_error(method: str, url: str, error: Exception, status: Optional[int], body: Optional[str]) -> str:
+    return (
+        f"HTTP {method} {url} failed"
+        f"{f' with status {status}' if status else ''}: {error}"
+        f"{f' — response body: {body}' if body else ''}"
+    )
+
+
+def build_submit_payload(job: Dict[str, Any]) -> Dict[str, Any]:
+    """Build the upstream /submit-job body from a serialized Job"""
+    job_config = job.get("config") or {}
+    return {
+        "params": {
+            "jobId": job.get("jobId"),
+            "jobName": job.get("jobName"),
+        },
+        "env": job_config.get("env"),
+        "source": job_config.get("source"),
+        "transform": job_config.get("transform", []),
+        "sink": job_config.get("sink"),
+    }
+
+
+def _is_transient(status: Optional[int]) -> bool:
+    # No response at all, an overloaded node, or a server-side failure
+    return status is None or status == 429 or status >= 500
+
+
+def build_stop_payload(job_id: str, save_point: bool = False) -> Dict[str, Any]:
+    return {
+        "jobId": job_id,
+        "isStopWithSavePoint": save_point,
+    }
+
+
+class AsyncSeaTunnelClient:
+    """Non-blocking SeaTunnel client backed by a keep-alive connection pool.
+
+    With several endpoints (``API_URLS``), each call goes to the least loaded
+    healthy node whose circuit breaker is closed. Reads are retried on another
+    node with jittered backoff; writes only fail over when the connection was
+    never made, so a submit cannot run twice.
+    """
 
-class SeaTunnelClient:
     def __init__(
         self,
         base_url: Optional[str] = None,
         api_key: Optional[str] = None,
         timeout: Optional[float] = None,
+        limits: Optional[httpx.Limits] = None,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+        base_urls: Optional[List[str]] = None,
+        hedge_delay: Optional[float] = None,
     ):
-        # Use provided base_url or fallback to settings.API_URL
-        raw_url = base_url or settings.API_URL
-        self.base_url = raw_url.rstrip('/').split('/submit-job')[0]
-        
+        raw_urls = base_urls or ([base_url] if base_url else settings.API_URLS) or [settings.API_URL]
+        self.pool = EndpointPool([_normalize_base_url(url) for url in raw_urls])
+        self.base_url = self.pool.endpoints[0].url
+        self.hedge_delay = hedge_delay if hedge_delay is not None else settings.HEDGE_DELAY
+
         self.api_key = api_key or settings.API_KEY
-        
-        self.timeout = timeout or settings.TIMEOUT
-        
-        self.session = requests.Session()
-        self.session.headers.update({"Content-Type": "application/json"})
+
+        self.timeout = httpx.Timeout(
+            timeout or settings.TIMEOUT,
+            connect=settings.CONNECT_TIMEOUT,
+            read=timeout or settings.READ_TIMEOUT,
+        )
+        self.limits = limits or httpx.Limits(
+            max_connections=settings.MAX_CONNECTIONS,
+            max_keepalive_connections=settings.MAX_KEEPALIVE_CONNECTIONS,
+            keepalive_expiry=settings.KEEPALIVE_EXPIRY,
+        )
+
+        headers = {"Content-Type": "application/json"}
         if self.api_key:
-            self.session.headers.update({"Authorization": f"Bearer {self.api_key}"})
-    
-    def _request(
+            headers["Authorization"] = f"Bearer {self.api_key}"
+
+        self.session = httpx.AsyncClient(
+            headers=headers,
+            timeout=self.timeout,
+            limits=self.limits,
+            transport=transport,
+        )
+        self._in_flight = 0
+        self._requests_total = 0
+        self._errors_total = 0
+        self._health_task: Optional[asyncio.Task] = None
+
+    async def __aenter__(self) -> "AsyncSeaTunnelClient":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close()
+
+    def start(self) -> None:
+        """Probe every endpoint periodically; only useful with more than one"""
+        if len(self.pool) > 1 and self._health_task is None:
+            self._health_task = asyncio.create_task(self._health_loop())
+
+    async def _probe(self, endpoint: Endpoint) -> None:
+        try:
+            resp = await self.session.get(f"{endpoint.url}/overview", timeout=settings.CONNECT_TIMEOUT)
+            endpoint.record_probe(resp.status_code < 500)
+        except httpx.HTTPError:
+            endpoint.record_probe(False)
+
+    async def _health_loop(self) -> None:
+        while True:
+            await asyncio.gather(*(self._probe(endpoint) for endpoint in self.pool.endpoints))
+            await asyncio.sleep(settings.ENDPOINT_HEALTH_INTERVAL)
+
+    async def close(self) -> None:
+        if self._health_task is not None:
+            self._health_task.cancel()
+            try:
+                await self._health_task
+            except asyncio.CancelledError:
+                pass
+            self._health_task = None
+        await self.session.aclose()
+
+    def pool_stats(self) -> Dict[str, Any]:
+        """Snapshot of the connection pool, request counters and endpoints"""
+        stats: Dict[str, Any] = {
+            "max_connections": self.limits.max_connections,
+            "max_keepalive_connections": self.limits.max_keepalive_connections,
+            "keepalive_expiry": self.limits.keepalive_expiry,
+            "in_flight": self._in_flight,
+            "requests_total": self._requests_total,
+            "errors_total": self._errors_total,
+            "closed": self.session.is_closed,
+            "endpoints": self.pool.stats(),
+        }
+        # httpcore keeps the live connections on the transport's pool
+        pool = getattr(getattr(self.session, "_transport", None), "_pool", None)
+        connections = getattr(pool, "connections", None)
+        if connections is not None:
+            stats["connections"] = len(connections)
+            stats["idle_connections"] = sum(1 for conn in connections if conn.is_idle())
+        return stats
+
+    async def _send(
         self,
         method: str,
         endpoint: str,
-        json_data: Optional[Dict[str, Any]] = None
-    ) -> Dict[str, Any]:
-        # Build URL: e.g. http://host:port + /submit-job
-        url = f"{self.base_url}/{endpoint.lstrip('/')}"
+        json_data: Optional[Any],
+        params: Optional[Dict[str, Any]],
+        tried: Set[Endpoint],
+    ) -> Any:
+        """One attempt against the best endpoint not yet in ``tried``"""
+        target = self.pool.select(exclude=tried)
+        if target is None:
+            # Every breaker is open: fail now instead of waiting on a dead node
+            raise SeaTunnelAPIError(f"{method} {endpoint} failed: no SeaTunnel endpoint available")
+        tried.add(target)
+        url = f"{target.url}/{endpoint.lstrip('/')}"
+        target.acquire()
+        self._in_flight += 1
+        self._requests_total += 1
+        # "error" when no response came back at all (connect error, timeout)
+        status_label = "error"
+        started = time.perf_counter()
         try:
-            job_config = json_data.get("config")
-            create_job = {
-                    "params": {
-                        "jobId": job_config.get("jobId"),
-                        "jobName": job_config.get("jobName"),
-                    },
-                    "env": job_config['config'].get("env"),
-                    "source": job_config['config'].get("source"),
-                    "transform": job_config['config'].get("transform", []),
-                    "sink": job_config['config'].get("sink"),
-                }
-
-            resp = self.session.request(
-                method=method,
-                url=url,
-                json=create_job,
-                timeout=self.timeout,
-            )
+            with phase(f"upstream:{upstream_endpoint(endpoint)}"):
+                resp = await self.session.request(
+                    method=method,
+                    url=url,
+                    json=json_data,
+                    params=params,
+                )
+            status_label = str(resp.status_code)
             resp.raise_for_status()
+            target.record_success(time.perf_counter() - started)
             return resp.json()
-        except requests.RequestException as e:
-            # include status and body (if any) in the exception
-            status = getattr(e.response, "status_code", None)
-            body = getattr(e.response, "text", None)
-            raise Exception(
-                f"HTTP {method} {url} failed"
-                f"{f' with status {status}' if status else ''}: {e}"
-                f"{f' — response body: {body}' if body else ''}"
-            ) from e
-    
-    def get_job(self, job_id: str) -> Dict[str, Any]:
-        # GET /jobs/{job_id}
-        return self._request("GET", f"jobs/{job_id}")
-    
-    def create_job(self, job_config: Dict[str, Any]) -> Dict[str, Any]:
-        # POST /submit-job
-        return self._request("POST", "submit-job", json_data=job_config)
+        except httpx.HTTPError as e:
+            response = getattr(e, "response", None)
+            status = response.status_code if response is not None else None
+            body = response.text if response is not None else None
+            self._errors_total += 1
+            UPSTREAM_ERRORS.labels(upstream_endpoint(endpoint), status_label).inc()
+            if _is_transient(status):
+                target.record_failure()
+            else:
+                # The node answered; a 4xx says nothing about its health
+                target.record_success(time.perf_counter() - started)
+            raise SeaTunnelAPIError(_format_error(method, url, e, status, body), status, body) from e
+        except asyncio.CancelledError:
+            # A hedge lost the race: not a failure, but the node was at least this slow
+            status_label = "cancelled"
+            target.observe_latency(time.perf_counter() - started)
+            raise
+        finally:
+            target.release()
+            self._in_flight -= 1
+            UPSTREAM_LATENCY.labels(upstream_endpoint(endpoint), method, status_label).observe(
+                time.perf_counter() - started
+            )
+
+    async def _send_hedged(self, method: str, endpoint: str, tried: Set[Endpoint]) -> Any:
+        """Send a read, and a second copy elsewhere if the first is slower than ``hedge_delay``"""
+        primary = asyncio.ensure_future(self._send(method, endpoint, None, None, tried))
+        done, _ = await asyncio.wait({primary}, timeout=self.hedge_delay)
+        if done or len(tried) >= len(self.pool):
+            return await primary
+        UPSTREAM_RETRIES.labels(upstream_endpoint(endpoint), "hedge").inc()
+        pending = {primary, asyncio.ensure_future(self._send(method, endpoint, None, None, tried))}
+        error: Optional[BaseException] = None
+        try:
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task.exception() is None:
+                        return task.result()
+                    error = task.exception()
+            raise error
+        finally:
+            for task in pending:
+                task.cancel()
+
+    async def _request(
+        self,
+        method: str,
+        endpoint: str,
+        json_data: Optional[Any] = None,
+        params: Optional[Dict[str, Any]] = None,
+        hedge: bool = False,
+    ) -> Any:
+        idempotent = method == "GET"
+        # Reads retry; writes only move on to another node when nothing was sent
+        attempts = 1 + (settings.READ_RETRIES if idempotent else len(self.pool) - 1)
+        tried: Set[Endpoint] = set()
+        for attempt in range(1, attempts + 1):
+            try:
+                if hedge and self.hedge_delay is not None and len(self.pool) > 1:
+                    return await self._send_hedged(method, endpoint, tried)
+                return await self._send(method, endpoint, json_data, params, tried)
+            except SeaTunnelAPIError as e:
+                not_sent = isinstance(e.__cause__, (httpx.ConnectError, httpx.ConnectTimeout))
+                retry = _is_transient(e.status_code) if idempotent else not_sent
+                if attempt == attempts or not retry or e.__cause__ is None:
+                    raise
+                if len(tried) >= len(self.pool):
+                    # Every node has had a go; start over
+                    tried.clear()
+                UPSTREAM_RETRIES.labels(upstream_endpoint(endpoint), "retry" if idempotent else "failover").inc()
+                if idempotent:
+                    await asyncio.sleep(backoff_delay(attempt))
+
+    async def get_job(self, job_id: str) -> Dict[str, Any]:
+        # GET /job-info/{job_id}
+        return await self._request("GET", f"job-info/{job_id}", hedge=True)
+
+    async def create_job(self, job_config: Dict[str, Any], start_with_savepoint: bool = False) -> Dict[str, Any]:
+        # POST /submit-job; with a savepoint the job resumes under its previous jobId
+        payload = build_submit_payload(job_config)
+        params = dict(payload["params"])
+        if start_with_savepoint:
+            params["isStartWithSavePoint"] = "true"
+        return await self._request("POST", "submit-job", json_data=payload, params=params)
+
+    async def stop_job(self, job_id: str, save_point: bool = False) -> Dict[str, Any]:
+        # POST /stop-job
+        return await self._request("POST", "stop-job", json_data=build_stop_payload(job_id, save_point))
+
+    async def create_jobs(self, job_configs: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        # POST /submit-jobs
+        return await self._request(
+            "POST", "submit-jobs", json_data=[build_submit_payload(job) for job in job_configs]
+        )
+
+    async def get_overview(self) -> Dict[str, Any]:
+        # GET /overview: slots and job counts of the cluster
+        return await self._request("GET", "overview")
+
+    async def get_running_jobs(self) -> List[Dict[str, Any]]:
+        # GET /running-jobs
+        return await self._request("GET", "running-jobs")
+
+    async def get_finished_jobs(self) -> List[Dict[str, Any]]:
+        # GET /finished-jobs: finished, canceled and failed jobs still held by the cluster
+        return await self._request("GET", "finished-jobs")
+
+    async def get_system_monitoring(self) -> List[Dict[str, Any]]:
+        # GET /system-monitoring-information: one entry per node
+        return await self._request("GET", "system-monitoring-information")
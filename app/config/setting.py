@@ -1,4 +1,5 @@
 # app/config/setting.py
+from typing import Any, Dict, List, Optional
 from pydantic_settings import BaseSettings
 
 # http://172.16.0.2:8080/
@@ -6,6 +7,135 @@ class Settings(BaseSettings):
     API_URL: str = "http://127.0.0.1:8080/"
     API_KEY: str = ""
     TIMEOUT: int = 30
+    # Several masters/nodes of one cluster; when set, used instead of API_URL
+    API_URLS: List[str] = []
+
+    # Named clusters, each a list of REST addresses, e.g. {"east": ["http://e1:8080"], "west": [...]};
+    # empty means one "default" cluster at API_URL/API_URLS
+    CLUSTERS: Dict[str, List[str]] = {}
+    # Seconds a cluster's capacity reading is reused for placement; job-to-cluster assignments kept;
+    # seconds a job ID no cluster knows is answered from memory instead of asking every cluster again
+    CLUSTER_CAPACITY_TTL: float = 5.0
+    CLUSTER_JOB_MAP_SIZE: int = 100000
+    CLUSTER_LOCATE_MISS_TTL: float = 10.0
+
+    # Endpoint failover: breaker opens after this many consecutive failures, for this long (s)
+    ENDPOINT_FAILURE_THRESHOLD: int = 5
+    ENDPOINT_OPEN_SECONDS: float = 30.0
+    # Seconds between /overview health probes of each endpoint (multi-endpoint only)
+    ENDPOINT_HEALTH_INTERVAL: float = 10.0
+    # Retries of idempotent reads, with full-jitter exponential backoff (s)
+    READ_RETRIES: int = 2
+    RETRY_BACKOFF_BASE: float = 0.1
+    RETRY_BACKOFF_MAX: float = 2.0
+    # Send a second get_job to another endpoint when the first has not answered in this many seconds
+    HEDGE_DELAY: Optional[float] = None
+
+    # Upstream HTTP connection pool
+    CONNECT_TIMEOUT: float = 5.0
+    READ_TIMEOUT: float = 30.0
+    MAX_CONNECTIONS: int = 100
+    MAX_KEEPALIVE_CONNECTIONS: int = 20
+    KEEPALIVE_EXPIRY: float = 30.0
+
+    # Batch submission
+    BATCH_SUBMIT_CHUNK_SIZE: int = 50
+    BATCH_SUBMIT_CONCURRENCY: int = 8
+
+    # Job status streaming: shared per-job upstream poller cadence (seconds)
+    JOB_POLL_FAST_INTERVAL: float = 1.0
+    JOB_POLL_SLOW_INTERVAL: float = 30.0
+    JOB_POLL_FAST_PERIOD: float = 60.0
+    JOB_POLL_BACKOFF: float = 1.5
+    JOB_STREAM_HEARTBEAT: float = 15.0
+
+    # Job info cache: TTL (seconds) by job state
+    JOB_CACHE_TTL_TERMINAL: float = 300.0
+    JOB_CACHE_TTL_RUNNING: float = 2.0
+    JOB_CACHE_TTL_DEFAULT: float = 1.0
+    JOB_CACHE_MAX_ENTRIES: int = 10000
+
+    # Job listing: seconds one running/finished-jobs scan serves /jobs and /jobs/status,
+    # and how many IDs missing from it /jobs/status still looks up one by one
+    JOB_INDEX_TTL: float = 5.0
+    JOB_STATUS_FALLBACK_MAX: int = 20
+
+    # Schema metadata cache
+    SCHEMA_CACHE_TTL: float = 300.0
+    SCHEMA_CACHE_MAX_ENTRIES: int = 10000
+    # get_schema_for_multiple_tables switches to one bulk catalog query at this many tables
+    SCHEMA_BULK_THRESHOLD: int = 8
+
+    # Shared database connector pools
+    DB_MAX_CONNECTIONS_PER_HOST: int = 50
+    DB_POOL_IDLE_TIMEOUT: float = 600.0
+    DB_HEALTH_CHECK_INTERVAL: float = 30.0
+    # Pools opened at startup, e.g. [{"db_type": "postgresql", "host": ..., "port": 5432, ...}]
+    SOURCE_DATABASES: List[Dict[str, Any]] = []
+
+    # Oracle catalog scans: rows per fetch round trip and rows prefetched on execute
+    ORACLE_ARRAYSIZE: int = 1000
+    ORACLE_PREFETCHROWS: int = 1000
+
+    # Metrics: seconds between DB pool gauge refreshes
+    METRICS_POOL_INTERVAL: float = 15.0
+
+    # Per-request profiling (X-Profile header or ?profile= flag); off unless enabled
+    PROFILING_ENABLED: bool = False
+    PROFILING_TOKEN: Optional[str] = None
+    PROFILING_DIR: str = "/tmp/seatunnel-profiles"
+    PROFILING_MAX_FILES: int = 100
+    # Slowest requests kept with their phase breakdown; 0 disables
+    SLOW_REQUEST_LOG_SIZE: int = 50
+
+    # Sharding planner: job count cap, per-job parallelism cap, snapshot bytes per parallel task
+    PLANNER_MAX_JOBS: int = 8
+    PLANNER_MAX_PARALLELISM: int = 8
+    PLANNER_BYTES_PER_TASK: int = 4 * 1024 ** 3
+
+    # Event-loop watchdog: heartbeat period, lag that counts as blocking, samples kept for percentiles
+    LOOP_MONITOR_ENABLED: bool = True
+    LOOP_MONITOR_INTERVAL: float = 0.1
+    LOOP_BLOCK_THRESHOLD: float = 0.1
+    LOOP_LAG_WINDOW: int = 600
+
+    # CDC read tuning: bytes/s the jobs of one submission may read from a source,
+    # by "host" or "host/database"; separate submissions are not counted against each other
+    CDC_DEFAULT_SUBMISSION_BUDGET_BYTES: int = 7_000_000
+    CDC_SUBMISSION_BUDGETS: Dict[str, int] = {}
+    CDC_DEFAULT_ROW_WIDTH: int = 256
+    CDC_MIN_ROWS_PER_SECOND: int = 400
+    # Read limit over the expected change rate, so a lagging job can catch up
+    CDC_CHANGE_RATE_HEADROOM: float = 2.0
+    # Checkpoint about this much data, within the min/max interval (ms)
+    CDC_CHECKPOINT_TARGET_BYTES: int = 64 * 1024 ** 2
+    CDC_CHECKPOINT_MIN_MS: int = 5000
+    CDC_CHECKPOINT_MAX_MS: int = 120000
+
+    # CDC tuning controller: re-tunes running jobs from their observed read rate
+    CDC_CONTROLLER_ENABLED: bool = False
+    CDC_CONTROLLER_INTERVAL: float = 60.0
+    # Consecutive polls at >= saturation or <= underuse ratio of the limit before acting
+    CDC_CONTROLLER_PATIENCE: int = 3
+    CDC_SATURATION_RATIO: float = 0.9
+    CDC_UNDERUSE_RATIO: float = 0.1
+    CDC_RETUNE_COOLDOWN: float = 600.0
+    CDC_SAVEPOINT_TIMEOUT: float = 300.0
+
+    # Asynchronous submission: queue capacity, upstream submit workers,
+    # token bucket toward the master (submits/s, 0 disables; burst size), statuses kept
+    SUBMIT_QUEUE_SIZE: int = 1000
+    SUBMIT_WORKERS: int = 8
+    SUBMIT_RATE_LIMIT: float = 20.0
+    SUBMIT_BURST: int = 40
+    SUBMIT_STATUS_RETENTION: int = 10000
+
+    # Idempotent submission: records kept, for how long (s), optional SQLite file surviving restarts
+    IDEMPOTENCY_MAX_ENTRIES: int = 10000
+    IDEMPOTENCY_TTL: float = 86400.0
+    IDEMPOTENCY_DB_PATH: Optional[str] = None
+    # Also treat an identical job config sent without Idempotency-Key as a retry while its job is active
+    IDEMPOTENCY_DEDUP_CONFIGS: bool = True
 
     class Config:
         env_prefix = "SEATUNNEL_"
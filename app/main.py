@@ -1,9 +1,73 @@
 # app/main.py
 
-from fastapi import FastAPI
+import asyncio
+import os
+from contextlib import asynccontextmanager
+from fastapi import FastAPI, HTTPException, Response
+from fastapi.responses import FileResponse
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.openapi.utils import get_openapi
 from app.api.v1.router import api_router
+from app.config.setting import settings
+from app.services.cdc_tuning import CDCTuner, CDCTuningController
+from app.services.cluster_registry import ClusterRegistry
+from app.services.idempotency import IdempotencyStore, SubmissionDeduplicator
+from app.services.job_planner import JobPlanner
+from app.services.job_service import JobService
+from app.services.job_watcher import JobStatusBroker
+from app.services.submission_queue import SubmissionQueue
+from app.utils.connector_registry import ConnectorRegistry
+from app.utils.db_connector import SchemaManager
+from app.utils.loop_monitor import LoopMonitor
+from app.utils.metrics import MetricsMiddleware, mark_process_dead, pool_gauge_loop, render
+from app.utils.profiling import ProfilingMiddleware, find_profile, slow_requests
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    loop_monitor = LoopMonitor()
+    if settings.LOOP_MONITOR_ENABLED:
+        loop_monitor.start()
+    app.state.loop_monitor = loop_monitor
+    # One client (and connection pool) and one JobService for the whole app.
+    # A transport preset on app.state (e.g. the load test's fake master) replaces the network.
+    clusters = ClusterRegistry.from_settings(transport=getattr(app.state, "seatunnel_transport", None))
+    clusters.start()
+    client = clusters.client()
+    registry = ConnectorRegistry()
+    await registry.warm(settings.SOURCE_DATABASES)
+    registry.start()
+    schema_manager = SchemaManager(registry=registry)
+    app.state.seatunnel_client = client
+    app.state.connector_registry = registry
+    app.state.clusters = clusters
+    app.state.job_service = JobService(client, schema_manager, clusters)
+    app.state.job_broker = JobStatusBroker(app.state.job_service)
+    app.state.job_planner = JobPlanner(registry)
+    app.state.submission_queue = SubmissionQueue(app.state.job_service, app.state.job_broker)
+    app.state.submission_queue.start()
+    idempotency_store = IdempotencyStore()
+    await idempotency_store.open()
+    app.state.deduplicator = SubmissionDeduplicator(idempotency_store, app.state.job_service, app.state.submission_queue)
+    app.state.cdc_tuner = CDCTuner(app.state.job_planner)
+    app.state.cdc_controller = CDCTuningController(app.state.job_service)
+    if settings.CDC_CONTROLLER_ENABLED:
+        app.state.cdc_controller.start()
+    pool_metrics = asyncio.create_task(pool_gauge_loop(schema_manager, registry))
+    try:
+        yield
+    finally:
+        pool_metrics.cancel()
+        await app.state.submission_queue.close()
+        await idempotency_store.close()
+        await app.state.cdc_controller.close()
+        await app.state.job_broker.close()
+        await schema_manager.close_all_connectors()
+        await registry.close()
+        await clusters.close()
+        await loop_monitor.stop()
+        mark_process_dead()
+
 
 app = FastAPI(
     title="SeaTunnel Job API",
@@ -12,6 +76,7 @@ app = FastAPI(
     docs_url="/swagger",
     openapi_url="/openapi.json",
     redoc_url=None,
+    lifespan=lifespan,
 )
 
 # Configure CORS
@@ -22,6 +87,9 @@ app.add_middleware(
     allow_methods=["*"],
     allow_headers=["*"],
 )
+app.add_middleware(ProfilingMiddleware)
+# Outermost, so latency covers the whole stack
+app.add_middleware(MetricsMiddleware)
 app.include_router(api_router, prefix="/api/v1")
 def custom_openapi():
     if app.openapi_schema:
@@ -53,7 +121,36 @@ async def root():
 
 @app.get("/health")
 async def health_check():
-    return {"status": "healthy"}
+    return {
+        "status": "healthy",
+        "seatunnel_pool": app.state.seatunnel_client.pool_stats(),
+        "clusters": app.state.clusters.stats(),
+        "db_pools": app.state.connector_registry.stats(),
+        "job_cache": app.state.job_service.job_cache.stats(),
+        "schema_cache": app.state.job_service.schema_manager.cache_stats(),
+        "event_loop": app.state.loop_monitor.stats(),
+        "submission_queue": app.state.submission_queue.stats(),
+    }
+
+@app.get("/metrics", include_in_schema=False)
+async def metrics():
+    body, content_type = render()
+    return Response(content=body, media_type=content_type)
+
+@app.get("/debug/slow-requests", include_in_schema=False)
+async def list_slow_requests():
+    return {"requests": slow_requests.snapshot()}
+
+@app.get("/debug/loop-stalls", include_in_schema=False)
+async def list_loop_stalls():
+    return {"stalls": list(app.state.loop_monitor.stalls)}
+
+@app.get("/debug/profiles/{profile_id}", include_in_schema=False)
+async def download_profile(profile_id: str):
+    path = await asyncio.to_thread(find_profile, profile_id) if settings.PROFILING_ENABLED else None
+    if path is None:
+        raise HTTPException(status_code=404, detail="Profile not found")
+    return FileResponse(path, filename=os.path.basename(path))
 
 if __name__ == "__main__":
     import uvicorn
@@ -1,5 +1,5 @@
-from pydantic import BaseModel, Field, validator
-from typing import Dict, List, Any, Optional, Union
+from pydantic import BaseModel, Field, TypeAdapter, validator
+from typing import Dict, List, Any, Optional, Union, Literal, Annotated
 from enum import Enum
 import uuid
 
@@ -8,6 +8,27 @@ class SourceType(str, Enum):
     SFTP = "SFTP"
     KAFKA = "Kafka"
 
+# SeaTunnel job states after which a job never changes again
+TERMINAL_STATES = {"FINISHED", "CANCELED", "FAILED", "SAVEPOINT_DONE", "UNKNOWABLE"}
+
+def job_state(info: Optional[Dict[str, Any]]) -> Optional[str]:
+    """Read the state out of a SeaTunnel job-info response"""
+    if not info:
+        return None
+    return info.get("jobStatus") or info.get("status")
+
+def job_summary(info: Dict[str, Any], cluster: Optional[str] = None) -> "JobSummary":
+    """Compact view of a job-info or running/finished-jobs entry"""
+    return JobSummary(
+        job_id=str(info.get("jobId")),
+        name=info.get("jobName"),
+        state=job_state(info),
+        cluster=cluster,
+        created_at=info.get("createTime"),
+        finished_at=info.get("finishTime"),
+        error=info.get("errorMsg"),
+    )
+
 class Environment(BaseModel):
     job_mode: str = Field(default="BATCH", alias="job.mode")
     parallelism: int = Field(default=1, ge=1)
@@ -15,6 +36,15 @@ class Environment(BaseModel):
     class Config:
         populate_by_name = True
 
+class CDCTuning(BaseModel):
+    """Read limits and checkpoint interval derived for one CDC job"""
+    rows_per_second: int
+    bytes_per_second: int
+    checkpoint_interval: int
+
+    class Config:
+        frozen = True
+
 class CDCEnv(BaseModel):
     execution_parallelism: int = Field(1, alias="execution.parallelism")
     job_mode: str = Field("STREAMING", alias="job.mode")
@@ -23,7 +53,7 @@ class CDCEnv(BaseModel):
     read_limit_rows_per_second: int = Field(400, alias="read_limit.rows_per_second")
     
     class Config:
-        allow_population_by_field_name = True  
+        populate_by_name = True
 
 class SeatunnelSourceConfig(BaseModel):
     plugin_name: str
@@ -34,6 +64,7 @@ class SeatunnelSourceConfig(BaseModel):
         populate_by_name = True
 
 class SftpSourceConfig(SeatunnelSourceConfig):
+    plugin_name: Literal["SFTP"] = SourceType.SFTP.value
     host: str
     port: int = Field(ge=1, le=65535)
     username: str
@@ -42,6 +73,7 @@ class SftpSourceConfig(SeatunnelSourceConfig):
     file_type: str
 
 class PostgreSQLSourceConfig(SeatunnelSourceConfig):
+    plugin_name: Literal["Postgres-CDC"] = SourceType.POSTGRESQLCDC.value
     port: Optional[int] = Field(None, ge=1, le=65535)  
     username: Optional[str] = None
     password: Optional[str] = None
@@ -58,7 +90,7 @@ class PostgreSQLSourceConfig(SeatunnelSourceConfig):
       
 
 class KafkaSinkConfig(BaseModel):
-    plugin_name: Optional[str] = "Kafka"
+    plugin_name: Literal["Kafka"] = "Kafka"
     topic: str
     source_table_name: List[str]
     bootstrap_servers: str = Field("kafka:9092", alias="bootstrap.servers")  
@@ -67,7 +99,7 @@ class KafkaSinkConfig(BaseModel):
     schema_registry_url: str = Field("http://schema-registry:8081", alias="schema.registry.url") 
     
 class IcebergSinkConfig(BaseModel):
-    plugin_name: str
+    plugin_name: Literal["Iceberg"] = "Iceberg"
     plugin_input_table: str
     catalog_name: Optional[str] = None
     catalog_type: Optional[str] = None
@@ -81,10 +113,14 @@ class IcebergSinkConfig(BaseModel):
     class Config:
         populate_by_name = True
 
+# Tagged on plugin_name so validation goes straight to the right model
+SourceConfigUnion = Annotated[Union[SftpSourceConfig, PostgreSQLSourceConfig], Field(discriminator="plugin_name")]
+SinkConfigUnion = Annotated[Union[KafkaSinkConfig, IcebergSinkConfig], Field(discriminator="plugin_name")]
+
 class JobConfig(BaseModel):
-    env: Optional[Union[Environment, CDCEnv]] = None
-    source: List[Union[SftpSourceConfig, PostgreSQLSourceConfig]]
-    sink: List[Union[KafkaSinkConfig, IcebergSinkConfig]]
+    env: Optional[Union[CDCEnv, Environment]] = None
+    source: List[SourceConfigUnion]
+    sink: List[SinkConfigUnion]
 
     @validator('source')
     def validate_source_types(cls, sources):
@@ -110,18 +146,117 @@ class JobResponse(BaseModel):
     status: Optional[str] = None
     name: Optional[str] = None
     created_at: Optional[str] = None
+    cluster: Optional[str] = None
+
+class BatchJobItemResult(BaseModel):
+    """Outcome of one job in a batch submission"""
+    index: int
+    status: str
+    job_id: Optional[str] = None
+    name: Optional[str] = None
+    error: Optional[str] = None
+    cluster: Optional[str] = None
+
+class JobSummary(BaseModel):
+    """One job as listed by the cluster's running/finished job scans"""
+    job_id: str
+    name: Optional[str] = None
+    state: Optional[str] = None
+    cluster: Optional[str] = None
+    created_at: Optional[str] = None
+    finished_at: Optional[str] = None
+    error: Optional[str] = None
+
+class JobListResponse(BaseModel):
+    """One page of jobs matching the filters"""
+    total: int
+    offset: int
+    limit: int
+    jobs: List[JobSummary]
+
+class JobStatusRequest(BaseModel):
+    """Job IDs to look up in one call"""
+    job_ids: List[str] = Field(..., min_length=1)
+
+class JobStatusResponse(BaseModel):
+    """Summaries by job ID; IDs no cluster knows about are listed in ``missing``"""
+    jobs: Dict[str, JobSummary]
+    missing: List[str] = []
+
+class BatchJobResponse(BaseModel):
+    """Response model for batch job submission"""
+    submitted: int
+    failed: int
+    results: List[BatchJobItemResult]
+
+class SubmissionStatus(BaseModel):
+    """Progress of a job accepted into the asynchronous submission queue"""
+    tracking_id: str
+    # QUEUED -> SUBMITTING -> SUBMITTED or FAILED
+    state: str = "QUEUED"
+    job_id: Optional[str] = None
+    name: Optional[str] = None
+    error: Optional[str] = None
+    queued_at: str
+    finished_at: Optional[str] = None
+    cluster: Optional[str] = None
+
+class ClusterCapacity(BaseModel):
+    """Live capacity reading of one SeaTunnel cluster, as used for placement"""
+    cluster: str
+    available: bool = True
+    # None when the cluster allocates slots dynamically and reports no total
+    total_slots: Optional[int] = None
+    free_slots: Optional[int] = None
+    running_jobs: int = 0
+    # Mean system load over the cluster's nodes, 0-100
+    load: float = 0.0
+    error: Optional[str] = None
+
+class JobShard(BaseModel):
+    """One job of a sharded plan and the tables it snapshots"""
+    index: int
+    tables: List[str]
+    estimated_rows: int
+    estimated_bytes: int
+    parallelism: int
+
+class JobPlan(BaseModel):
+    """Size-balanced split of a multi-table source into several jobs"""
+    strategy: str
+    total_rows: int
+    total_bytes: int
+    # Largest shard weight over the mean; 1.0 is perfectly balanced
+    imbalance: float
+    missing_stats: List[str] = []
+    shards: List[JobShard]
+
+class ShardedJobResponse(BaseModel):
+    """Response model for submitting a sharded plan"""
+    plan: JobPlan
+    submitted: int
+    failed: int
+    results: List[BatchJobItemResult]
+
+class CDCTuningReport(BaseModel):
+    """Inputs and outcome of deriving a CDC job's read limits"""
+    row_width: int
+    change_rate: Optional[float] = None
+    load_budget: int
+    jobs: int = 1
+    tuning: CDCTuning
+
+# Validators compiled once at import
+_SOURCE_CONFIG_ADAPTER = TypeAdapter(SourceConfigUnion)
+_SINK_CONFIG_ADAPTER = TypeAdapter(SinkConfigUnion)
 
 # Factory for dynamic source config creation
 def create_source_config(data: Dict[str, Any]) -> SeatunnelSourceConfig:
     source_type = data.get('plugin_name')
-    if source_type == SourceType.SFTP.value:
-        return SftpSourceConfig(**data)
-    elif source_type == SourceType.POSTGRESQLCDC.value:
-        return PostgreSQLSourceConfig(**data)
-    raise ValueError(f"Unsupported source type: {source_type}")
+    if source_type not in (SourceType.SFTP.value, SourceType.POSTGRESQLCDC.value):
+        raise ValueError(f"Unsupported source type: {source_type}")
+    return _SOURCE_CONFIG_ADAPTER.validate_python(data)
 
 # Factory for dynamic sink config creation
-def create_sink_config(data: Dict[str, Any]) -> IcebergSinkConfig:
-    if 'iceberg.catalog.config' in data:
-        return IcebergSinkConfig(**data)
-    return IcebergSinkConfig(**data)
\ No newline at end of file
+def create_sink_config(data: Dict[str, Any]) -> Union[KafkaSinkConfig, IcebergSinkConfig]:
+    return _SINK_CONFIG_ADAPTER.validate_python(data)
\ No newline at end of file
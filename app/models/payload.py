@@ -1,6 +1,7 @@
 from dataclasses import dataclass, asdict
 from typing import Dict, List, Optional, Any
 import json
+from pydantic import TypeAdapter
 
 
 
@@ -42,6 +43,8 @@ class SinkConfig:
 class SeaTunnelRequest:
     source: SourceConfig
     sink: SinkConfig
+    # Placement hint: name of the SeaTunnel cluster to run on
+    cluster: Optional[str] = None
 
     def to_json(self) -> str:
         def filter_none(d):
@@ -54,25 +57,13 @@ class SeaTunnelRequest:
 
     @classmethod
     def from_dict(cls, data: Dict) -> 'SeaTunnelRequest':
-        def convert(data, cls):
-            if isinstance(data, dict):
-                if hasattr(cls, '__dataclass_fields__'):
-                    kwargs = {}
-                    for field in cls.__dataclass_fields__:
-                        value = data.get(field)
-                        field_type = cls.__dataclass_fields__[field].type
-                        if value is not None:
-                            if field_type == List[str]:
-                                kwargs[field] = [convert(item, str) for item in value]
-                            elif field_type in (AuthConfig, SourceConfig, SinkConfig):
-                                kwargs[field] = convert(value, field_type)
-                            else:
-                                kwargs[field] = value
-                    return cls(**kwargs)
-            return data
-        return convert(data, cls)
-    
-    
+        return _REQUEST_ADAPTER.validate_python(data)
+
+
+# Built once at import; validates and converts nested dicts to the dataclasses above
+_REQUEST_ADAPTER = TypeAdapter(SeaTunnelRequest)
+
+
 def map_source_item(item: Dict[str, Any]) -> SourceConfig:
     source_config = SourceConfig(**item)  # Create SourceConfig from the dictionary
     print(f"SourceConfig: {source_config}")
@@ -0,0 +1,252 @@
+import asyncio
+import logging
+import math
+import time
+from dataclasses import dataclass
+from typing import Any, Dict, Optional
+
+from app.config.setting import settings
+from app.models.job import CDCTuning, CDCTuningReport, job_state
+from app.models.payload import SeaTunnelRequest
+from app.services.job_planner import JobPlanner, split_table_name
+from app.utils.mapper import compile_job
+
+logger = logging.getLogger(__name__)
+
+
+def submission_load_budget(host: str, database: Optional[str]) -> int:
+    """Bytes per second the jobs of one submission may read from a source database.
+
+    The budget is split between the shards of a single submit only; jobs from
+    separate submissions against the same source each get the full budget.
+    """
+    budgets = settings.CDC_SUBMISSION_BUDGETS
+    for key in (f"{host}/{database}", host):
+        if key in budgets:
+            return int(budgets[key])
+    return settings.CDC_DEFAULT_SUBMISSION_BUDGET_BYTES
+
+
+def expected_change_rate(cfg: Dict[str, Any]) -> Optional[float]:
+    """The source's ``expected-change-rate`` option in rows/s, if set"""
+    value = cfg.get("expected-change-rate")
+    if value is None:
+        return None
+    try:
+        rate = float(value)
+    except (TypeError, ValueError):
+        rate = None
+    if isinstance(value, bool) or rate is None or not math.isfinite(rate) or rate < 0:
+        raise ValueError(f"expected-change-rate must be a non-negative number of rows/s, got {value!r}")
+    return rate
+
+
+def derive_cdc_tuning(
+    row_width: int,
+    load_budget: int,
+    change_rate: Optional[float] = None,
+    jobs: int = 1,
+) -> CDCTuning:
+    """Read limits and checkpoint interval for one of ``jobs`` jobs sharing ``load_budget``.
+
+    The row limit is the job's share of the budget in rows of ``row_width``
+    bytes. With an expected change rate it is lowered to that rate times the
+    catch-up headroom, leaving the rest of the budget to other jobs. The
+    checkpoint interval targets a fixed amount of data per checkpoint.
+    """
+    row_width = max(1, row_width)
+    ceiling = max(settings.CDC_MIN_ROWS_PER_SECOND, load_budget // max(1, jobs) // row_width)
+    rows_per_second = ceiling
+    if change_rate:
+        wanted = math.ceil(change_rate * settings.CDC_CHANGE_RATE_HEADROOM)
+        if wanted > ceiling:
+            logger.warning(
+                f"Expected change rate {change_rate} rows/s needs {wanted} rows/s; "
+                f"the load budget allows {ceiling}"
+            )
+        rows_per_second = max(settings.CDC_MIN_ROWS_PER_SECOND, min(ceiling, wanted))
+    bytes_per_second = rows_per_second * row_width
+    checkpoint_interval = int(min(
+        settings.CDC_CHECKPOINT_MAX_MS,
+        max(settings.CDC_CHECKPOINT_MIN_MS, settings.CDC_CHECKPOINT_TARGET_BYTES * 1000 // bytes_per_second),
+    ))
+    return CDCTuning(
+        rows_per_second=rows_per_second,
+        bytes_per_second=bytes_per_second,
+        checkpoint_interval=checkpoint_interval,
+    )
+
+
+class CDCTuner:
+    """Derives CDC read limits from the source's catalog statistics and load budget"""
+
+    def __init__(self, planner: JobPlanner):
+        self.planner = planner
+
+    async def tune(self, request: SeaTunnelRequest, jobs: int = 1) -> CDCTuningReport:
+        """Tuning for one of the ``jobs`` jobs a submission starts on the request's source"""
+        cfg = request.source.config or {}
+        change_rate = expected_change_rate(cfg)
+        _, stats = await self.planner.collect_stats(request)
+        rows = sum(table.get("rows", 0) for table in stats.values())
+        # Row-weighted mean width; catalog widths first, bytes/rows for never-analyzed tables
+        weighted = sum(
+            table.get("rows", 0) * (table.get("row_width") or table.get("bytes", 0) // max(1, table.get("rows", 0)))
+            for table in stats.values()
+        )
+        row_width = (weighted // rows if rows else 0) or settings.CDC_DEFAULT_ROW_WIDTH
+        database = next(iter(cfg.get("database-names", [])), None)
+        tables = cfg.get("table-names", [])
+        if database is None and tables:
+            database = split_table_name(tables[0])[0]
+        load_budget = submission_load_budget(cfg.get("host", "localhost"), database)
+        return CDCTuningReport(
+            row_width=row_width,
+            change_rate=change_rate,
+            load_budget=load_budget,
+            jobs=jobs,
+            tuning=derive_cdc_tuning(row_width, load_budget, change_rate, jobs),
+        )
+
+
+@dataclass
+class _TunedJob:
+    request: SeaTunnelRequest
+    tuning: CDCTuning
+    row_width: int
+    ceiling: int
+    floor: int
+    parallelism: Optional[int] = None
+    high_streak: int = 0
+    low_streak: int = 0
+    last_retune: float = 0.0
+
+
+def observed_rows_per_second(info: Dict[str, Any]) -> Optional[float]:
+    """Source read rate reported in a job-info response, if any"""
+    metrics = info.get("metrics") or {}
+    value = metrics.get("SourceReceivedQPS")
+    try:
+        return float(value) if value is not None else None
+    except (TypeError, ValueError):
+        return None
+
+
+class CDCTuningController:
+    """Re-tunes running CDC jobs whose throughput is far from their read limit.
+
+    A job pinned at its row limit for ``patience`` polls is limit-bound and
+    gets twice the limit, up to its load-budget ceiling; a job far below its
+    limit is stepped down towards what it actually reads, returning budget
+    to the source. Changes are applied by stop-with-savepoint and resubmit,
+    at most once per cooldown period per job.
+    """
+
+    def __init__(self, job_service, interval: Optional[float] = None):
+        self.job_service = job_service
+        self.interval = interval or settings.CDC_CONTROLLER_INTERVAL
+        self._jobs: Dict[str, _TunedJob] = {}
+        self._task: Optional[asyncio.Task] = None
+
+    def watch(
+        self,
+        job_id: str,
+        request: SeaTunnelRequest,
+        report: CDCTuningReport,
+        parallelism: Optional[int] = None,
+    ) -> None:
+        tuning = report.tuning
+        self._jobs[str(job_id)] = _TunedJob(
+            request=request,
+            tuning=tuning,
+            row_width=report.row_width,
+            # Never more than the job's share of its submission's budget
+            ceiling=max(tuning.rows_per_second, report.load_budget // report.jobs // report.row_width),
+            floor=settings.CDC_MIN_ROWS_PER_SECOND,
+            parallelism=parallelism,
+            last_retune=time.monotonic(),
+        )
+
+    def unwatch(self, job_id: str) -> None:
+        self._jobs.pop(str(job_id), None)
+
+    def watched(self) -> Dict[str, CDCTuning]:
+        return {job_id: job.tuning for job_id, job in self._jobs.items()}
+
+    def _proposal(self, job: _TunedJob, observed: float) -> Optional[int]:
+        limit = job.tuning.rows_per_second
+        if observed >= limit * settings.CDC_SATURATION_RATIO:
+            job.high_streak, job.low_streak = job.high_streak + 1, 0
+        elif observed <= limit * settings.CDC_UNDERUSE_RATIO:
+            job.high_streak, job.low_streak = 0, job.low_streak + 1
+        else:
+            job.high_streak = job.low_streak = 0
+            return None
+
+        if time.monotonic() - job.last_retune < settings.CDC_RETUNE_COOLDOWN:
+            return None
+        if job.high_streak >= settings.CDC_CONTROLLER_PATIENCE and limit < job.ceiling:
+            return min(job.ceiling, limit * 2)
+        if job.low_streak >= settings.CDC_CONTROLLER_PATIENCE and limit > job.floor:
+            return max(job.floor, math.ceil(observed * settings.CDC_CHANGE_RATE_HEADROOM))
+        return None
+
+    async def _retune(self, job_id: str, job: _TunedJob, rows_per_second: int) -> None:
+        bytes_per_second = rows_per_second * job.row_width
+        tuning = CDCTuning(
+            rows_per_second=rows_per_second,
+            bytes_per_second=bytes_per_second,
+            checkpoint_interval=derive_cdc_tuning(job.row_width, bytes_per_second).checkpoint_interval,
+        )
+        config = compile_job(job.request, job_id=job_id, parallelism=job.parallelism, tuning=tuning)
+        logger.info(
+            f"Re-tuning job {job_id}: {job.tuning.rows_per_second} -> {rows_per_second} rows/s"
+        )
+        job.last_retune = time.monotonic()
+        job.high_streak = job.low_streak = 0
+        await self.job_service.restart_with_savepoint(job_id, config)
+        job.tuning = tuning
+
+    async def check(self) -> None:
+        for job_id, job in list(self._jobs.items()):
+            try:
+                info = await self.job_service.get_job(job_id)
+            except Exception as e:
+                logger.warning(f"Could not read metrics of job {job_id}: {str(e)}")
+                continue
+            state = job_state(info)
+            if state != "RUNNING":
+                if state in ("FINISHED", "CANCELED", "FAILED"):
+                    self.unwatch(job_id)
+                continue
+            observed = observed_rows_per_second(info)
+            if observed is None:
+                continue
+            proposal = self._proposal(job, observed)
+            if proposal is None or proposal == job.tuning.rows_per_second:
+                continue
+            try:
+                await self._retune(job_id, job, proposal)
+            except Exception as e:
+                logger.error(f"Re-tuning job {job_id} failed: {str(e)}")
+
+    async def _loop(self) -> None:
+        while True:
+            await asyncio.sleep(self.interval)
+            try:
+                await self.check()
+            except Exception as e:
+                logger.error(f"CDC tuning controller error: {str(e)}")
+
+    def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self._loop())
+
+    async def close(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
@@ -0,0 +1,194 @@
+import asyncio
+import logging
+import math
+from typing import Any, Dict, List, Optional, Tuple
+
+from app.client.http_client import AsyncSeaTunnelClient, SeaTunnelAPIError
+from app.config.setting import settings
+from app.models.job import ClusterCapacity, job_state
+from app.utils.cache import TTLCache
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CLUSTER = "default"
+
+
+class UnknownClusterError(ValueError):
+    """Raised when a placement hint names a cluster that is not configured"""
+
+
+def _number(value: Any, default: float = 0.0) -> float:
+    # The REST API reports numbers as strings, percentages with a trailing "%"
+    try:
+        return float(str(value).rstrip("%"))
+    except (TypeError, ValueError):
+        return default
+
+
+def parse_capacity(name: str, overview: Dict[str, Any], nodes: List[Dict[str, Any]]) -> ClusterCapacity:
+    """Capacity of a cluster from its /overview and /system-monitoring-information answers"""
+    total = int(_number(overview.get("totalSlot")))
+    loads = [_number(node.get("load.system")) for node in nodes or []]
+    return ClusterCapacity(
+        cluster=name,
+        total_slots=total or None,
+        free_slots=int(_number(overview.get("unassignedSlot"))) if total else None,
+        running_jobs=int(_number(overview.get("runningJobs"))),
+        load=round(sum(loads) / len(loads), 2) if loads else 0.0,
+    )
+
+
+class ClusterRegistry:
+    """Named SeaTunnel clusters, job placement across them and where each job runs.
+
+    New jobs go to the cluster with the most free slots, then the lowest
+    load, from capacity readings cached for ``CLUSTER_CAPACITY_TTL``. Each
+    placement reserves a slot in the cached reading, so a burst spreads out
+    instead of piling onto the cluster that looked emptiest. Placed jobs are
+    remembered; only jobs placed elsewhere (or before a restart) are looked
+    up on every cluster, once. A job every cluster denies knowing is not
+    searched for again until ``CLUSTER_LOCATE_MISS_TTL`` has passed.
+    """
+
+    def __init__(self, clients: Dict[str, AsyncSeaTunnelClient]):
+        if not clients:
+            raise ValueError("At least one SeaTunnel cluster is required")
+        self.clients = clients
+        self.default = next(iter(clients))
+        self.capacity_cache = TTLCache(
+            ttl=settings.CLUSTER_CAPACITY_TTL,
+            max_entries=len(clients),
+            name="cluster_capacity",
+        )
+        self.job_clusters = TTLCache(
+            ttl=float("inf"),
+            max_entries=settings.CLUSTER_JOB_MAP_SIZE,
+            name="job_cluster",
+        )
+        # Cluster searches by job ID; a search that found nothing is kept for a while
+        self.job_searches = TTLCache(
+            ttl=settings.CLUSTER_LOCATE_MISS_TTL,
+            max_entries=settings.CLUSTER_JOB_MAP_SIZE,
+            name="job_cluster_search",
+        )
+
+    @classmethod
+    def from_settings(cls, transport=None) -> "ClusterRegistry":
+        if not settings.CLUSTERS:
+            return cls({DEFAULT_CLUSTER: AsyncSeaTunnelClient(transport=transport)})
+        return cls({
+            name: AsyncSeaTunnelClient(base_urls=urls, transport=transport)
+            for name, urls in settings.CLUSTERS.items()
+        })
+
+    def __len__(self) -> int:
+        return len(self.clients)
+
+    def client(self, name: Optional[str] = None) -> AsyncSeaTunnelClient:
+        return self.clients[name or self.default]
+
+    def check(self, name: Optional[str]) -> None:
+        if name is not None and name not in self.clients:
+            raise UnknownClusterError(f"Unknown SeaTunnel cluster {name!r}; known: {', '.join(self.clients)}")
+
+    def start(self) -> None:
+        for client in self.clients.values():
+            client.start()
+
+    async def close(self) -> None:
+        await asyncio.gather(*(client.close() for client in self.clients.values()))
+
+    async def _read_capacity(self, name: str) -> ClusterCapacity:
+        client = self.clients[name]
+        try:
+            overview, nodes = await asyncio.gather(client.get_overview(), client.get_system_monitoring())
+        except Exception as e:
+            logger.warning(f"Could not read capacity of cluster {name}: {str(e)}")
+            return ClusterCapacity(cluster=name, available=False, error=str(e))
+        return parse_capacity(name, overview, nodes)
+
+    async def capacity(self, name: str) -> ClusterCapacity:
+        return await self.capacity_cache.get_or_load(name, lambda: self._read_capacity(name))
+
+    async def capacities(self) -> List[ClusterCapacity]:
+        return list(await asyncio.gather(*(self.capacity(name) for name in self.clients)))
+
+    async def place(self, affinity: Optional[str] = None) -> str:
+        """Name of the cluster a new job should run on"""
+        self.check(affinity)
+        if affinity is not None:
+            return affinity
+        if len(self.clients) == 1:
+            return self.default
+        readings = [reading for reading in await self.capacities() if reading.available]
+        if not readings:
+            # Nothing answered; let the submit itself report the failure
+            return self.default
+        # Most free slots first (None: allocated dynamically, never full), then lowest load
+        best = min(
+            readings,
+            key=lambda reading: (
+                -(math.inf if reading.free_slots is None else reading.free_slots),
+                reading.load,
+                reading.running_jobs,
+            ),
+        )
+        if best.free_slots:
+            best.free_slots -= 1
+        best.running_jobs += 1
+        return best.cluster
+
+    def remember(self, job_id: str, cluster: str) -> None:
+        self.job_clusters.set(str(job_id), cluster)
+        self.job_searches.invalidate(str(job_id))
+
+    async def _search(self, job_id: str) -> Tuple[Optional[str], Optional[Dict[str, Any]], bool]:
+        """The cluster that knows ``job_id``, its job info and whether a miss is conclusive"""
+        names = list(self.clients)
+        answers = await asyncio.gather(
+            *(self.clients[name].get_job(job_id) for name in names), return_exceptions=True
+        )
+        conclusive = True
+        for name, answer in zip(names, answers):
+            if isinstance(answer, BaseException):
+                # Only a 4xx says the cluster does not have the job; a 5xx or no answer says nothing
+                if not (isinstance(answer, SeaTunnelAPIError)
+                        and answer.status_code is not None and 400 <= answer.status_code < 500):
+                    conclusive = False
+                continue
+            if job_state(answer):
+                self.remember(job_id, name)
+                return name, answer, True
+        return None, None, conclusive
+
+    async def find(self, job_id: str) -> Tuple[str, Optional[Dict[str, Any]]]:
+        """Cluster running ``job_id`` (the default one if no cluster knows it) and,
+        when it had to be searched for, the job info the search already fetched"""
+        job_id = str(job_id)
+        cluster = self.job_clusters.get(job_id)
+        if cluster is not None:
+            return cluster, None
+        if len(self.clients) == 1:
+            return self.default, None
+        # Concurrent lookups of one ID share a search; only conclusive misses are kept
+        name, info, _ = await self.job_searches.get_or_load(
+            job_id,
+            lambda: self._search(job_id),
+            should_cache=lambda search: search[0] is None and search[2],
+        )
+        return name or self.default, info
+
+    async def locate(self, job_id: str) -> str:
+        """Name of the cluster running ``job_id``; the default one if no cluster knows it"""
+        return (await self.find(job_id))[0]
+
+    async def client_for(self, job_id: str) -> AsyncSeaTunnelClient:
+        return self.clients[await self.locate(job_id)]
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "clusters": list(self.clients),
+            "default": self.default,
+            "known_jobs": len(self.job_clusters),
+            "endpoints": {name: client.pool.stats() for name, client in self.clients.items()},
+        }
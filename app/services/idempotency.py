@@ -0,0 +1,213 @@
+import asyncio
+import json
+import logging
+import sqlite3
+import threading
+import time
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+from app.client.http_client import SeaTunnelAPIError
+from app.config.setting import settings
+from app.models.job import TERMINAL_STATES, job_state
+from app.utils.cache import TTLCache
+from app.utils.mapper import config_fingerprint
+
+logger = logging.getLogger(__name__)
+
+
+class IdempotencyConflict(Exception):
+    """Raised when an Idempotency-Key is reused for a different job"""
+
+
+class IdempotencyStore:
+    """Submission records by key, bounded in memory and optionally persisted to SQLite.
+
+    Memory is the source of truth while running; the SQLite file only lets
+    records survive a restart, so writes go to a worker thread and a failed
+    write is logged rather than failing the submission.
+    """
+
+    def __init__(self, max_entries: Optional[int] = None, ttl: Optional[float] = None, path: Optional[str] = None):
+        self.ttl = ttl or settings.IDEMPOTENCY_TTL
+        self.cache = TTLCache(
+            ttl=self.ttl,
+            max_entries=max_entries or settings.IDEMPOTENCY_MAX_ENTRIES,
+            name="idempotency",
+        )
+        self.path = path if path is not None else settings.IDEMPOTENCY_DB_PATH
+        self._db: Optional[sqlite3.Connection] = None
+        self._db_lock = threading.Lock()
+
+    def _open_db(self) -> List[Tuple[str, str, float]]:
+        self._db = sqlite3.connect(self.path, check_same_thread=False)
+        with self._db_lock, self._db:
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS submissions (key TEXT PRIMARY KEY, record TEXT NOT NULL, created REAL NOT NULL)"
+            )
+            self._db.execute("CREATE INDEX IF NOT EXISTS submissions_created ON submissions (created)")
+            self._db.execute("DELETE FROM submissions WHERE created < ?", (time.time() - self.ttl,))
+            return self._db.execute(
+                "SELECT key, record, created FROM submissions ORDER BY created DESC LIMIT ?",
+                (self.cache.max_entries,),
+            ).fetchall()
+
+    async def open(self) -> None:
+        if not self.path:
+            return
+        rows = await asyncio.to_thread(self._open_db)
+        now = time.time()
+        # Oldest first, so the LRU order matches submission order
+        for key, record, created in reversed(rows):
+            self.cache.set(key, json.loads(record), ttl=created + self.ttl - now)
+        logger.info(f"Loaded {len(rows)} idempotency records from {self.path}")
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        return self.cache.get(key)
+
+    def _write(self, keys: List[str], record: Dict[str, Any]) -> None:
+        payload = json.dumps(record)
+        with self._db_lock, self._db:
+            self._db.executemany(
+                "INSERT OR REPLACE INTO submissions (key, record, created) VALUES (?, ?, ?)",
+                [(key, payload, record["created"]) for key in keys],
+            )
+            self._db.execute("DELETE FROM submissions WHERE created < ?", (time.time() - self.ttl,))
+
+    async def put(self, keys: List[str], record: Dict[str, Any]) -> None:
+        for key in keys:
+            self.cache.set(key, record)
+        if self._db is not None:
+            try:
+                await asyncio.to_thread(self._write, keys, record)
+            except sqlite3.Error as e:
+                logger.error(f"Failed to persist idempotency record: {str(e)}")
+
+    def _close_db(self, db: sqlite3.Connection) -> None:
+        with self._db_lock:
+            db.close()
+
+    async def close(self) -> None:
+        if self._db is not None:
+            db, self._db = self._db, None
+            await asyncio.to_thread(self._close_db, db)
+
+
+class SubmissionDeduplicator:
+    """Makes job submission safe to retry.
+
+    A submission is recorded under its ``Idempotency-Key`` (if any) and under
+    the hash of its mapped config. A repeat with the same key always gets the
+    original job back. A repeat of the same config without a key does so
+    while the original job is still queued or active; once it has ended the
+    config may run again. Concurrent duplicates share a single submit.
+    """
+
+    def __init__(self, store: IdempotencyStore, job_service, queue=None):
+        self.store = store
+        self.job_service = job_service
+        self.queue = queue
+        self._in_flight: Dict[str, asyncio.Future] = {}
+
+    def _queued_state(self, record: Dict[str, Any]) -> Optional[str]:
+        tracking_id = record.get("tracking_id")
+        if tracking_id is None or self.queue is None:
+            return None
+        status = self.queue.get(tracking_id)
+        return status.state if status is not None else None
+
+    async def _active(self, record: Dict[str, Any]) -> bool:
+        queued_state = self._queued_state(record)
+        if queued_state in ("QUEUED", "SUBMITTING"):
+            return True
+        if queued_state == "FAILED":
+            return False
+        try:
+            info = await self.job_service.get_job(record["job_id"])
+        except SeaTunnelAPIError as e:
+            # A 4xx means the master does not know the job; otherwise assume it
+            # is still running rather than risk a second pipeline
+            return not (e.status_code is not None and 400 <= e.status_code < 500)
+        except Exception:
+            return True
+        return job_state(info) not in TERMINAL_STATES
+
+    def _find_by_key(self, fingerprint: str, idempotency_key: Optional[str]) -> Optional[Dict[str, Any]]:
+        if idempotency_key:
+            record = self.store.get(f"key:{idempotency_key}")
+            if record is not None:
+                if record["fingerprint"] != fingerprint:
+                    raise IdempotencyConflict(
+                        f"Idempotency-Key {idempotency_key!r} was already used for a different job"
+                    )
+                # A queued submit that failed never launched anything; let the retry through
+                if self._queued_state(record) != "FAILED":
+                    return record
+        return None
+
+    async def _find_active_config(self, fingerprint: str) -> Optional[Dict[str, Any]]:
+        if settings.IDEMPOTENCY_DEDUP_CONFIGS:
+            record = self.store.get(f"config:{fingerprint}")
+            if record is not None and await self._active(record):
+                return record
+        return None
+
+    async def submit_once(
+        self,
+        config: Dict[str, Any],
+        idempotency_key: Optional[str],
+        submit: Callable[[], Awaitable[Dict[str, Any]]],
+    ) -> Tuple[Dict[str, Any], bool]:
+        """Run ``submit`` unless this is a repeat; returns the record and whether it was replayed.
+
+        ``submit`` returns the ``job_id``, ``name`` and, for queued submits,
+        ``tracking_id`` of the job it launched.
+        """
+        fingerprint = config_fingerprint(config)
+        keys = []
+        if idempotency_key:
+            keys.append(f"key:{idempotency_key}")
+        if settings.IDEMPOTENCY_DEDUP_CONFIGS:
+            keys.append(f"config:{fingerprint}")
+
+        for key in keys:
+            pending = self._in_flight.get(key)
+            if pending is not None:
+                record = await asyncio.shield(pending)
+                if record["fingerprint"] != fingerprint:
+                    raise IdempotencyConflict(
+                        f"Idempotency-Key {idempotency_key!r} was already used for a different job"
+                    )
+                return record, True
+
+        # No await from here until the futures are registered, so a concurrent
+        # repeat of this submission waits on them instead of submitting too
+        record = self._find_by_key(fingerprint, idempotency_key)
+        if record is not None:
+            return record, True
+
+        future = asyncio.get_running_loop().create_future()
+        for key in keys:
+            self._in_flight[key] = future
+        replayed = False
+        try:
+            record = await self._find_active_config(fingerprint)
+            if record is not None:
+                replayed = True
+            else:
+                record = {**await submit(), "fingerprint": fingerprint, "created": time.time()}
+                await self.store.put(keys, record)
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as e:
+            future.set_exception(e)
+            # Waiters re-raise it; nobody else may be listening
+            future.exception()
+            raise
+        else:
+            future.set_result(record)
+        finally:
+            for key in keys:
+                if self._in_flight.get(key) is future:
+                    del self._in_flight[key]
+        return record, replayed
@@ -0,0 +1,191 @@
+import heapq
+import logging
+import math
+from dataclasses import replace
+from typing import Dict, List, Optional, Tuple
+
+from app.config.setting import settings
+from app.models.job import JobPlan, JobShard, SourceType
+from app.models.payload import SeaTunnelRequest
+from app.utils.db_connector import ConnectorFactory, DBConfig, DBConnector
+
+logger = logging.getLogger(__name__)
+
+# CDC source types the planner can size, and the connector that reads their catalog
+SOURCE_DIALECTS = {
+    SourceType.POSTGRESQLCDC.value: "postgresql",
+}
+
+# Postgres-CDC replication slot used when the source names none (the connector's default)
+DEFAULT_SLOT_NAME = "seatunnel"
+# PostgreSQL identifiers, slot names included, are at most this long
+MAX_SLOT_NAME_LENGTH = 63
+
+
+def shard_slot_name(base: str, index: int) -> str:
+    """Replication slot of one shard: ``<base>_<index>``, trimmed to PostgreSQL's name limit"""
+    suffix = f"_{index}"
+    return base[:MAX_SLOT_NAME_LENGTH - len(suffix)] + suffix
+
+
+def split_table_name(name: str) -> Tuple[Optional[str], Optional[str], str]:
+    """Split ``database.schema.table`` (or ``schema.table``, ``table``) into its parts"""
+    parts = name.split(".")
+    if len(parts) >= 3:
+        return parts[0], parts[1], ".".join(parts[2:])
+    if len(parts) == 2:
+        return None, parts[0], parts[1]
+    return None, None, name
+
+
+def plan_shards(
+    tables: List[str],
+    stats: Dict[str, Dict[str, int]],
+    max_jobs: int,
+    max_parallelism: int,
+    bytes_per_task: int,
+) -> JobPlan:
+    """Bin-pack ``tables`` into at most ``max_jobs`` shards of similar size.
+
+    Longest-processing-time first: tables are placed largest first onto the
+    currently lightest shard. Weights are total bytes; tables without
+    statistics weigh as little as possible and just spread across shards.
+    With no statistics at all there is nothing to balance, so everything
+    stays in one shard. Each shard's parallelism grows with its size, one
+    task per ``bytes_per_task``, capped at ``max_parallelism``.
+    """
+    def weight(table: str) -> int:
+        return max(1, stats.get(table, {}).get("bytes", 0))
+
+    shard_count = max(1, min(max_jobs, len(tables))) if stats else 1
+    bins: List[List[str]] = [[] for _ in range(shard_count)]
+    loads: List[Tuple[int, int]] = [(0, index) for index in range(shard_count)]
+    for table in sorted(tables, key=lambda table: (-weight(table), table)):
+        load, index = heapq.heappop(loads)
+        bins[index].append(table)
+        heapq.heappush(loads, (load + weight(table), index))
+
+    shards = []
+    for index, shard_tables in enumerate(bin for bin in bins if bin):
+        rows = sum(stats.get(table, {}).get("rows", 0) for table in shard_tables)
+        size = sum(stats.get(table, {}).get("bytes", 0) for table in shard_tables)
+        parallelism = min(max_parallelism, max(1, math.ceil(size / bytes_per_task)))
+        shards.append(JobShard(
+            index=index,
+            tables=shard_tables,
+            estimated_rows=rows,
+            estimated_bytes=size,
+            parallelism=parallelism,
+        ))
+
+    weights = [sum(weight(table) for table in shard.tables) for shard in shards]
+    mean = sum(weights) / len(weights) if weights else 0
+    return JobPlan(
+        strategy="lpt",
+        total_rows=sum(shard.estimated_rows for shard in shards),
+        total_bytes=sum(shard.estimated_bytes for shard in shards),
+        imbalance=round(max(weights) / mean, 3) if mean else 1.0,
+        missing_stats=[table for table in tables if table not in stats],
+        shards=shards,
+    )
+
+
+class JobPlanner:
+    """Splits multi-table CDC requests into size-balanced jobs.
+
+    Table sizes come from catalog statistics read through the shared
+    connector registry, so planning costs one catalog query per schema.
+    """
+
+    def __init__(self, registry=None):
+        self.registry = registry
+
+    async def _acquire(self, db_type: str, config: DBConfig) -> Optional[DBConnector]:
+        if self.registry is not None:
+            return await self.registry.acquire(db_type, config)
+        connector = ConnectorFactory.create_connector(db_type, config)
+        if connector is not None and await connector.connect():
+            return connector
+        return None
+
+    async def _release(self, connector: DBConnector) -> None:
+        if self.registry is not None and self.registry.owns(connector):
+            self.registry.release(connector)
+        else:
+            await connector.close()
+
+    async def collect_stats(self, request: SeaTunnelRequest) -> Tuple[List[str], Dict[str, Dict[str, int]]]:
+        """Table names of the request's source and the statistics found for them"""
+        source = request.source
+        dialect = SOURCE_DIALECTS.get(source.source_type)
+        if dialect is None:
+            raise ValueError(f"Table statistics are not supported for source type {source.source_type!r}")
+        cfg = source.config or {}
+        tables = list(dict.fromkeys(cfg.get("table-names", [])))
+        if not tables:
+            raise ValueError("The source lists no table-names")
+
+        default_database = next(iter(cfg.get("database-names", [])), None)
+        default_schema = next(iter(cfg.get("schema-names", [])), None)
+        groups: Dict[Tuple[Optional[str], Optional[str]], Dict[str, str]] = {}
+        for name in tables:
+            database, schema, table = split_table_name(name)
+            groups.setdefault((database or default_database, schema or default_schema), {})[table] = name
+
+        stats: Dict[str, Dict[str, int]] = {}
+        for (database, schema), names in groups.items():
+            config = DBConfig(
+                host=cfg.get("host", "localhost"),
+                port=int(cfg.get("port", 5432)),
+                username=source.auth.username if source.auth else "",
+                password=source.auth.password if source.auth else "",
+                database=database,
+            )
+            connector = await self._acquire(dialect, config)
+            if connector is None:
+                logger.warning(f"No {dialect} connection to '{config.host}/{database}'; planning without sizes")
+                continue
+            try:
+                found = await connector.get_table_stats(list(names), database, schema)
+            except Exception as e:
+                logger.error(f"Reading table statistics from '{config.host}/{database}' failed: {str(e)}")
+                found = {}
+            finally:
+                await self._release(connector)
+            for table, table_stats in found.items():
+                if table in names:
+                    stats[names[table]] = table_stats
+        return tables, stats
+
+    async def plan(
+        self,
+        request: SeaTunnelRequest,
+        max_jobs: Optional[int] = None,
+        max_parallelism: Optional[int] = None,
+    ) -> JobPlan:
+        tables, stats = await self.collect_stats(request)
+        return plan_shards(
+            tables,
+            stats,
+            max_jobs or settings.PLANNER_MAX_JOBS,
+            max_parallelism or settings.PLANNER_MAX_PARALLELISM,
+            settings.PLANNER_BYTES_PER_TASK,
+        )
+
+    @staticmethod
+    def shard_requests(request: SeaTunnelRequest, plan: JobPlan) -> List[SeaTunnelRequest]:
+        """One request per shard, identical to ``request`` except for its table-names.
+
+        Shards run concurrently, so with more than one each gets its own
+        replication slot, ``<slot.name>_<index>``; a shared slot would be
+        claimed by the first shard and fail the others.
+        """
+        cfg = request.source.config or {}
+        base_slot = cfg.get("slot.name") or DEFAULT_SLOT_NAME
+        requests = []
+        for shard in plan.shards:
+            shard_cfg = {**cfg, "table-names": list(shard.tables)}
+            if len(plan.shards) > 1:
+                shard_cfg["slot.name"] = shard_slot_name(base_slot, shard.index)
+            requests.append(replace(request, source=replace(request.source, config=shard_cfg)))
+        return requests
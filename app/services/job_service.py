@@ -1,15 +1,44 @@
-from app.client.http_client import SeaTunnelClient
-from app.models.job import Job, JobResponse, JobConfig
-from typing import Dict, Any, Optional
-from app.utils.db_connector import SchemaManager, DBConfig, PostgreSQLConnector
+import asyncio
+import logging
+from app.client.http_client import AsyncSeaTunnelClient, SeaTunnelAPIError
+from app.config.setting import settings
+from app.models.job import (
+    Job, JobResponse, JobConfig, BatchJobItemResult, JobSummary, JobStatusResponse,
+    TERMINAL_STATES, job_state, job_summary,
+)
+from app.utils.cache import TTLCache
+from typing import Dict, Any, Optional, Tuple
+from app.utils.db_connector import SchemaManager, DBConfig
+from app.services.cluster_registry import ClusterRegistry, DEFAULT_CLUSTER, UnknownClusterError
 from typing import List
 
+logger = logging.getLogger(__name__)
+
 class JobService:
-    def __init__(self, client: SeaTunnelClient):
+    def __init__(
+        self,
+        client: AsyncSeaTunnelClient,
+        schema_manager: Optional[SchemaManager] = None,
+        clusters: Optional[ClusterRegistry] = None,
+    ):
         self.client = client
+        # Where jobs are placed and looked up; a lone client is a one-cluster registry
+        self.clusters = clusters or ClusterRegistry({DEFAULT_CLUSTER: client})
+        # Shared across calls so schema mapping reuses warm pools
+        self.schema_manager = schema_manager or SchemaManager()
+        # Per cluster; absent until the cluster has told us whether /submit-jobs exists
+        self._batch_submit_supported: Dict[str, bool] = {}
+        # job-info responses; concurrent lookups of one job share a single upstream call
+        self.job_cache = TTLCache(
+            ttl=settings.JOB_CACHE_TTL_DEFAULT,
+            max_entries=settings.JOB_CACHE_MAX_ENTRIES,
+            name="job_info",
+        )
+        # Every job the clusters list, from one running/finished-jobs scan shared by all readers
+        self.job_index_cache = TTLCache(ttl=settings.JOB_INDEX_TTL, max_entries=1, name="job_index")
         
     async def mapper_schema(self, schema: Dict[str, Any], primary_keys: List[str] = None) -> Dict[str, Any]:
-        schema_manager = SchemaManager()
+        schema_manager = self.schema_manager
         pg_config = DBConfig(
         host="localhost",
         port=5432,
@@ -19,7 +48,8 @@ class JobService:
         pool_min=2,
         pool_max=20
     )
-        success = await schema_manager.create_connector("postgresql", "pg_source", pg_config)
+        success = schema_manager.has_connector("pg_source") or \
+            await schema_manager.create_connector("postgresql", "pg_source", pg_config)
         if success:
             # Get tables
             tables = await schema_manager.get_tables("pg_source", schema="public")
@@ -44,29 +74,232 @@ class JobService:
             ]
         
 
-    def create_job(self, name: str, config: JobConfig) -> JobResponse:
-        job_config = {"name": name, "config": config}
-        # Send the request to the SeaTunnel API
-        response = self.client.create_job(job_config)
+    async def create_job(self, name: str, config: Dict[str, Any]) -> JobResponse:
+        # Send the request to the SeaTunnel API of the cluster the job is placed on
+        cluster = await self.clusters.place(config.get("cluster"))
+        response = await self.clusters.client(cluster).create_job(config)
+        job_id = str(response.get("jobId", config.get("jobId", "unknown")))
+        self.clusters.remember(job_id, cluster)
+        self.job_cache.invalidate(job_id)
         
         # Return a JobResponse object
         return JobResponse(
-            job_id=response.get("jobId", "unknown"),
+            job_id=job_id,
             status=response.get("status", "CREATED"),
             name=name,
-            created_at=response.get("createdAt")
+            created_at=response.get("createdAt"),
+            cluster=cluster,
+        )
+
+    async def create_jobs(self, configs: List[Dict[str, Any]]) -> List[BatchJobItemResult]:
+        """Submit many jobs in as few upstream calls as possible.
+
+        Jobs are placed one by one, then each cluster gets its share through
+        /submit-jobs in chunks when it supports it and bounded concurrent
+        single submits otherwise. A failing job never fails the rest of the batch.
+        """
+        results: List[Optional[BatchJobItemResult]] = [None] * len(configs)
+        placed: Dict[str, List[int]] = {}
+        for index, config in enumerate(configs):
+            try:
+                placed.setdefault(await self.clusters.place(config.get("cluster")), []).append(index)
+            except UnknownClusterError as e:
+                results[index] = self._batch_failure(index, config, e)
+
+        async def submit_to(cluster: str, indexes: List[int]) -> None:
+            items = await self._create_jobs_on(cluster, [configs[i] for i in indexes])
+            for index, item in zip(indexes, items):
+                results[index] = item.copy(update={"index": index, "cluster": cluster})
+                if item.status == "SUBMITTED":
+                    self.clusters.remember(item.job_id, cluster)
+                    self.job_cache.invalidate(item.job_id)
+
+        await asyncio.gather(*(submit_to(cluster, indexes) for cluster, indexes in placed.items()))
+        return results
+
+    async def _create_jobs_on(self, cluster: str, configs: List[Dict[str, Any]]) -> List[BatchJobItemResult]:
+        client = self.clusters.client(cluster)
+        results: List[Optional[BatchJobItemResult]] = [None] * len(configs)
+        chunk_size = max(1, settings.BATCH_SUBMIT_CHUNK_SIZE)
+
+        if self._batch_submit_supported.get(cluster) is not False:
+            for start in range(0, len(configs), chunk_size):
+                chunk = configs[start:start + chunk_size]
+                try:
+                    response = await client.create_jobs(chunk)
+                except SeaTunnelAPIError as e:
+                    if e.status_code in (404, 405):
+                        # Older masters have no multi-job submit
+                        self._batch_submit_supported[cluster] = False
+                        break
+                    if e.status_code is None or e.status_code >= 500:
+                        # Unknown upstream state: resubmitting could duplicate jobs
+                        for offset, config in enumerate(chunk):
+                            results[start + offset] = self._batch_failure(start + offset, config, e)
+                    # A rejected chunk is retried job by job below to isolate the bad ones
+                    continue
+                self._batch_submit_supported[cluster] = True
+                items = response if isinstance(response, list) else []
+                for offset, config in enumerate(chunk):
+                    item = items[offset] if offset < len(items) else {}
+                    results[start + offset] = self._batch_success(start + offset, config, item)
+
+        semaphore = asyncio.Semaphore(max(1, settings.BATCH_SUBMIT_CONCURRENCY))
+
+        async def submit_one(index: int) -> None:
+            async with semaphore:
+                try:
+                    response = await client.create_job(configs[index])
+                except Exception as e:
+                    results[index] = self._batch_failure(index, configs[index], e)
+                else:
+                    results[index] = self._batch_success(index, configs[index], response)
+
+        await asyncio.gather(*(submit_one(i) for i, result in enumerate(results) if result is None))
+        return results
+
+    @staticmethod
+    def _batch_success(index: int, config: Dict[str, Any], response: Dict[str, Any]) -> BatchJobItemResult:
+        return BatchJobItemResult(
+            index=index,
+            status="SUBMITTED",
+            job_id=str(response.get("jobId", config.get("jobId"))),
+            name=response.get("jobName", config.get("jobName")),
+        )
+
+    @staticmethod
+    def _batch_failure(index: int, config: Dict[str, Any], error: Exception) -> BatchJobItemResult:
+        return BatchJobItemResult(
+            index=index,
+            status="FAILED",
+            job_id=config.get("jobId"),
+            name=config.get("jobName"),
+            error=str(error),
         )
 
-    def get_job(self, job_id: str) -> Dict[str, Any]:
-        return self.client.get_job(job_id)
+    @staticmethod
+    def _job_cache_ttl(info: Dict[str, Any]) -> float:
+        state = job_state(info)
+        if state in TERMINAL_STATES:
+            return settings.JOB_CACHE_TTL_TERMINAL
+        if state == "RUNNING":
+            return settings.JOB_CACHE_TTL_RUNNING
+        return settings.JOB_CACHE_TTL_DEFAULT
 
-    def get_job_status(self, job_id: str) -> str:
-        response = self.client.get_job(job_id)
-        return response.get("status", "UNKNOWN")
+    async def _load_job(self, job_id: str) -> Dict[str, Any]:
+        cluster, info = await self.clusters.find(job_id)
+        if info is not None:
+            # Searching the clusters already fetched it from the one that has it
+            return info
+        return await self.clusters.client(cluster).get_job(job_id)
+
+    async def get_job(self, job_id: str) -> Dict[str, Any]:
+        return await self.job_cache.get_or_load(
+            str(job_id),
+            lambda: self._load_job(job_id),
+            ttl=self._job_cache_ttl,
+        )
+
+    async def get_job_status(self, job_id: str) -> str:
+        response = await self.get_job(job_id)
+        return job_state(response) or "UNKNOWN"
     
-    def stop_job(self, job_id: str, save_point: bool = False) -> None:
-        stop_config = {
-            "jobId": job_id,
-            "isStopWithSavePoint": save_point
-        }
-        self.client._request("POST", "/stop-job", data=stop_config)
\ No newline at end of file
+    async def stop_job(self, job_id: str, save_point: bool = False) -> None:
+        try:
+            client = await self.clusters.client_for(job_id)
+            await client.stop_job(job_id, save_point)
+        finally:
+            self.job_cache.invalidate(str(job_id))
+
+    async def restart_with_savepoint(self, job_id: str, config: Dict[str, Any]) -> None:
+        """Stop ``job_id`` with a savepoint and resubmit ``config`` to resume from it"""
+        await self.stop_job(job_id, save_point=True)
+        # The savepoint lives on the job's own cluster, so it resumes there
+        client = await self.clusters.client_for(job_id)
+        deadline = asyncio.get_running_loop().time() + settings.CDC_SAVEPOINT_TIMEOUT
+        while True:
+            # Straight to the client: a cached RUNNING answer would only delay us
+            state = job_state(await client.get_job(job_id))
+            if state == "SAVEPOINT_DONE":
+                break
+            if state in TERMINAL_STATES:
+                raise RuntimeError(f"Job {job_id} ended as {state} instead of taking a savepoint")
+            if asyncio.get_running_loop().time() >= deadline:
+                raise TimeoutError(f"Job {job_id} took no savepoint within {settings.CDC_SAVEPOINT_TIMEOUT}s")
+            await asyncio.sleep(1)
+        try:
+            await client.create_job({**config, "jobId": job_id}, start_with_savepoint=True)
+        finally:
+            self.job_cache.invalidate(str(job_id))
+
+
+    async def _scan_cluster(self, cluster: str) -> List[JobSummary]:
+        client = self.clusters.client(cluster)
+        running, finished = await asyncio.gather(client.get_running_jobs(), client.get_finished_jobs())
+        return [job_summary(info, cluster) for info in [*(running or []), *(finished or [])]]
+
+    async def _scan_jobs(self) -> Dict[str, JobSummary]:
+        names = list(self.clusters.clients)
+        scans = await asyncio.gather(*(self._scan_cluster(name) for name in names), return_exceptions=True)
+        failures = [scan for scan in scans if isinstance(scan, Exception)]
+        if failures and len(failures) == len(scans):
+            raise failures[0]
+        index: Dict[str, JobSummary] = {}
+        for name, scan in zip(names, scans):
+            if isinstance(scan, Exception):
+                logger.warning(f"Job scan of cluster {name} failed: {str(scan)}")
+                continue
+            for summary in scan:
+                # Finished entries come last, so a job that ended mid-scan shows as ended
+                index[summary.job_id] = summary
+                self.clusters.remember(summary.job_id, name)
+        return index
+
+    async def job_index(self) -> Dict[str, JobSummary]:
+        return await self.job_index_cache.get_or_load("jobs", self._scan_jobs)
+
+    async def list_jobs(
+        self,
+        states: Optional[List[str]] = None,
+        name: Optional[str] = None,
+        offset: int = 0,
+        limit: int = 50,
+    ) -> Tuple[int, List[JobSummary]]:
+        """Jobs matching ``states`` and a case-insensitive ``name`` substring, newest first"""
+        wanted = {state.upper() for state in states} if states else None
+        needle = name.lower() if name else None
+        matches = [
+            summary for summary in (await self.job_index()).values()
+            if (wanted is None or (summary.state or "").upper() in wanted)
+            and (needle is None or needle in (summary.name or "").lower())
+        ]
+        matches.sort(key=lambda summary: (summary.created_at or "", summary.job_id), reverse=True)
+        return len(matches), matches[offset:offset + limit]
+
+    async def jobs_status(self, job_ids: List[str]) -> JobStatusResponse:
+        """Summaries of many jobs from the shared scan.
+
+        Jobs missing from it (e.g. submitted after the scan) are looked up one
+        by one, up to ``JOB_STATUS_FALLBACK_MAX`` of them.
+        """
+        index = await self.job_index()
+        job_ids = list(dict.fromkeys(str(job_id) for job_id in job_ids))
+        jobs = {job_id: index[job_id] for job_id in job_ids if job_id in index}
+        unseen = [job_id for job_id in job_ids if job_id not in jobs]
+        lookups = unseen[:settings.JOB_STATUS_FALLBACK_MAX]
+        semaphore = asyncio.Semaphore(max(1, settings.BATCH_SUBMIT_CONCURRENCY))
+
+        async def lookup(job_id: str) -> None:
+            async with semaphore:
+                try:
+                    info = await self.get_job(job_id)
+                except Exception:
+                    return
+            if job_state(info):
+                jobs[job_id] = job_summary(info, await self.clusters.locate(job_id))
+
+        await asyncio.gather(*(lookup(job_id) for job_id in lookups))
+        return JobStatusResponse(
+            jobs={job_id: jobs[job_id] for job_id in job_ids if job_id in jobs},
+            missing=[job_id for job_id in job_ids if job_id not in jobs],
+        )
@@ -0,0 +1,155 @@
+import asyncio
+import logging
+import time
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from typing import Any, AsyncIterator, Dict, Iterable, Optional, Set
+
+from app.config.setting import settings
+from app.models.job import TERMINAL_STATES, job_state
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class _JobPoller:
+    job_id: str
+    subscribers: Set[asyncio.Queue] = field(default_factory=set)
+    task: Optional[asyncio.Task] = None
+    last_info: Dict[str, Any] = field(default_factory=dict)
+    last_error: Optional[str] = None
+    interval: float = 0.0
+    done: bool = False
+
+
+class JobStatusBroker:
+    """Streams job status changes to any number of subscribers.
+
+    Each watched job has exactly one background poller, however many clients
+    follow it, and only fields that changed since the previous poll are
+    published. Polling is fast right after submit or a change and backs off
+    towards the slow interval while a job sits in the same state.
+    """
+
+    def __init__(
+        self,
+        job_service,
+        fast_interval: Optional[float] = None,
+        slow_interval: Optional[float] = None,
+        fast_period: Optional[float] = None,
+        backoff: Optional[float] = None,
+        queue_size: int = 100,
+    ):
+        self.job_service = job_service
+        self.fast_interval = fast_interval or settings.JOB_POLL_FAST_INTERVAL
+        self.slow_interval = slow_interval or settings.JOB_POLL_SLOW_INTERVAL
+        self.fast_period = fast_period if fast_period is not None else settings.JOB_POLL_FAST_PERIOD
+        self.backoff = backoff or settings.JOB_POLL_BACKOFF
+        self.queue_size = queue_size
+        self._pollers: Dict[str, _JobPoller] = {}
+        self._submitted_at: Dict[str, float] = {}
+
+    def mark_submitted(self, job_id: str) -> None:
+        """Record a fresh submission so its poller starts at the fast cadence"""
+        self._submitted_at[str(job_id)] = time.monotonic()
+        # Bound the map; only recent submissions matter
+        if len(self._submitted_at) > 10000:
+            cutoff = time.monotonic() - self.fast_period
+            self._submitted_at = {k: v for k, v in self._submitted_at.items() if v >= cutoff}
+
+    def poller_count(self) -> int:
+        return len(self._pollers)
+
+    @asynccontextmanager
+    async def subscribe(self, job_ids: Iterable[str]) -> AsyncIterator[asyncio.Queue]:
+        """Yield a queue of status events for ``job_ids`` until the caller leaves"""
+        queue: asyncio.Queue = asyncio.Queue(maxsize=self.queue_size)
+        pollers = []
+        for job_id in dict.fromkeys(str(job_id) for job_id in job_ids):
+            poller = self._pollers.get(job_id)
+            if poller is None:
+                poller = _JobPoller(job_id=job_id, interval=self.fast_interval)
+                self._pollers[job_id] = poller
+            poller.subscribers.add(queue)
+            pollers.append(poller)
+            if poller.last_info:
+                # Late joiners start from the current full state
+                self._offer(queue, self._event(poller, dict(poller.last_info)))
+            if poller.task is None:
+                poller.task = asyncio.create_task(self._poll(poller))
+        try:
+            yield queue
+        finally:
+            for poller in pollers:
+                poller.subscribers.discard(queue)
+                if not poller.subscribers:
+                    self._stop(poller)
+
+    def _stop(self, poller: _JobPoller) -> None:
+        if self._pollers.get(poller.job_id) is poller:
+            del self._pollers[poller.job_id]
+        if poller.task is not None and poller.task is not asyncio.current_task():
+            poller.task.cancel()
+
+    def _event(self, poller: _JobPoller, changes: Dict[str, Any]) -> Dict[str, Any]:
+        return {
+            "jobId": poller.job_id,
+            "jobStatus": job_state(poller.last_info),
+            "changes": changes,
+            "final": poller.done,
+        }
+
+    @staticmethod
+    def _offer(queue: asyncio.Queue, event: Dict[str, Any]) -> None:
+        # A slow consumer loses its oldest events rather than stalling the poller
+        if queue.full():
+            try:
+                queue.get_nowait()
+            except asyncio.QueueEmpty:
+                pass
+        queue.put_nowait(event)
+
+    def _publish(self, poller: _JobPoller, event: Dict[str, Any]) -> None:
+        for queue in list(poller.subscribers):
+            self._offer(queue, event)
+
+    def _next_interval(self, poller: _JobPoller, changed: bool) -> float:
+        submitted_at = self._submitted_at.get(poller.job_id)
+        recently_submitted = submitted_at is not None and time.monotonic() - submitted_at < self.fast_period
+        if changed or recently_submitted:
+            return self.fast_interval
+        return min(self.slow_interval, poller.interval * self.backoff)
+
+    async def _poll(self, poller: _JobPoller) -> None:
+        while poller.subscribers:
+            changed = False
+            try:
+                info = await self.job_service.get_job(poller.job_id)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                error = str(e)
+                if error != poller.last_error:
+                    poller.last_error = error
+                    self._publish(poller, {"jobId": poller.job_id, "error": error, "final": False})
+            else:
+                poller.last_error = None
+                info = info if isinstance(info, dict) else {}
+                changes = {key: value for key, value in info.items() if poller.last_info.get(key) != value}
+                if changes:
+                    changed = True
+                    poller.last_info = info
+                    poller.done = job_state(info) in TERMINAL_STATES
+                    self._publish(poller, self._event(poller, changes))
+                if poller.done:
+                    self._stop(poller)
+                    return
+
+            poller.interval = self._next_interval(poller, changed)
+            await asyncio.sleep(poller.interval)
+
+    async def close(self) -> None:
+        pollers = list(self._pollers.values())
+        for poller in pollers:
+            self._stop(poller)
+        await asyncio.gather(*(p.task for p in pollers if p.task is not None), return_exceptions=True)
@@ -0,0 +1,178 @@
+import asyncio
+import logging
+import math
+import time
+import uuid
+from collections import OrderedDict
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional, Tuple
+
+from app.config.setting import settings
+from app.models.job import SubmissionStatus
+from app.utils.metrics import SUBMISSIONS, SUBMIT_QUEUE_DEPTH
+
+logger = logging.getLogger(__name__)
+
+
+def _now() -> str:
+    return datetime.now(timezone.utc).isoformat()
+
+
+class TokenBucket:
+    """Allows ``rate`` acquisitions per second on average and ``burst`` at once"""
+
+    def __init__(self, rate: float, burst: int):
+        self.rate = rate
+        self.burst = max(1, burst)
+        self._tokens = float(self.burst)
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    async def acquire(self) -> None:
+        if self.rate <= 0:
+            return
+        # One waiter at a time, so tokens go out in arrival order
+        async with self._lock:
+            self._refill()
+            if self._tokens < 1:
+                await asyncio.sleep((1 - self._tokens) / self.rate)
+                self._refill()
+            self._tokens -= 1
+
+
+class SubmissionQueueFull(Exception):
+    """Raised when the submission queue has no room; ``retry_after`` is in seconds"""
+
+    def __init__(self, message: str, retry_after: int):
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
+class SubmissionQueue:
+    """Bounded queue of compiled jobs drained towards the master by a worker pool.
+
+    Callers get a tracking status back as soon as the job is queued, and a full
+    queue rejects immediately instead of letting requests wait on the master.
+    Workers share a token bucket, so bursts reach the master at a steady rate.
+    """
+
+    def __init__(
+        self,
+        job_service,
+        broker=None,
+        max_size: Optional[int] = None,
+        workers: Optional[int] = None,
+        rate: Optional[float] = None,
+        burst: Optional[int] = None,
+        retention: Optional[int] = None,
+    ):
+        self.job_service = job_service
+        self.broker = broker
+        self.workers = max(1, workers or settings.SUBMIT_WORKERS)
+        self.retention = retention or settings.SUBMIT_STATUS_RETENTION
+        self.bucket = TokenBucket(
+            settings.SUBMIT_RATE_LIMIT if rate is None else rate,
+            burst or settings.SUBMIT_BURST,
+        )
+        self._queue: asyncio.Queue = asyncio.Queue(maxsize=max_size or settings.SUBMIT_QUEUE_SIZE)
+        self._statuses: "OrderedDict[str, SubmissionStatus]" = OrderedDict()
+        self._tasks: List[asyncio.Task] = []
+        self._in_flight = 0
+
+    def submit(self, config: Dict[str, Any]) -> SubmissionStatus:
+        """Queue a compiled job; raises SubmissionQueueFull when there is no room"""
+        status = SubmissionStatus(
+            tracking_id=uuid.uuid4().hex,
+            job_id=config.get("jobId"),
+            name=config.get("jobName"),
+            queued_at=_now(),
+        )
+        try:
+            self._queue.put_nowait((status, config))
+        except asyncio.QueueFull:
+            SUBMISSIONS.labels("rejected").inc()
+            rate = self.bucket.rate if self.bucket.rate > 0 else self.workers
+            raise SubmissionQueueFull(
+                f"Submission queue is full ({self._queue.maxsize} jobs waiting)",
+                retry_after=max(1, math.ceil(self._queue.qsize() / rate)),
+            )
+        self._remember(status)
+        SUBMISSIONS.labels("accepted").inc()
+        SUBMIT_QUEUE_DEPTH.set(self._queue.qsize())
+        return status
+
+    def get(self, tracking_id: str) -> Optional[SubmissionStatus]:
+        return self._statuses.get(tracking_id)
+
+    def _remember(self, status: SubmissionStatus) -> None:
+        self._statuses[status.tracking_id] = status
+        if len(self._statuses) <= self.retention:
+            return
+        # Forget the oldest finished submission; queued ones stay trackable
+        for tracking_id, old in self._statuses.items():
+            if old.state in ("SUBMITTED", "FAILED"):
+                del self._statuses[tracking_id]
+                return
+
+    async def _submit(self, status: SubmissionStatus, config: Dict[str, Any]) -> None:
+        await self.bucket.acquire()
+        status.state = "SUBMITTING"
+        try:
+            response = await self.job_service.create_job(config.get("jobName"), config)
+        except Exception as e:
+            logger.error(f"Queued submission {status.tracking_id} failed: {str(e)}")
+            status.state = "FAILED"
+            status.error = str(e)
+            SUBMISSIONS.labels("failed").inc()
+        else:
+            status.state = "SUBMITTED"
+            status.job_id = response.job_id
+            status.cluster = response.cluster
+            SUBMISSIONS.labels("submitted").inc()
+            if self.broker is not None:
+                self.broker.mark_submitted(response.job_id)
+        finally:
+            status.finished_at = _now()
+
+    async def _work(self) -> None:
+        while True:
+            item: Tuple[SubmissionStatus, Dict[str, Any]] = await self._queue.get()
+            SUBMIT_QUEUE_DEPTH.set(self._queue.qsize())
+            self._in_flight += 1
+            try:
+                await self._submit(*item)
+            finally:
+                self._in_flight -= 1
+                self._queue.task_done()
+
+    def start(self) -> None:
+        if not self._tasks:
+            self._tasks = [asyncio.create_task(self._work()) for _ in range(self.workers)]
+
+    async def close(self) -> None:
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+        # Whatever is still queued never reached the master
+        while not self._queue.empty():
+            status, _ = self._queue.get_nowait()
+            status.state = "FAILED"
+            status.error = "API shut down before the job was submitted"
+            status.finished_at = _now()
+        SUBMIT_QUEUE_DEPTH.set(0)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "queued": self._queue.qsize(),
+            "capacity": self._queue.maxsize,
+            "in_flight": self._in_flight,
+            "workers": self.workers,
+            "rate_limit": self.bucket.rate,
+            "tracked": len(self._statuses),
+        }
@@ -0,0 +1,144 @@
+import asyncio
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional, Tuple, Union
+
+from app.utils.metrics import CACHE_EVICTIONS, CACHE_REQUESTS
+
+
+class TTLCache:
+    """In-process TTL cache with LRU eviction and single-flight loading.
+
+    Concurrent ``get_or_load`` calls for the same missing key share one loader
+    call instead of each hitting the backend. A ``name`` exports the lookup
+    counters to /metrics.
+    """
+
+    def __init__(self, ttl: float, max_entries: int, name: Optional[str] = None):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.name = name
+        # Counter children bound once; labelling on every lookup costs more than the lookup
+        self._metrics = None
+        if name is not None:
+            self._metrics = {
+                result: CACHE_REQUESTS.labels(name, result) for result in ("hit", "miss", "coalesced")
+            }
+            self._metrics["eviction"] = CACHE_EVICTIONS.labels(name)
+        self._entries: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+        # Invalidation drops a key's load from here so its result is not stored
+        self._in_flight: Dict[Hashable, asyncio.Task] = {}
+        self.hits = 0
+        self.misses = 0
+        self.coalesced = 0
+        self.evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _count(self, result: str) -> None:
+        if self._metrics is not None:
+            self._metrics[result].inc()
+
+    def _lookup(self, key: Hashable) -> Tuple[bool, Any]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return False, None
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            del self._entries[key]
+            return False, None
+        self._entries.move_to_end(key)
+        return True, value
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        found, value = self._lookup(key)
+        if found:
+            self.hits += 1
+            self._count("hit")
+            return value
+        self.misses += 1
+        self._count("miss")
+        return default
+
+    def set(self, key: Hashable, value: Any, ttl: Optional[float] = None) -> None:
+        ttl = self.ttl if ttl is None else ttl
+        if ttl <= 0 or self.max_entries <= 0:
+            return
+        self._entries[key] = (time.monotonic() + ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+            self._count("eviction")
+
+    async def get_or_load(
+        self,
+        key: Hashable,
+        loader: Callable[[], Awaitable[Any]],
+        ttl: Optional[Union[float, Callable[[Any], float]]] = None,
+        should_cache: Optional[Callable[[Any], bool]] = None,
+    ) -> Any:
+        """Return the cached value for ``key`` or load it once for all waiters.
+
+        ``ttl`` may be a function of the loaded value, for values whose
+        freshness depends on their content.
+        """
+        found, value = self._lookup(key)
+        if found:
+            self.hits += 1
+            self._count("hit")
+            return value
+
+        task = self._in_flight.get(key)
+        if task is not None:
+            self.coalesced += 1
+            self._count("coalesced")
+            return await asyncio.shield(task)
+
+        self.misses += 1
+        self._count("miss")
+
+        async def load() -> Any:
+            try:
+                result = await loader()
+                if self._in_flight.get(key) is task and (should_cache is None or should_cache(result)):
+                    self.set(key, result, ttl(result) if callable(ttl) else ttl)
+                return result
+            finally:
+                if self._in_flight.get(key) is task:
+                    del self._in_flight[key]
+
+        task = asyncio.ensure_future(load())
+        self._in_flight[key] = task
+        # Shield so a cancelled caller does not cancel the load for the others
+        return await asyncio.shield(task)
+
+    def invalidate(self, key: Hashable) -> None:
+        self._entries.pop(key, None)
+        self._in_flight.pop(key, None)
+
+    def invalidate_where(self, predicate: Callable[[Hashable], bool]) -> int:
+        keys = [key for key in self._entries if predicate(key)]
+        for key in keys:
+            del self._entries[key]
+        for key in [key for key in self._in_flight if predicate(key)]:
+            del self._in_flight[key]
+        return len(keys)
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._in_flight.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        lookups = self.hits + self.misses + self.coalesced
+        return {
+            "entries": len(self._entries),
+            "max_entries": self.max_entries,
+            "ttl": self.ttl,
+            "hits": self.hits,
+            "misses": self.misses,
+            "coalesced": self.coalesced,
+            "evictions": self.evictions,
+            "hit_ratio": (self.hits + self.coalesced) / lookups if lookups else 0.0,
+        }
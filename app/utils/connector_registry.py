@@ -0,0 +1,265 @@
+import asyncio
+import hashlib
+import logging
+import time
+from dataclasses import dataclass, replace
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+from app.config.setting import settings
+from app.utils.db_connector import ConnectorFactory, DBConfig, DBConnector
+
+logger = logging.getLogger(__name__)
+
+RegistryKey = Tuple[str, str, int, str, str, str, str]
+
+
+@dataclass
+class _RegistryEntry:
+    key: RegistryKey
+    db_type: str
+    host: str
+    connector: DBConnector
+    pool_size: int
+    leases: int = 0
+    last_used: float = 0.0
+    healthy: bool = True
+    # Failed a health check while leased; closed when the last lease ends
+    retiring: bool = False
+
+
+class ConnectorRegistry:
+    """Application-wide registry of database connectors.
+
+    Connectors are shared between callers whose DBConfig normalizes to the same
+    key, so every schema lookup against one source reuses one warm pool. The
+    registry also caps the total pool size per database host, evicts pools
+    nobody has used for a while and health-checks the rest in the background.
+    """
+
+    def __init__(
+        self,
+        max_connections_per_host: Optional[int] = None,
+        idle_timeout: Optional[float] = None,
+        health_check_interval: Optional[float] = None,
+    ):
+        self.max_connections_per_host = max_connections_per_host or settings.DB_MAX_CONNECTIONS_PER_HOST
+        self.idle_timeout = idle_timeout or settings.DB_POOL_IDLE_TIMEOUT
+        self.health_check_interval = health_check_interval or settings.DB_HEALTH_CHECK_INTERVAL
+        self._entries: Dict[RegistryKey, _RegistryEntry] = {}
+        # Connection budget reserved per host, including pools still connecting
+        self._reserved: Dict[str, int] = {}
+        self._locks: Dict[RegistryKey, asyncio.Lock] = {}
+        # Broken pools still leased by a caller, no longer handed out
+        self._retiring: List[_RegistryEntry] = []
+        self._closing: Set[asyncio.Task] = set()
+        self._task: Optional[asyncio.Task] = None
+
+    @staticmethod
+    def normalize_key(db_type: str, config: DBConfig) -> RegistryKey:
+        # Only a digest of the password goes into the key
+        password_digest = hashlib.sha256((config.password or "").encode()).hexdigest()
+        return (
+            db_type.strip().lower(),
+            config.host.strip().lower(),
+            int(config.port),
+            (config.username or "").strip(),
+            (config.database or "").strip(),
+            (config.service_name or "").strip().lower(),
+            password_digest,
+        )
+
+    def _find(self, connector: DBConnector) -> Optional[_RegistryEntry]:
+        for entry in self._entries.values():
+            if entry.connector is connector:
+                return entry
+        for entry in self._retiring:
+            if entry.connector is connector:
+                return entry
+        return None
+
+    def owns(self, connector: DBConnector) -> bool:
+        return self._find(connector) is not None
+
+    def connectors(self) -> Dict[str, DBConnector]:
+        """Pooled connectors keyed by a readable ``db_type://host:port/database`` name"""
+        return {
+            f"{entry.db_type}://{entry.host}:{entry.key[2]}/{entry.key[4] or entry.key[5]}": entry.connector
+            for entry in self._entries.values()
+        }
+
+    async def acquire(self, db_type: str, config: DBConfig) -> Optional[DBConnector]:
+        """Lease a shared, connected connector for ``config``; release it when done"""
+        key = self.normalize_key(db_type, config)
+        entry = self._entries.get(key)
+        if entry is None:
+            lock = self._locks.setdefault(key, asyncio.Lock())
+            async with lock:
+                entry = self._entries.get(key)
+                if entry is None:
+                    entry = await self._create(key, db_type, config)
+                    if entry is None:
+                        return None
+        entry.leases += 1
+        entry.last_used = time.monotonic()
+        return entry.connector
+
+    def release(self, connector: DBConnector) -> None:
+        entry = self._find(connector)
+        if entry is not None:
+            entry.leases = max(0, entry.leases - 1)
+            entry.last_used = time.monotonic()
+            if entry.retiring and entry.leases == 0:
+                task = asyncio.get_running_loop().create_task(self._remove(entry))
+                self._closing.add(task)
+                task.add_done_callback(self._closing.discard)
+
+    async def _create(self, key: RegistryKey, db_type: str, config: DBConfig) -> Optional[_RegistryEntry]:
+        host = key[1]
+        budget = self.max_connections_per_host - self._reserved.get(host, 0)
+        if budget < max(1, config.pool_min):
+            await self._evict_idle(host=host, force=True)
+            budget = self.max_connections_per_host - self._reserved.get(host, 0)
+        if budget < max(1, config.pool_min):
+            logger.error(
+                f"Connection budget for host '{host}' exhausted "
+                f"({self.max_connections_per_host} connections in use)"
+            )
+            return None
+
+        pool_max = min(config.pool_max, budget)
+        sized = replace(config, pool_min=min(config.pool_min, pool_max), pool_max=pool_max)
+        connector = ConnectorFactory.create_connector(db_type, sized)
+        if connector is None:
+            return None
+
+        # Reserve before connecting so concurrent creations respect the cap
+        self._reserved[host] = self._reserved.get(host, 0) + pool_max
+        try:
+            connected = await connector.connect()
+        except Exception as e:
+            logger.error(f"Failed to connect {db_type} connector for '{host}': {str(e)}")
+            connected = False
+        if not connected:
+            self._reserved[host] -= pool_max
+            return None
+
+        entry = _RegistryEntry(
+            key=key,
+            db_type=db_type,
+            host=host,
+            connector=connector,
+            pool_size=pool_max,
+            last_used=time.monotonic(),
+        )
+        self._entries[key] = entry
+        return entry
+
+    def _retire(self, entry: _RegistryEntry) -> None:
+        # New callers get a fresh pool; the current ones keep theirs until released
+        if self._entries.get(entry.key) is entry:
+            del self._entries[entry.key]
+            self._locks.pop(entry.key, None)
+        entry.retiring = True
+        self._retiring.append(entry)
+
+    async def _remove(self, entry: _RegistryEntry) -> None:
+        if self._entries.get(entry.key) is entry:
+            del self._entries[entry.key]
+            self._locks.pop(entry.key, None)
+        self._retiring = [other for other in self._retiring if other is not entry]
+        self._reserved[entry.host] = max(0, self._reserved.get(entry.host, 0) - entry.pool_size)
+        try:
+            await entry.connector.close()
+        except Exception as e:
+            logger.warning(f"Error closing {entry.db_type} connector for '{entry.host}': {str(e)}")
+
+    async def _evict_idle(self, host: Optional[str] = None, force: bool = False) -> int:
+        """Close unleased pools; idle-timeout-expired ones only unless ``force``"""
+        now = time.monotonic()
+        candidates = sorted(
+            (
+                entry for entry in self._entries.values()
+                if entry.leases == 0
+                and (host is None or entry.host == host)
+                and (force or now - entry.last_used >= self.idle_timeout)
+            ),
+            key=lambda entry: entry.last_used,
+        )
+        for entry in candidates:
+            await self._remove(entry)
+        return len(candidates)
+
+    async def warm(self, sources: Iterable[Dict[str, Any]]) -> None:
+        """Open pools for the configured source databases ahead of first use"""
+        async def warm_one(source: Dict[str, Any]) -> None:
+            spec = dict(source)
+            db_type = spec.pop("db_type", "postgresql")
+            connector = await self.acquire(db_type, DBConfig(**spec))
+            if connector is not None:
+                self.release(connector)
+            else:
+                logger.warning(f"Could not warm {db_type} connector for '{spec.get('host')}'")
+
+        await asyncio.gather(*(warm_one(source) for source in sources), return_exceptions=True)
+
+    async def check_health(self) -> None:
+        await self._evict_idle()
+        for entry in list(self._entries.values()):
+            try:
+                entry.healthy = await entry.connector.ping()
+            except Exception as e:
+                logger.warning(f"Health check failed for {entry.db_type} '{entry.host}': {str(e)}")
+                entry.healthy = False
+            if not entry.healthy:
+                # Drop the broken pool and its host budget; a leased one is closed
+                # by its last release so the caller's query is not cut off
+                if entry.leases == 0:
+                    await self._remove(entry)
+                else:
+                    self._retire(entry)
+
+    async def _health_loop(self) -> None:
+        while True:
+            await asyncio.sleep(self.health_check_interval)
+            try:
+                await self.check_health()
+            except Exception as e:
+                logger.error(f"Connector health check loop error: {str(e)}")
+
+    def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self._health_loop())
+
+    async def close(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        if self._closing:
+            await asyncio.gather(*self._closing, return_exceptions=True)
+        entries = list(self._entries.values()) + list(self._retiring)
+        await asyncio.gather(*(self._remove(entry) for entry in entries))
+
+    def stats(self) -> Dict[str, Any]:
+        now = time.monotonic()
+        pools: List[Dict[str, Any]] = [
+            {
+                "db_type": entry.db_type,
+                "host": entry.host,
+                "port": entry.key[2],
+                "database": entry.key[4] or entry.key[5] or None,
+                "pool_size": entry.pool_size,
+                "leases": entry.leases,
+                "idle_seconds": round(now - entry.last_used, 1),
+                "healthy": entry.healthy,
+            }
+            for entry in self._entries.values()
+        ]
+        return {
+            "max_connections_per_host": self.max_connections_per_host,
+            "hosts": dict(self._reserved),
+            "pools": pools,
+        }
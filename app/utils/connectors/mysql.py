@@ -0,0 +1,166 @@
+import logging
+from typing import Any, Dict, List, Optional
+
+import aiomysql
+
+from app.utils.db_connector import DBConnector, retry_on_failure
+
+logger = logging.getLogger(__name__)
+
+
+class MySQLConnector(DBConnector):
+    """MySQL async connector implementation"""
+
+    dialect = "mysql"
+    
+    async def connect(self) -> bool:
+        try:
+            self.pool = await aiomysql.create_pool(
+                host=self.config.host,
+                port=self.config.port,
+                user=self.config.username,
+                password=self.config.password,
+                db=self.config.database,
+                minsize=self.config.pool_min,
+                maxsize=self.config.pool_max
+            )
+            return True
+        except Exception as e:
+            logger.error(f"Failed to connect to MySQL: {str(e)}")
+            return False
+
+    def pool_stats(self) -> Dict[str, int]:
+        if not self.pool:
+            return super().pool_stats()
+        condition = getattr(self.pool, "_cond", None)
+        return {
+            "size": self.pool.size,
+            "in_use": self.pool.size - self.pool.freesize,
+            "waiters": len(getattr(condition, "_waiters", None) or ()),
+        }
+
+    async def ping(self) -> bool:
+        if not self.pool:
+            return False
+        async with self.pool.acquire() as conn:
+            async with conn.cursor() as cursor:
+                await cursor.execute("SELECT 1")
+                return (await cursor.fetchone())[0] == 1
+
+    @retry_on_failure
+    async def get_tables(self, database: Optional[str] = None, schema: Optional[str] = None) -> List[str]:
+        if not self.pool:
+            if not await self.connect():
+                return []
+        
+        db = database or self.config.database
+        if not db:
+            logger.error("Database name is required for MySQL")
+            return []
+            
+        async with self.pool.acquire() as conn:
+            async with conn.cursor() as cursor:
+                await cursor.execute("SHOW TABLES")
+                tables = [row[0] for row in await cursor.fetchall()]
+                return tables
+
+    @retry_on_failure
+    async def get_columns(self, table: str, database: Optional[str] = None, schema: Optional[str] = None) -> Dict[str, str]:
+        if not self.pool:
+            if not await self.connect():
+                return {}
+        
+        db = database or self.config.database
+        if not db:
+            logger.error("Database name is required for MySQL")
+            return {}
+            
+        async with self.pool.acquire() as conn:
+            async with conn.cursor() as cursor:
+                await cursor.execute(f"DESCRIBE {table}")
+                columns = {
+                    row[0]: self._map_type_to_seatunnel(row[1])
+                    for row in await cursor.fetchall()
+                }
+                return columns
+
+    @retry_on_failure
+    async def get_columns_bulk(
+        self,
+        tables: Optional[List[str]] = None,
+        database: Optional[str] = None,
+        schema: Optional[str] = None
+    ) -> Dict[str, Dict[str, str]]:
+        if not self.pool:
+            if not await self.connect():
+                return {}
+
+        db = database or self.config.database
+        if not db:
+            logger.error("Database name is required for MySQL")
+            return {}
+
+        query = """
+            SELECT table_name, column_name, column_type
+            FROM information_schema.columns
+            WHERE table_schema = %s
+        """
+        params: List[Any] = [db]
+        if tables is not None:
+            if not tables:
+                return {}
+            query += f" AND table_name IN ({', '.join(['%s'] * len(tables))})"
+            params.extend(tables)
+        query += " ORDER BY table_name, ordinal_position"
+
+        async with self.pool.acquire() as conn:
+            async with conn.cursor() as cursor:
+                await cursor.execute(query, params)
+                columns: Dict[str, Dict[str, str]] = {}
+                for table_name, column_name, column_type in await cursor.fetchall():
+                    columns.setdefault(table_name, {})[column_name] = self._map_type_to_seatunnel(column_type)
+                return columns
+
+    @retry_on_failure
+    async def get_table_stats(
+        self,
+        tables: Optional[List[str]] = None,
+        database: Optional[str] = None,
+        schema: Optional[str] = None
+    ) -> Dict[str, Dict[str, int]]:
+        if not self.pool:
+            if not await self.connect():
+                return {}
+
+        db = database or self.config.database
+        if not db:
+            logger.error("Database name is required for MySQL")
+            return {}
+
+        # table_rows is an estimate for InnoDB, which is all a planner needs
+        query = """
+            SELECT table_name, COALESCE(table_rows, 0), COALESCE(data_length, 0) + COALESCE(index_length, 0),
+                   COALESCE(avg_row_length, 0)
+            FROM information_schema.tables
+            WHERE table_schema = %s AND table_type = 'BASE TABLE'
+        """
+        params: List[Any] = [db]
+        if tables is not None:
+            if not tables:
+                return {}
+            query += f" AND table_name IN ({', '.join(['%s'] * len(tables))})"
+            params.extend(tables)
+
+        async with self.pool.acquire() as conn:
+            async with conn.cursor() as cursor:
+                await cursor.execute(query, params)
+                return {
+                    table_name: {"rows": int(rows), "bytes": int(size), "row_width": int(width)}
+                    for table_name, rows, size, width in await cursor.fetchall()
+                }
+
+    async def close(self) -> None:
+        if self.pool:
+            self.pool.close()
+            await self.pool.wait_closed()
+            self.pool = None
@@ -0,0 +1,197 @@
+import logging
+from typing import Any, Dict, List, Optional
+
+import oracledb
+
+from app.config.setting import settings
+from app.utils.db_connector import DBConnector, retry_on_failure
+
+logger = logging.getLogger(__name__)
+
+
+def column_type(data_type: str, precision: Optional[int], scale: Optional[int]) -> str:
+    """Full type of an all_tab_columns row, e.g. ``NUMBER(10,2)``.
+
+    data_type alone is just ``NUMBER``; precision and scale sit in their own
+    columns. INTEGER columns are NUMBER with no precision and scale 0.
+    """
+    if data_type != "NUMBER":
+        return data_type
+    if precision is not None:
+        return f"NUMBER({int(precision)},{int(scale or 0)})"
+    if scale == 0:
+        return "INTEGER"
+    return data_type
+
+
+class OracleConnector(DBConnector):
+    """Oracle async connector implementation.
+
+    Uses python-oracledb's thin-mode asyncio pool, so catalog queries never
+    block the event loop. Thick mode (init_oracle_client) has no asyncio
+    support and is deliberately not enabled here.
+    """
+
+    dialect = "oracle"
+    
+    async def connect(self) -> bool:
+        try:
+            self.pool = oracledb.create_pool_async(
+                user=self.config.username,
+                password=self.config.password,
+                dsn=f"{self.config.host}:{self.config.port}/{self.config.service_name}",
+                min=self.config.pool_min,
+                max=self.config.pool_max,
+                increment=1
+            )
+            return True
+        except Exception as e:
+            logger.error(f"Failed to connect to Oracle: {str(e)}")
+            return False
+
+    def pool_stats(self) -> Dict[str, int]:
+        if not self.pool:
+            return super().pool_stats()
+        # python-oracledb does not expose the number of callers waiting
+        return {"size": self.pool.opened, "in_use": self.pool.busy, "waiters": 0}
+
+    def _cursor(self, conn):
+        cursor = conn.cursor()
+        # Fewer round trips on wide all_tab_columns scans
+        cursor.arraysize = settings.ORACLE_ARRAYSIZE
+        cursor.prefetchrows = settings.ORACLE_PREFETCHROWS
+        return cursor
+
+    async def ping(self) -> bool:
+        if not self.pool:
+            return False
+        async with self.pool.acquire() as conn:
+            with self._cursor(conn) as cursor:
+                await cursor.execute("SELECT 1 FROM dual")
+                return (await cursor.fetchone())[0] == 1
+
+    @retry_on_failure
+    async def get_tables(self, database: Optional[str] = None, schema: Optional[str] = None) -> List[str]:
+        if not self.pool:
+            if not await self.connect():
+                return []
+        
+        owner = schema or self.config.username.upper()
+        async with self.pool.acquire() as conn:
+            with self._cursor(conn) as cursor:
+                await cursor.execute(
+                    "SELECT table_name FROM all_tables WHERE owner = :owner",
+                    {"owner": owner}
+                )
+                tables = [row[0] for row in await cursor.fetchall()]
+                return tables
+
+    @retry_on_failure
+    async def get_columns(self, table: str, database: Optional[str] = None, schema: Optional[str] = None) -> Dict[str, str]:
+        if not self.pool:
+            if not await self.connect():
+                return {}
+        
+        owner = schema or self.config.username.upper()
+        async with self.pool.acquire() as conn:
+            with self._cursor(conn) as cursor:
+                await cursor.execute(
+                    """
+                    SELECT column_name, data_type, data_precision, data_scale
+                    FROM all_tab_columns 
+                    WHERE owner = :owner AND table_name = :table
+                    ORDER BY column_id
+                    """,
+                    {"owner": owner, "table": table.upper()}
+                )
+                columns = {
+                    name: self._map_type_to_seatunnel(column_type(data_type, precision, scale))
+                    for name, data_type, precision, scale in await cursor.fetchall()
+                }
+                return columns
+
+    # Oracle caps IN lists at 1000 expressions
+    _BULK_IN_LIMIT = 1000
+
+    @retry_on_failure
+    async def get_columns_bulk(
+        self,
+        tables: Optional[List[str]] = None,
+        database: Optional[str] = None,
+        schema: Optional[str] = None
+    ) -> Dict[str, Dict[str, str]]:
+        if not self.pool:
+            if not await self.connect():
+                return {}
+
+        owner = schema or self.config.username.upper()
+        query = """
+            SELECT table_name, column_name, data_type, data_precision, data_scale
+            FROM all_tab_columns
+            WHERE owner = :owner
+        """
+        if tables is None:
+            batches = [None]
+        else:
+            names = [table.upper() for table in tables]
+            batches = [names[i:i + self._BULK_IN_LIMIT] for i in range(0, len(names), self._BULK_IN_LIMIT)]
+
+        columns: Dict[str, Dict[str, str]] = {}
+        async with self.pool.acquire() as conn:
+            with self._cursor(conn) as cursor:
+                for batch in batches:
+                    params: Dict[str, Any] = {"owner": owner}
+                    sql = query
+                    if batch is not None:
+                        binds = [f":t{i}" for i in range(len(batch))]
+                        sql += f" AND table_name IN ({', '.join(binds)})"
+                        params.update({f"t{i}": name for i, name in enumerate(batch)})
+                    await cursor.execute(sql + " ORDER BY table_name, column_id", params)
+                    for table_name, column_name, data_type, precision, scale in await cursor.fetchall():
+                        columns.setdefault(table_name, {})[column_name] = \
+                            self._map_type_to_seatunnel(column_type(data_type, precision, scale))
+        return columns
+
+    @retry_on_failure
+    async def get_table_stats(
+        self,
+        tables: Optional[List[str]] = None,
+        database: Optional[str] = None,
+        schema: Optional[str] = None
+    ) -> Dict[str, Dict[str, int]]:
+        if not self.pool:
+            if not await self.connect():
+                return {}
+
+        # Optimizer statistics; the segment views need DBA privileges, so size is rows * avg_row_len
+        owner = schema or self.config.username.upper()
+        query = """
+            SELECT table_name, NVL(num_rows, 0), NVL(num_rows, 0) * NVL(avg_row_len, 0), NVL(avg_row_len, 0)
+            FROM all_tables
+            WHERE owner = :owner
+        """
+        if tables is None:
+            batches = [None]
+        else:
+            names = [table.upper() for table in tables]
+            batches = [names[i:i + self._BULK_IN_LIMIT] for i in range(0, len(names), self._BULK_IN_LIMIT)]
+
+        stats: Dict[str, Dict[str, int]] = {}
+        async with self.pool.acquire() as conn:
+            with self._cursor(conn) as cursor:
+                for batch in batches:
+                    params: Dict[str, Any] = {"owner": owner}
+                    sql = query
+                    if batch is not None:
+                        binds = [f":t{i}" for i in range(len(batch))]
+                        sql += f" AND table_name IN ({', '.join(binds)})"
+                        params.update({f"t{i}": name for i, name in enumerate(batch)})
+                    await cursor.execute(sql, params)
+                    for table_name, rows, size, width in await cursor.fetchall():
+                        stats[table_name] = {"rows": int(rows), "bytes": int(size), "row_width": int(width)}
+        return stats
+
+    async def close(self) -> None:
+        if self.pool:
+            await self.pool.close()
+            self.pool = None
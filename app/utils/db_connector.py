@@ -1,15 +1,19 @@
-from typing import Dict, List, Any, Optional, Union
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, List, Optional, Tuple, Type, Union, TYPE_CHECKING
 import json
 import logging
 import asyncio
+import importlib
+import threading
 from abc import ABC, abstractmethod
+from contextlib import asynccontextmanager
 from dataclasses import dataclass
 from functools import wraps
-import asyncpg
-import aiomysql
-import oracledb
-from tenacity import retry, stop_after_attempt, wait_exponential
-import re
+from app.config.setting import settings
+from app.utils.cache import TTLCache
+from app.utils.profiling import phase
+from app.utils.type_mapping import map_type
+if TYPE_CHECKING:
+    from app.utils.connector_registry import ConnectorRegistry
 # Logging configuration
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -28,18 +32,31 @@ class DBConfig:
 
 def retry_on_failure(func):
     """Decorator for retrying database operations"""
+    # tenacity is imported on the first call, not when connector modules load
+    retrying = None
+
     @wraps(func)
-    @retry(stop=stop_after_attempt(3), wait=wait_exponential(multiplier=1, min=2, max=10))
     async def wrapper(*args, **kwargs):
-        return await func(*args, **kwargs)
+        nonlocal retrying
+        if retrying is None:
+            from tenacity import retry, stop_after_attempt, wait_exponential
+            retrying = retry(stop=stop_after_attempt(3), wait=wait_exponential(multiplier=1, min=2, max=10))(func)
+        return await retrying(*args, **kwargs)
     return wrapper
 
 class DBConnector(ABC):
     """Abstract base class for database connectors"""
+
+    # Key into app.utils.type_mapping.TYPE_MAPPERS
+    dialect: str = ""
     
     def __init__(self, config: DBConfig):
         self.config = config
         self.pool = None
+
+    @classmethod
+    def initialize_driver(cls) -> None:
+        """One-time, process-wide driver setup; run by ConnectorFactory before first use"""
         
     @abstractmethod
     async def connect(self) -> bool:
@@ -56,260 +73,102 @@ class DBConnector(ABC):
         """Get column names and types for a specific table"""
         pass
 
-    @abstractmethod
-    async def close(self) -> None:
-        """Close the database connection pool"""
-        pass
-
-class PostgreSQLConnector(DBConnector):
-    
-    async def connect(self) -> bool:
-        try:
-            self.pool = await asyncpg.create_pool(
-                host=self.config.host,
-                port=self.config.port,
-                user=self.config.username,
-                password=self.config.password,
-                database=self.config.database,
-                min_size=self.config.pool_min,
-                max_size=self.config.pool_max
-            )
-            return True
-        except Exception as e:
-            logger.error(f"Failed to connect to PostgreSQL: {str(e)}")
-            return False
+    async def ping(self) -> bool:
+        """Check that the pool can still serve a trivial query"""
+        return self.pool is not None
 
-    @retry_on_failure
-    async def get_tables(self, database: Optional[str] = None, schema: str = "public") -> List[str]:
-        if not self.pool:
-            if not await self.connect():
-                return []
-        
-        async with self.pool.acquire() as conn:
-            query = """
-            SELECT table_name 
-            FROM information_schema.tables 
-            WHERE table_schema = $1
-            """
-            tables = [row['table_name'] for row in await conn.fetch(query, schema)]
-            return tables
-
-    @retry_on_failure
-    async def get_columns(self, table: str, database: Optional[str] = None, schema: str = "public") -> Dict[str, str]:
-        if not self.pool:
-            if not await self.connect():
-                return {}
-        
-        async with self.pool.acquire() as conn:
-            query = """
-            SELECT column_name, data_type
-            FROM information_schema.columns
-            WHERE table_schema = $1 AND table_name = $2
-            """
-            columns = {
-                row['column_name']: self._map_type_to_seatunnel(row['data_type']) 
-                for row in await conn.fetch(query, schema, table)
-            }
-            return columns
-
-    def _map_type_to_seatunnel(self, pg_type: str) -> str:
-        """Map database types to SeaTunnel compatible types"""
-        type_mapping = {
-            "integer": "int",
-            "bigint": "long",
-            "smallint": "short",
-            "character varying": "string",
-            "varchar": "string",
-            "text": "string",
-            "double precision": "double",
-            "numeric": "decimal",
-            "real": "float",
-            "boolean": "boolean",
-            "date": "date",
-            "timestamp": "timestamp",
-            "time": "time"
-        }
-        return type_mapping.get(pg_type.lower(), "string")
+    def pool_stats(self) -> Dict[str, int]:
+        """Open connections, connections checked out and callers waiting for one"""
+        return {"size": 0, "in_use": 0, "waiters": 0}
 
-    async def close(self) -> None:
-        if self.pool:
-            await self.pool.close()
-            self.pool = None
+    async def get_columns_bulk(
+        self,
+        tables: Optional[List[str]] = None,
+        database: Optional[str] = None,
+        schema: Optional[str] = None
+    ) -> Dict[str, Dict[str, str]]:
+        """Get columns for many tables (all tables when None), keyed by table name"""
+        if tables is None:
+            tables = await self.get_tables(database, schema)
+        results = await asyncio.gather(
+            *(self.get_columns(table, database, schema) for table in tables)
+        )
+        return {table: columns for table, columns in zip(tables, results) if columns}
 
-class MySQLConnector(DBConnector):
-    """MySQL async connector implementation"""
-    
-    async def connect(self) -> bool:
-        try:
-            self.pool = await aiomysql.create_pool(
-                host=self.config.host,
-                port=self.config.port,
-                user=self.config.username,
-                password=self.config.password,
-                db=self.config.database,
-                minsize=self.config.pool_min,
-                maxsize=self.config.pool_max
-            )
-            return True
-        except Exception as e:
-            logger.error(f"Failed to connect to MySQL: {str(e)}")
-            return False
+    async def get_table_stats(
+        self,
+        tables: Optional[List[str]] = None,
+        database: Optional[str] = None,
+        schema: Optional[str] = None
+    ) -> Dict[str, Dict[str, int]]:
+        """Estimated ``rows``, ``bytes`` and average ``row_width`` per table from catalog statistics.
 
-    @retry_on_failure
-    async def get_tables(self, database: Optional[str] = None, schema: Optional[str] = None) -> List[str]:
-        if not self.pool:
-            if not await self.connect():
-                return []
-        
-        db = database or self.config.database
-        if not db:
-            logger.error("Database name is required for MySQL")
-            return []
-            
-        async with self.pool.acquire() as conn:
-            async with conn.cursor() as cursor:
-                await cursor.execute("SHOW TABLES")
-                tables = [row[0] for row in await cursor.fetchall()]
-                return tables
+        Returns {} when unknown; ``row_width`` is 0 when the table was never analyzed.
+        """
+        return {}
 
-    @retry_on_failure
-    async def get_columns(self, table: str, database: Optional[str] = None, schema: Optional[str] = None) -> Dict[str, str]:
-        if not self.pool:
-            if not await self.connect():
-                return {}
-        
-        db = database or self.config.database
-        if not db:
-            logger.error("Database name is required for MySQL")
-            return {}
-            
-        async with self.pool.acquire() as conn:
-            async with conn.cursor() as cursor:
-                await cursor.execute(f"DESCRIBE {table}")
-                columns = {
-                    row[0]: self._map_type_to_seatunnel(row[1])
-                    for row in await cursor.fetchall()
-                }
-                return columns
-
-    def _map_type_to_seatunnel(self, mysql_type: str) -> str:
-        mysql_type = mysql_type.lower()
-        type_mapping = {
-            r"\bint\b": "int",
-            r"\bbigint\b": "long",
-            r"\b(varchar|text|char)\b": "string",
-            r"\b(double|float)\b": "double",
-            r"\bdecimal\b": "decimal",
-            r"\bdate\b": "date",
-            r"\b(datetime|timestamp)\b": "timestamp",
-            r"\bbool(ean)?\b": "boolean",
-            r"\btime\b": "time"
-        }
-        for pattern, seatunnel_type in type_mapping.items():
-            if re.search(pattern, mysql_type):
-                return seatunnel_type
-        return "string"
+    def _map_type_to_seatunnel(self, raw_type: str) -> str:
+        """Map database types to SeaTunnel compatible types"""
+        return map_type(self.dialect, raw_type)
 
+    @abstractmethod
     async def close(self) -> None:
-        if self.pool:
-            self.pool.close()
-            await self.pool.wait_closed()
-            self.pool = None
-
-class OracleConnector(DBConnector):
-    """Oracle async connector implementation"""
-    
-    async def connect(self) -> bool:
-        try:
-            oracledb.init_oracle_client()
-            self.pool = oracledb.create_pool(
-                user=self.config.username,
-                password=self.config.password,
-                dsn=f"{self.config.host}:{self.config.port}/{self.config.service_name}",
-                min=self.config.pool_min,
-                max=self.config.pool_max,
-                increment=1
-            )
-            return True
-        except Exception as e:
-            logger.error(f"Failed to connect to Oracle: {str(e)}")
-            return False
+        """Close the database connection pool"""
+        pass
 
-    @retry_on_failure
-    async def get_tables(self, database: Optional[str] = None, schema: Optional[str] = None) -> List[str]:
-        if not self.pool:
-            if not await self.connect():
-                return []
-        
-        owner = schema or self.config.username.upper()
-        async with self.pool.acquire() as conn:
-            async with conn.cursor() as cursor:
-                await cursor.execute(
-                    "SELECT table_name FROM all_tables WHERE owner = :owner",
-                    {"owner": owner}
-                )
-                tables = [row[0] for row in await cursor.fetchall()]
-                return tables
-
-    @retry_on_failure
-    async def get_columns(self, table: str, database: Optional[str] = None, schema: Optional[str] = None) -> Dict[str, str]:
-        if not self.pool:
-            if not await self.connect():
-                return {}
-        
-        owner = schema or self.config.username.upper()
-        async with self.pool.acquire() as conn:
-            async with conn.cursor() as cursor:
-                await cursor.execute(
-                    """
-                    SELECT column_name, data_type 
-                    FROM all_tab_columns 
-                    WHERE owner = :owner AND table_name = :table
-                    ORDER BY column_id
-                    """,
-                    {"owner": owner, "table": table.upper()}
-                )
-                columns = {
-                    row[0]: self._map_type_to_seatunnel(row[1])
-                    for row in await cursor.fetchall()
-                }
-                return columns
-
-    def _map_type_to_seatunnel(self, oracle_type: str) -> str:
-        """Map Oracle types to SeaTunnel compatible types"""
-        oracle_type = oracle_type.upper()
-        type_mapping = {
-            "NUMBER|INTEGER": "int",
-            "FLOAT": "float",
-            "CHAR|VARCHAR|CLOB": "string",
-            "DATE": "date",
-            "TIMESTAMP": "timestamp",
-            "BINARY_FLOAT|BINARY_DOUBLE": "double",
-            "BLOB": "bytes",
-            "BOOLEAN": "boolean"
-        }
-        for pattern, seatunnel_type in type_mapping.items():
-            if any(t in oracle_type for t in pattern.split("|")):
-                return seatunnel_type
-        return "string"
+class ConnectorFactory:
+    """Lazy registry of database connectors.
 
-    async def close(self) -> None:
-        if self.pool:
-            self.pool.close()
-            self.pool = None
+    Entries are ``"module:Class"`` paths, so a driver (asyncpg, aiomysql,
+    oracledb) is only imported when a connector of its type is first created,
+    and its one-time initialization runs once per process.
+    """
 
-class ConnectorFactory:
-    """Factory for creating database connectors dynamically"""
-    
-    CONNECTOR_TYPES = {
-        "postgresql": PostgreSQLConnector,
-        "mysql": MySQLConnector,
-        "oracle": OracleConnector
+    CONNECTOR_TYPES: Dict[str, Union[str, Type[DBConnector]]] = {
+        "postgresql": "app.utils.connectors.postgresql:PostgreSQLConnector",
+        "mysql": "app.utils.connectors.mysql:MySQLConnector",
+        "oracle": "app.utils.connectors.oracle:OracleConnector",
     }
-    
+    _loaded: Dict[str, Type[DBConnector]] = {}
+    _lock = threading.Lock()
+
+    @classmethod
+    def register(cls, db_type: str, connector: Union[str, Type[DBConnector]]) -> None:
+        """Add or replace a connector type, as a class or a lazy ``"module:Class"`` path"""
+        db_type = db_type.lower()
+        with cls._lock:
+            cls.CONNECTOR_TYPES[db_type] = connector
+            cls._loaded.pop(db_type, None)
+
+    @classmethod
+    def get_connector_class(cls, db_type: str) -> Optional[Type[DBConnector]]:
+        db_type = db_type.lower()
+        connector_class = cls._loaded.get(db_type)
+        if connector_class is not None:
+            return connector_class
+        with cls._lock:
+            connector_class = cls._loaded.get(db_type)
+            if connector_class is not None:
+                return connector_class
+            target = cls.CONNECTOR_TYPES.get(db_type)
+            if target is None:
+                return None
+            if isinstance(target, str):
+                module_name, _, class_name = target.partition(":")
+                connector_class = getattr(importlib.import_module(module_name), class_name)
+            else:
+                connector_class = target
+            connector_class.initialize_driver()
+            cls._loaded[db_type] = connector_class
+            return connector_class
+
     @classmethod
     def create_connector(cls, db_type: str, config: DBConfig) -> Optional[DBConnector]:
-        connector_class = cls.CONNECTOR_TYPES.get(db_type.lower())
+        try:
+            connector_class = cls.get_connector_class(db_type)
+        except ImportError as e:
+            logger.error(f"Driver for database type '{db_type}' is not installed: {str(e)}")
+            return None
         if not connector_class:
             logger.error(f"Unsupported database type: {db_type}")
             return None
@@ -317,11 +176,66 @@ class ConnectorFactory:
 
 class SchemaManager:
     
-    def __init__(self):
+    def __init__(
+        self,
+        cache_ttl: Optional[float] = None,
+        cache_max_entries: Optional[int] = None,
+        registry: Optional["ConnectorRegistry"] = None
+    ):
+        # Connectors this manager owns (no registry, or handed in by add_connector)
         self.connectors: Dict[str, DBConnector] = {}
+        # When set, named sources are leased from the shared registry per lookup instead of
+        # held, so its idle eviction and health checks apply and a replaced pool is picked up
+        self.registry = registry
+        self._sources: Dict[str, Tuple[str, DBConfig]] = {}
+        # Catalog metadata keyed by (connector, database, schema, table);
+        # table=None holds the table list of a database/schema
+        self.cache = TTLCache(
+            ttl=settings.SCHEMA_CACHE_TTL if cache_ttl is None else cache_ttl,
+            max_entries=settings.SCHEMA_CACHE_MAX_ENTRIES if cache_max_entries is None else cache_max_entries,
+            name="schema",
+        )
+
+    def has_connector(self, name: str) -> bool:
+        return name in self.connectors or name in self._sources
         
     async def add_connector(self, name: str, connector: DBConnector) -> None:
+        previous = self.connectors.get(name)
         self.connectors[name] = connector
+        self._sources.pop(name, None)
+        if previous is not None:
+            await self._release(previous)
+        if previous is not connector:
+            self.invalidate_cache(name)
+
+    async def _release(self, connector: DBConnector) -> None:
+        if self.registry is not None and self.registry.owns(connector):
+            self.registry.release(connector)
+        else:
+            await connector.close()
+
+    @asynccontextmanager
+    async def _connector(self, name: str) -> AsyncIterator[Optional[DBConnector]]:
+        """The connector behind ``name`` for one lookup; registry pools are leased only meanwhile"""
+        source = self._sources.get(name)
+        if source is None:
+            yield self.connectors.get(name)
+            return
+        connector = await self.registry.acquire(*source)
+        if connector is None:
+            logger.error(f"No connection available for '{name}'")
+            yield None
+            return
+        try:
+            yield connector
+        finally:
+            self.registry.release(connector)
+
+    async def _lookup(self, name: str, default: Any, call: Callable[[DBConnector], Awaitable[Any]]) -> Any:
+        async with self._connector(name) as connector:
+            if connector is None:
+                return default
+            return await call(connector)
         
     async def create_connector(
         self, 
@@ -329,6 +243,20 @@ class SchemaManager:
         name: str, 
         config: DBConfig
     ) -> bool:
+        if self.registry is not None:
+            # Lease once to make sure the source is reachable, then only per lookup
+            connector = await self.registry.acquire(db_type, config)
+            if not connector:
+                return False
+            self.registry.release(connector)
+            previous = self.connectors.pop(name, None)
+            if previous is not None:
+                await self._release(previous)
+            if self._sources.get(name) != (db_type, config):
+                self.invalidate_cache(name)
+            self._sources[name] = (db_type, config)
+            return True
+
         connector = ConnectorFactory.create_connector(db_type, config)
         if not connector:
             return False
@@ -339,11 +267,16 @@ class SchemaManager:
         return False
 
     async def get_tables(self, connector_name: str, database: Optional[str] = None, schema: Optional[str] = None) -> List[str]:
-        connector = self.connectors.get(connector_name)
-        if not connector:
+        if not self.has_connector(connector_name):
             logger.error(f"Connector '{connector_name}' not found")
             return []
-        return await connector.get_tables(database, schema)
+        with phase("db"):
+            tables = await self.cache.get_or_load(
+                (connector_name, database, schema, None),
+                lambda: self._lookup(connector_name, [], lambda c: c.get_tables(database, schema)),
+                should_cache=bool,
+            )
+        return list(tables)
 
     async def get_schema(
         self, 
@@ -353,13 +286,41 @@ class SchemaManager:
         schema: Optional[str] = None
     ) -> Dict[str, Any]:
         """Get schema for a specific table formatted for SeaTunnel"""
-        connector = self.connectors.get(connector_name)
-        if not connector:
+        if not self.has_connector(connector_name):
             logger.error(f"Connector '{connector_name}' not found")
             return {}
             
-        columns = await connector.get_columns(table, database, schema)
-        return {"fields": columns} if columns else {}
+        with phase("db"):
+            columns = await self.cache.get_or_load(
+                (connector_name, database, schema, table),
+                lambda: self._lookup(connector_name, {}, lambda c: c.get_columns(table, database, schema)),
+                should_cache=bool,
+            )
+        return {"fields": dict(columns)} if columns else {}
+
+    def invalidate_cache(
+        self,
+        connector_name: Optional[str] = None,
+        table: Optional[str] = None,
+        database: Optional[str] = None,
+        schema: Optional[str] = None,
+    ) -> int:
+        """Drop cached metadata; arguments left as None match anything.
+
+        Invalidating a table also drops the table list it belongs to.
+        """
+        def matches(key) -> bool:
+            key_connector, key_database, key_schema, key_table = key
+            return (
+                (connector_name is None or key_connector == connector_name)
+                and (database is None or key_database == database)
+                and (schema is None or key_schema == schema)
+                and (table is None or key_table in (table, None))
+            )
+        return self.cache.invalidate_where(matches)
+
+    def cache_stats(self) -> Dict[str, Any]:
+        return self.cache.stats()
 
     async def get_schema_for_multiple_tables(
         self, 
@@ -368,6 +329,9 @@ class SchemaManager:
         database: Optional[str] = None, 
         schema: Optional[str] = None
     ) -> Dict[str, Dict[str, Any]]:
+        if len(tables) >= settings.SCHEMA_BULK_THRESHOLD and self.has_connector(connector_name):
+            return await self._get_schema_bulk(connector_name, tables, database, schema)
+
         tasks = [
             self.get_schema(connector_name, table, database, schema)
             for table in tables
@@ -378,16 +342,71 @@ class SchemaManager:
             for table, result in zip(tables, results)
         }
 
+    async def _get_schema_bulk(
+        self,
+        connector_name: str,
+        tables: List[str],
+        database: Optional[str],
+        schema: Optional[str]
+    ) -> Dict[str, Dict[str, Any]]:
+        """Serve cached tables and fetch all the others with one catalog query"""
+        found: Dict[str, Dict[str, str]] = {}
+        missing = []
+        for table in tables:
+            columns = self.cache.get((connector_name, database, schema, table))
+            if columns is None:
+                missing.append(table)
+            else:
+                found[table] = columns
+
+        if missing:
+            try:
+                with phase("db"):
+                    fetched = await self._lookup(
+                        connector_name, {}, lambda c: c.get_columns_bulk(missing, database, schema)
+                    )
+            except Exception as e:
+                logger.error(f"Bulk column lookup on '{connector_name}' failed: {str(e)}")
+                fetched = {}
+            # Oracle reports names upper-cased; match them back to what was asked for
+            by_upper = {name.upper(): columns for name, columns in fetched.items()}
+            for table in missing:
+                columns = fetched.get(table) or by_upper.get(table.upper())
+                if columns:
+                    self.cache.set((connector_name, database, schema, table), columns)
+                    found[table] = columns
+
+        return {
+            table: {"fields": dict(found[table])} if found.get(table) else {}
+            for table in tables
+        }
+
     async def close_connector(self, connector_name: str) -> None:
-        connector = self.connectors.get(connector_name)
-        if connector:
-            await connector.close()
-            del self.connectors[connector_name]
+        connector = self.connectors.pop(connector_name, None)
+        source = self._sources.pop(connector_name, None)
+        if connector is not None:
+            await self._release(connector)
+        if connector is not None or source is not None:
+            self.invalidate_cache(connector_name)
 
     async def close_all_connectors(self) -> None:
-        tasks = [self.close_connector(name) for name in list(self.connectors.keys())]
+        tasks = [self.close_connector(name) for name in [*self.connectors, *self._sources]]
         await asyncio.gather(*tasks)
 
+# Connector classes moved to app.utils.connectors; keep the old import paths working
+_CONNECTOR_ALIASES = {
+    "PostgreSQLConnector": "postgresql",
+    "MySQLConnector": "mysql",
+    "OracleConnector": "oracle",
+}
+
+
+def __getattr__(name: str) -> Any:
+    db_type = _CONNECTOR_ALIASES.get(name)
+    if db_type is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return ConnectorFactory.get_connector_class(db_type)
+
 async def main():
     schema_manager = SchemaManager()
     
@@ -0,0 +1,124 @@
+import asyncio
+import logging
+import sys
+import threading
+import time
+import traceback
+from collections import deque
+from datetime import datetime, timezone
+from typing import Any, Deque, Dict, List, Optional
+
+from app.config.setting import settings
+from app.utils.metrics import LOOP_BLOCKED, LOOP_LAG
+
+logger = logging.getLogger(__name__)
+
+
+def _percentile(sorted_values: List[float], pct: float) -> float:
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, int(pct / 100 * len(sorted_values)))
+    return sorted_values[index]
+
+
+class LoopMonitor:
+    """Measures event-loop lag and reports what blocked the loop.
+
+    A heartbeat task sleeps for ``interval`` and records how late it woke up.
+    A watchdog thread notices when the heartbeat is overdue by more than
+    ``threshold`` while the loop is still stuck, and logs the loop thread's
+    current stack, i.e. the code that is blocking it.
+    """
+
+    def __init__(
+        self,
+        interval: Optional[float] = None,
+        threshold: Optional[float] = None,
+        window: Optional[int] = None,
+        max_stalls: int = 20,
+    ):
+        self.interval = interval or settings.LOOP_MONITOR_INTERVAL
+        self.threshold = threshold or settings.LOOP_BLOCK_THRESHOLD
+        self._lags: Deque[float] = deque(maxlen=window or settings.LOOP_LAG_WINDOW)
+        self.stalls: Deque[Dict[str, Any]] = deque(maxlen=max_stalls)
+        self.blocked_total = 0
+        self._beat = time.monotonic()
+        self._loop_thread_id: Optional[int] = None
+        self._pending_stall: Optional[Dict[str, Any]] = None
+        self._task: Optional[asyncio.Task] = None
+        self._thread: Optional[threading.Thread] = None
+        self._stopped = threading.Event()
+
+    async def _heartbeat(self) -> None:
+        while True:
+            started = time.monotonic()
+            self._beat = started
+            await asyncio.sleep(self.interval)
+            now = time.monotonic()
+            lag = max(0.0, now - started - self.interval)
+            self._lags.append(lag)
+            LOOP_LAG.observe(lag)
+            stall = self._pending_stall
+            if stall is not None:
+                # The watchdog caught this stall in the act; record how long it lasted
+                self._pending_stall = None
+                stall["blocked_ms"] = round(lag * 1000, 1)
+
+    def _watch(self) -> None:
+        reported_beat = None
+        check_every = min(self.interval, self.threshold) / 2
+        while not self._stopped.wait(check_every):
+            beat = self._beat
+            overdue = time.monotonic() - beat - self.interval
+            if overdue < self.threshold or beat == reported_beat:
+                continue
+            reported_beat = beat
+            frame = sys._current_frames().get(self._loop_thread_id)
+            stack = "".join(traceback.format_stack(frame)) if frame is not None else ""
+            stall = {
+                "timestamp": datetime.now(timezone.utc).isoformat(),
+                "blocked_ms": round(overdue * 1000, 1),
+                "stack": stack,
+            }
+            self.stalls.append(stall)
+            self._pending_stall = stall
+            self.blocked_total += 1
+            LOOP_BLOCKED.inc()
+            logger.warning(f"Event loop blocked for over {overdue * 1000:.0f} ms at:\n{stack}")
+
+    def start(self) -> None:
+        """Start monitoring the running loop; call from within it"""
+        if self._task is not None:
+            return
+        self._loop_thread_id = threading.get_ident()
+        self._beat = time.monotonic()
+        self._stopped.clear()
+        self._task = asyncio.create_task(self._heartbeat())
+        self._thread = threading.Thread(target=self._watch, name="loop-watchdog", daemon=True)
+        self._thread.start()
+
+    async def stop(self) -> None:
+        self._stopped.set()
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        if self._thread is not None:
+            self._thread.join(timeout=1)
+            self._thread = None
+
+    def stats(self) -> Dict[str, Any]:
+        lags = sorted(self._lags)
+        return {
+            "interval_ms": self.interval * 1000,
+            "block_threshold_ms": self.threshold * 1000,
+            "samples": len(lags),
+            "lag_p50_ms": round(_percentile(lags, 50) * 1000, 2),
+            "lag_p95_ms": round(_percentile(lags, 95) * 1000, 2),
+            "lag_p99_ms": round(_percentile(lags, 99) * 1000, 2),
+            "lag_max_ms": round((lags[-1] if lags else 0.0) * 1000, 2),
+            "blocked_total": self.blocked_total,
+        }
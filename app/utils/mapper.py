@@ -1,3 +1,5 @@
+import hashlib
+import json
 import uuid
 from typing import Any, Dict, List, Union, Optional
 from app.models.payload import SeaTunnelRequest, SourceConfig, SinkConfig
@@ -5,14 +7,15 @@ from app.models.job import (
     Job,        
     CDCEnv,
     JobConfig,
-    SeatunnelSourceConfig,
+    CDCTuning,
     SftpSourceConfig,
     PostgreSQLSourceConfig,
     KafkaSinkConfig,
     IcebergSinkConfig,
     SourceType
 )
-from pydantic import Field
+from app.utils.metrics import JOB_MAPPING_LATENCY
+from app.utils.profiling import phase
 
 
 def map_source_item(item: SourceConfig) -> Union[SftpSourceConfig, PostgreSQLSourceConfig]:
@@ -20,25 +23,21 @@ def map_source_item(item: SourceConfig) -> Union[SftpSourceConfig, PostgreSQLSou
     auth = item.auth
     cfg = item.config
 
-    base = SeatunnelSourceConfig(
-        plugin_name=plugin,
-        plugin_output="sample_table",  # Example plugin output
-        row_num=0,
-        schema=None,
-    )
-
+    # Built in one step; no intermediate SeatunnelSourceConfig/.dict() copy
     if plugin == SourceType.SFTP.value:
         return SftpSourceConfig(
-            **base.dict(),
+            plugin_output="sample_table",  # Example plugin output
             host=cfg.get("host", "https:example.com"),
             port=cfg["port"],
+            username=auth.username if auth else None,
+            password=auth.password if auth else None,
             file_path=cfg["file_path"],
             file_type=cfg["file_type"],
         )
 
     elif plugin == SourceType.POSTGRESQLCDC.value:
         return PostgreSQLSourceConfig(
-            **base.dict(),
+            plugin_output="sample_table",  # Example plugin output
             port=cfg.get("port", 5432),
             username=auth.username,
             password=auth.password,
@@ -46,6 +45,8 @@ def map_source_item(item: SourceConfig) -> Union[SftpSourceConfig, PostgreSQLSou
             schema_names=cfg.get("schema-names", []),
             table_names=cfg.get("table-names", []),
             base_url=auth.additional_params.get("base-url", "") if auth.additional_params else "",
+            # Replication slot; kept as an extra field under the connector's own key
+            **({"slot.name": cfg["slot.name"]} if cfg.get("slot.name") else {}),
         )
 
     else:
@@ -82,7 +83,12 @@ def map_sink_item(item: SinkConfig, source_table_name: List[str]) -> Union[Kafka
     return SinkConfig(plugin, **cfg)
 
 
-def parse_job(request: SeaTunnelRequest) -> Job:
+def _map_request(
+    request: SeaTunnelRequest,
+    parallelism: Optional[int] = None,
+    tuning: Optional[CDCTuning] = None,
+):
+    """Map a request to its env, source and sink models"""
     # Handle Sources (wrap single → list if necessary)
     sources = [request.source] if isinstance(request.source, SourceConfig) else request.source
     source_confs = [map_source_item(s) for s in sources]
@@ -91,17 +97,26 @@ def parse_job(request: SeaTunnelRequest) -> Job:
     sinks = [request.sink] if isinstance(request.sink, SinkConfig) else request.sink
     sink_confs = [map_sink_item(s, [source.plugin_output for source in source_confs]) for s in sinks]
     
-    from app.models.job import Environment
+    cdc_env = None
     if request.source and request.source.source_type == "Postgres-CDC": 
         cdc_env = CDCEnv(
-            execution_parallelism=1,
+            execution_parallelism=parallelism or 1,
             job_mode="STREAMING",
-            checkpoint_interval=5000,
-            read_limit_bytes_per_second=7000000,
-            read_limit_rows_per_second=400
+            checkpoint_interval=tuning.checkpoint_interval if tuning else 5000,
+            read_limit_bytes_per_second=tuning.bytes_per_second if tuning else 7000000,
+            read_limit_rows_per_second=tuning.rows_per_second if tuning else 400
     )
+    return cdc_env, source_confs, sink_confs
+
+
+@JOB_MAPPING_LATENCY.labels("parse_job").time()
+def parse_job(
+    request: SeaTunnelRequest,
+    parallelism: Optional[int] = None,
+    tuning: Optional[CDCTuning] = None,
+) -> Job:
+    cdc_env, source_confs, sink_confs = _map_request(request, parallelism, tuning)
 
-    
     # Build JobConfig + Job
     job_conf = JobConfig(env=cdc_env, source=source_confs, sink=sink_confs)
     return Job(
@@ -109,3 +124,55 @@ def parse_job(request: SeaTunnelRequest) -> Job:
         jobName=getattr(request, "job_name", "unnamed-job"),
         config=job_conf
     )
+
+
+@JOB_MAPPING_LATENCY.labels("map_job_config").time()
+def map_job_config(
+    request: SeaTunnelRequest,
+    parallelism: Optional[int] = None,
+    tuning: Optional[CDCTuning] = None,
+) -> Dict[str, Any]:
+    """Map a request straight to the serialized upstream config.
+
+    Produces ``parse_job(request).config`` dumped by alias without building
+    the JobConfig/Job wrappers: every item is validated once by its own model
+    and dumped once.
+    """
+    cdc_env, source_confs, sink_confs = _map_request(request, parallelism, tuning)
+    config: Dict[str, Any] = {}
+    if cdc_env is not None:
+        config["env"] = cdc_env.model_dump(by_alias=True, exclude_none=True)
+    config["source"] = [source.model_dump(by_alias=True, exclude_none=True) for source in source_confs]
+    config["sink"] = [sink.model_dump(by_alias=True, exclude_none=True) for sink in sink_confs]
+    return config
+
+
+def compile_job(
+    request: SeaTunnelRequest,
+    job_id: Optional[str] = None,
+    parallelism: Optional[int] = None,
+    tuning: Optional[CDCTuning] = None,
+) -> Dict[str, Any]:
+    """Map and serialize a request into the upstream job dict.
+
+    Same as ``parse_job(request).dict(by_alias=True, exclude_none=True)`` but
+    built by ``map_job_config``. Not cached: hashing a request costs about as
+    much as mapping it.
+    """
+    with phase("map"):
+        config = map_job_config(request, parallelism, tuning)
+    job = {
+        "jobId": job_id or str(uuid.uuid4()),
+        "jobName": getattr(request, "job_name", "unnamed-job"),
+        "config": config,
+    }
+    if getattr(request, "cluster", None):
+        # Placement hint for JobService; not part of the upstream payload
+        job["cluster"] = request.cluster
+    return job
+
+
+def config_fingerprint(config: Dict[str, Any]) -> str:
+    """Canonical content hash of a mapped job config"""
+    canonical = json.dumps(config, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(canonical.encode()).hexdigest()
@@ -0,0 +1,201 @@
+import asyncio
+import logging
+import os
+import time
+from typing import Any, Dict, Optional, Set, Tuple
+
+from prometheus_client import (
+    CONTENT_TYPE_LATEST,
+    REGISTRY,
+    CollectorRegistry,
+    Counter,
+    Gauge,
+    Histogram,
+    generate_latest,
+    multiprocess,
+)
+
+from app.config.setting import settings
+
+logger = logging.getLogger(__name__)
+
+# With several uvicorn/gunicorn workers, each process writes its samples to
+# PROMETHEUS_MULTIPROC_DIR and /metrics aggregates them on every scrape
+MULTIPROCESS = bool(os.environ.get("PROMETHEUS_MULTIPROC_DIR"))
+
+REQUEST_LATENCY = Histogram(
+    "seatunnel_api_request_duration_seconds",
+    "API request latency by route template",
+    ["method", "route", "status"],
+)
+UPSTREAM_LATENCY = Histogram(
+    "seatunnel_upstream_request_duration_seconds",
+    "SeaTunnel REST call latency",
+    ["endpoint", "method", "status"],
+)
+UPSTREAM_ERRORS = Counter(
+    "seatunnel_upstream_errors_total",
+    "Failed SeaTunnel REST calls",
+    ["endpoint", "status"],
+)
+UPSTREAM_RETRIES = Counter(
+    "seatunnel_upstream_retries_total",
+    "Extra SeaTunnel REST attempts by kind (retry, failover, hedge)",
+    ["endpoint", "kind"],
+)
+UPSTREAM_ENDPOINT_STATE = Gauge(
+    "seatunnel_upstream_endpoint_state",
+    "Circuit breaker state per SeaTunnel endpoint (0 closed, 1 half-open, 2 open)",
+    ["url"],
+    multiprocess_mode="livemax",
+)
+DB_POOL_SIZE = Gauge(
+    "seatunnel_db_pool_size",
+    "Open connections per connector pool",
+    ["connector", "db_type"],
+    multiprocess_mode="livesum",
+)
+DB_POOL_IN_USE = Gauge(
+    "seatunnel_db_pool_in_use",
+    "Checked-out connections per connector pool",
+    ["connector", "db_type"],
+    multiprocess_mode="livesum",
+)
+DB_POOL_WAITERS = Gauge(
+    "seatunnel_db_pool_waiters",
+    "Callers waiting for a connection per connector pool",
+    ["connector", "db_type"],
+    multiprocess_mode="livesum",
+)
+CACHE_REQUESTS = Counter(
+    "seatunnel_cache_requests_total",
+    "Cache lookups by result (hit, miss, coalesced)",
+    ["cache", "result"],
+)
+CACHE_EVICTIONS = Counter(
+    "seatunnel_cache_evictions_total",
+    "Entries evicted to respect the cache size bound",
+    ["cache"],
+)
+JOB_MAPPING_LATENCY = Histogram(
+    "seatunnel_job_mapping_duration_seconds",
+    "Time spent mapping requests into job configs",
+    ["stage"],
+    buckets=(0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 1.0),
+)
+LOOP_LAG = Histogram(
+    "seatunnel_event_loop_lag_seconds",
+    "How late the event-loop heartbeat woke up",
+    buckets=(0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0),
+)
+LOOP_BLOCKED = Counter(
+    "seatunnel_event_loop_blocked_total",
+    "Times the event loop was blocked longer than the threshold",
+)
+SUBMIT_QUEUE_DEPTH = Gauge(
+    "seatunnel_submit_queue_depth",
+    "Jobs waiting in the asynchronous submission queue",
+    multiprocess_mode="livesum",
+)
+SUBMISSIONS = Counter(
+    "seatunnel_async_submissions_total",
+    "Asynchronous submissions by outcome (accepted, rejected, submitted, failed)",
+    ["result"],
+)
+
+
+def render() -> Tuple[bytes, str]:
+    """Serialize all metrics in the Prometheus text format"""
+    if MULTIPROCESS:
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+        return generate_latest(registry), CONTENT_TYPE_LATEST
+    return generate_latest(REGISTRY), CONTENT_TYPE_LATEST
+
+
+def mark_process_dead() -> None:
+    """Drop this worker's live gauges from the multiprocess directory"""
+    if MULTIPROCESS:
+        multiprocess.mark_process_dead(os.getpid())
+
+
+def upstream_endpoint(endpoint: str) -> str:
+    # "job-info/123" -> "job-info"; keeps job IDs out of the label values
+    return endpoint.strip("/").split("/", 1)[0]
+
+
+class MetricsMiddleware:
+    """ASGI middleware recording request latency per route template.
+
+    Labels use the matched route's path (``/api/v1/jobs/{job_id}``), never the
+    raw URL, so label cardinality stays bounded.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        status = {"code": 500}
+
+        async def send_wrapper(message):
+            if message["type"] == "http.response.start":
+                status["code"] = message["status"]
+            await send(message)
+
+        started = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            route = scope.get("route")
+            REQUEST_LATENCY.labels(
+                scope["method"],
+                getattr(route, "path", "unmatched"),
+                str(status["code"]),
+            ).observe(time.perf_counter() - started)
+
+
+# Label sets published by the last update_pool_gauges, so dropped pools can be zeroed
+_published_pools: Set[Tuple[str, str]] = set()
+
+
+def update_pool_gauges(schema_manager, registry=None) -> None:
+    """Publish size, in-use and waiters of every known connector pool"""
+    pools: Dict[Any, Tuple[str, Any]] = {}
+    if registry is not None:
+        for name, connector in registry.connectors().items():
+            pools[id(connector)] = (name, connector)
+    # SchemaManager names win for pools leased from the registry
+    for name, connector in schema_manager.connectors.items():
+        pools[id(connector)] = (name, connector)
+
+    for name, connector in pools.values():
+        stats = connector.pool_stats()
+        labels = (name, connector.dialect)
+        DB_POOL_SIZE.labels(*labels).set(stats["size"])
+        DB_POOL_IN_USE.labels(*labels).set(stats["in_use"])
+        DB_POOL_WAITERS.labels(*labels).set(stats["waiters"])
+
+    current = {(name, connector.dialect) for name, connector in pools.values()}
+    for labels in _published_pools - current:
+        for gauge in (DB_POOL_SIZE, DB_POOL_IN_USE, DB_POOL_WAITERS):
+            if MULTIPROCESS:
+                # Removed series linger in the per-process files; zero them instead
+                gauge.labels(*labels).set(0)
+            else:
+                gauge.remove(*labels)
+    _published_pools.clear()
+    _published_pools.update(current)
+
+
+async def pool_gauge_loop(schema_manager, registry=None, interval: Optional[float] = None) -> None:
+    interval = interval or settings.METRICS_POOL_INTERVAL
+    while True:
+        try:
+            update_pool_gauges(schema_manager, registry)
+        except Exception as e:
+            logger.error(f"Pool metrics update failed: {str(e)}")
+        await asyncio.sleep(interval)
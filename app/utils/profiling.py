@@ -0,0 +1,257 @@
+import asyncio
+import contextvars
+import heapq
+import itertools
+import logging
+import os
+import threading
+import time
+import uuid
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+from urllib.parse import parse_qs
+
+from app.config.setting import settings
+
+logger = logging.getLogger(__name__)
+
+# Seconds spent per named phase by the request being served
+_phases: contextvars.ContextVar[Optional[Dict[str, float]]] = contextvars.ContextVar("phases", default=None)
+
+
+@contextmanager
+def phase(name: str) -> Iterator[None]:
+    """Attribute the wall time of the block to ``name`` in the current request's breakdown.
+
+    A no-op outside a request. Tasks and threads started by the request share its breakdown.
+    """
+    phases = _phases.get()
+    if phases is None:
+        yield
+        return
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        phases[name] = phases.get(name, 0.0) + time.perf_counter() - started
+
+
+class SlowRequestLog:
+    """Keeps the ``size`` slowest requests seen, with their phase breakdown"""
+
+    def __init__(self, size: int):
+        self.size = size
+        self._heap: List[Tuple[float, int, Dict[str, Any]]] = []
+        self._seq = itertools.count()
+        self._lock = threading.Lock()
+
+    def qualifies(self, duration: float) -> bool:
+        """Whether a request this slow would make the list; lets callers skip building the entry"""
+        return self.size > 0 and (len(self._heap) < self.size or duration > self._heap[0][0])
+
+    def record(self, duration: float, entry: Dict[str, Any]) -> None:
+        if self.size <= 0:
+            return
+        item = (duration, next(self._seq), entry)
+        with self._lock:
+            if len(self._heap) < self.size:
+                heapq.heappush(self._heap, item)
+            elif duration > self._heap[0][0]:
+                heapq.heapreplace(self._heap, item)
+
+    def snapshot(self) -> List[Dict[str, Any]]:
+        with self._lock:
+            items = sorted(self._heap, key=lambda item: item[0], reverse=True)
+        return [entry for _, _, entry in items]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._heap.clear()
+
+
+slow_requests = SlowRequestLog(settings.SLOW_REQUEST_LOG_SIZE)
+
+
+# Python 3.12+ allows one active cProfile profiler per process, so captures take turns
+_cprofile_lock = threading.Lock()
+
+
+class _RequestProfiler:
+    """pyinstrument when installed (speedscope JSON), cProfile otherwise (pstats)"""
+
+    def __init__(self, profile_id: str):
+        self.profile_id = profile_id
+        try:
+            from pyinstrument import Profiler
+        except ImportError:
+            import cProfile
+
+            # cProfile is deterministic and per thread: requests served concurrently
+            # on the loop show up in the profile as well, and only one capture can run
+            self._profiler = cProfile.Profile()
+            self.kind = "pstats"
+        else:
+            self._profiler = Profiler(async_mode="enabled")
+            self.kind = "speedscope"
+
+    @property
+    def filename(self) -> str:
+        extension = "speedscope.json" if self.kind == "speedscope" else "pstats"
+        return f"{self.profile_id}.{extension}"
+
+    def start(self) -> bool:
+        """Begin capturing; False when another cProfile capture is already running"""
+        if self.kind == "speedscope":
+            self._profiler.start()
+            return True
+        if not _cprofile_lock.acquire(blocking=False):
+            return False
+        try:
+            self._profiler.enable()
+        except BaseException:
+            _cprofile_lock.release()
+            raise
+        return True
+
+    def stop(self) -> None:
+        # On the thread that started it: cProfile only stops the calling thread's profiler
+        if self.kind == "speedscope":
+            self._profiler.stop()
+        else:
+            try:
+                self._profiler.disable()
+            finally:
+                _cprofile_lock.release()
+
+    def save(self) -> str:
+        """Render and write the stopped profile, then prune old ones; blocking, so run in a thread"""
+        os.makedirs(settings.PROFILING_DIR, exist_ok=True)
+        path = os.path.join(settings.PROFILING_DIR, self.filename)
+        if self.kind == "speedscope":
+            from pyinstrument.renderers import SpeedscopeRenderer
+
+            with open(path, "w") as f:
+                f.write(self._profiler.output(renderer=SpeedscopeRenderer()))
+        else:
+            self._profiler.dump_stats(path)
+        _prune_profiles()
+        return path
+
+
+def _prune_profiles() -> None:
+    # Keep the directory bounded; oldest profiles go first
+    try:
+        entries = [os.path.join(settings.PROFILING_DIR, name) for name in os.listdir(settings.PROFILING_DIR)]
+        entries.sort(key=os.path.getmtime)
+        for path in entries[:max(0, len(entries) - settings.PROFILING_MAX_FILES)]:
+            os.remove(path)
+    except OSError as e:
+        logger.warning(f"Could not prune profiles: {str(e)}")
+
+
+def find_profile(profile_id: str) -> Optional[str]:
+    """Path of a stored profile, or None; the id must be one we generated"""
+    try:
+        uuid.UUID(profile_id)
+    except ValueError:
+        return None
+    for extension in ("speedscope.json", "pstats"):
+        path = os.path.join(settings.PROFILING_DIR, f"{profile_id}.{extension}")
+        if os.path.exists(path):
+            return path
+    return None
+
+
+def _profile_requested(scope) -> bool:
+    value = None
+    for name, raw in scope.get("headers", ()):
+        if name == b"x-profile":
+            value = raw.decode("latin-1")
+            break
+    if value is None and scope.get("query_string"):
+        values = parse_qs(scope["query_string"].decode("latin-1")).get("profile")
+        value = values[0] if values else None
+    if not value:
+        return False
+    if settings.PROFILING_TOKEN:
+        return value == settings.PROFILING_TOKEN
+    return value.lower() in ("1", "true", "yes")
+
+
+def _start_profiler(profiler: _RequestProfiler) -> bool:
+    # A profile that cannot start is skipped; the request itself is still served
+    try:
+        if profiler.start():
+            return True
+        logger.warning(f"Skipped profile {profiler.profile_id}: another cProfile capture is running")
+    except Exception as e:
+        logger.error(f"Failed to start profile {profiler.profile_id}: {str(e)}")
+    return False
+
+
+class ProfilingMiddleware:
+    """ASGI middleware for per-request phase timing and opt-in profiling.
+
+    Every request gets a phase breakdown (see ``phase``) and the slowest ones
+    are kept in ``slow_requests``. With ``PROFILING_ENABLED``, a request sent
+    with an ``X-Profile`` header or ``?profile=`` query flag (matching
+    ``PROFILING_TOKEN`` when set) is profiled; the response carries an
+    ``X-Profile-Id`` to fetch it from ``/debug/profiles/{id}``. Without
+    pyinstrument only one request is profiled at a time; others go unprofiled.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        profiler = None
+        if settings.PROFILING_ENABLED and _profile_requested(scope):
+            profiler = _RequestProfiler(str(uuid.uuid4()))
+
+        status = {"code": 500}
+
+        async def send_wrapper(message):
+            if message["type"] == "http.response.start":
+                status["code"] = message["status"]
+                if profiler is not None:
+                    headers = list(message.get("headers", []))
+                    headers.append((b"x-profile-id", profiler.profile_id.encode()))
+                    message = {**message, "headers": headers}
+            await send(message)
+
+        phases: Dict[str, float] = {}
+        token = _phases.set(phases)
+        started = time.perf_counter()
+        try:
+            if profiler is not None and not _start_profiler(profiler):
+                profiler = None
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            duration = time.perf_counter() - started
+            _phases.reset(token)
+            profile_path = None
+            if profiler is not None:
+                try:
+                    profiler.stop()
+                    # Rendering, writing and pruning touch the disk; keep them off the event loop
+                    profile_path = await asyncio.to_thread(profiler.save)
+                except Exception as e:
+                    logger.error(f"Failed to save profile {profiler.profile_id}: {str(e)}")
+            if slow_requests.qualifies(duration):
+                breakdown = {name: round(seconds * 1000, 3) for name, seconds in phases.items()}
+                breakdown["other"] = round(max(0.0, duration - sum(phases.values())) * 1000, 3)
+                slow_requests.record(duration, {
+                    "method": scope["method"],
+                    "route": getattr(scope.get("route"), "path", scope["path"]),
+                    "path": scope["path"],
+                    "status": status["code"],
+                    "duration_ms": round(duration * 1000, 3),
+                    "phases_ms": breakdown,
+                    "profile_id": profiler.profile_id if profile_path else None,
+                    "timestamp": datetime.now(timezone.utc).isoformat(),
+                })
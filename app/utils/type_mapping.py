@@ -0,0 +1,218 @@
+import re
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Callable, Dict, Optional, Tuple, Union
+
+# A rule is either a fixed SeaTunnel type or a function of the parsed type
+Rule = Union[str, Callable[["ParsedType"], str]]
+
+# base name, optional "(params)", trailing words ("with time zone", "unsigned"), "[]" array suffixes
+_TYPE_PATTERN = re.compile(
+    r"^\s*(?P<base>[a-z_][a-z0-9_]*(?:\s+[a-z_][a-z0-9_]*)*?)\s*"
+    r"(?:\((?P<params>[^)]*)\))?"
+    r"(?P<suffix>(?:\s+[a-z_][a-z0-9_]*)*)\s*"
+    r"(?P<array>(?:\[\d*\]\s*)*)$"
+)
+_MODIFIERS = {"unsigned", "signed", "zerofill"}
+
+
+@dataclass(frozen=True)
+class ParsedType:
+    name: str
+    params: Tuple[str, ...] = ()
+    array_dims: int = 0
+    unsigned: bool = False
+
+    def int_params(self) -> Tuple[int, ...]:
+        values = []
+        for param in self.params:
+            try:
+                values.append(int(param))
+            except ValueError:
+                break
+        return tuple(values)
+
+
+def parse_type(raw_type: str) -> ParsedType:
+    """Split a raw catalog type such as ``numeric(10,2)[]`` into its parts"""
+    text = raw_type.strip().lower()
+    match = _TYPE_PATTERN.match(text)
+    if not match:
+        # Exotic syntax (e.g. "interval day(2) to second(6)"): keep the leading word
+        return ParsedType(name=text.split("(")[0].split()[0] if text else "")
+
+    words = match.group("base").split() + match.group("suffix").split()
+    unsigned = "unsigned" in words
+    name = " ".join(word for word in words if word not in _MODIFIERS)
+    params_text = match.group("params")
+    params = tuple(p.strip() for p in params_text.split(",")) if params_text else ()
+    return ParsedType(
+        name=name,
+        params=params,
+        array_dims=match.group("array").count("["),
+        unsigned=unsigned,
+    )
+
+
+def _decimal(parsed: ParsedType) -> str:
+    numbers = parsed.int_params()
+    if len(numbers) >= 2:
+        return f"decimal({numbers[0]},{numbers[1]})"
+    if len(numbers) == 1:
+        return f"decimal({numbers[0]},0)"
+    return "decimal"
+
+
+class TypeMapper:
+    """Maps one dialect's raw column types to SeaTunnel types.
+
+    The rule table is built once per dialect and every distinct raw type
+    string is resolved once; later lookups are a cache hit.
+    """
+
+    def __init__(self, dialect: str, rules: Dict[str, Rule], default: str = "string", cache_size: int = 4096):
+        self.dialect = dialect
+        self.default = default
+        self._rules = dict(rules)
+        self.map = lru_cache(maxsize=cache_size)(self._map)
+
+    def _resolve(self, parsed: ParsedType) -> str:
+        rule = self._rules.get(parsed.name)
+        if rule is None and " " in parsed.name:
+            rule = self._rules.get(parsed.name.split()[0])
+        if rule is None:
+            return self.default
+        return rule(parsed) if callable(rule) else rule
+
+    def _map(self, raw_type: str) -> str:
+        parsed = parse_type(raw_type)
+        seatunnel_type = self._resolve(parsed)
+        for _ in range(parsed.array_dims):
+            seatunnel_type = f"array<{seatunnel_type}>"
+        return seatunnel_type
+
+
+_POSTGRESQL_RULES: Dict[str, Rule] = {
+    "smallint": "short",
+    "int2": "short",
+    "integer": "int",
+    "int": "int",
+    "int4": "int",
+    "bigint": "long",
+    "int8": "long",
+    "real": "float",
+    "float4": "float",
+    "double precision": "double",
+    "float8": "double",
+    "numeric": _decimal,
+    "decimal": _decimal,
+    "boolean": "boolean",
+    "bool": "boolean",
+    "character varying": "string",
+    "varchar": "string",
+    "character": "string",
+    "char": "string",
+    "bpchar": "string",
+    "text": "string",
+    "date": "date",
+    "time": "time",
+    "time without time zone": "time",
+    "time with time zone": "time",
+    "timestamp": "timestamp",
+    "timestamp without time zone": "timestamp",
+    "timestamp with time zone": "timestamp",
+    "bytea": "bytes",
+}
+
+_MYSQL_RULES: Dict[str, Rule] = {
+    # tinyint(1) is MySQL's boolean
+    "tinyint": lambda parsed: "boolean" if parsed.params == ("1",) else "short",
+    "smallint": "short",
+    "mediumint": "int",
+    "int": lambda parsed: "long" if parsed.unsigned else "int",
+    "integer": lambda parsed: "long" if parsed.unsigned else "int",
+    "bigint": lambda parsed: "decimal(20,0)" if parsed.unsigned else "long",
+    "float": "double",
+    "double": "double",
+    "double precision": "double",
+    "decimal": _decimal,
+    "numeric": _decimal,
+    "bool": "boolean",
+    "boolean": "boolean",
+    "char": "string",
+    "varchar": "string",
+    "tinytext": "string",
+    "text": "string",
+    "mediumtext": "string",
+    "longtext": "string",
+    "date": "date",
+    "time": "time",
+    "datetime": "timestamp",
+    "timestamp": "timestamp",
+    "year": "int",
+    "binary": "bytes",
+    "varbinary": "bytes",
+    "tinyblob": "bytes",
+    "blob": "bytes",
+    "mediumblob": "bytes",
+    "longblob": "bytes",
+}
+
+def _oracle_number(parsed: ParsedType) -> str:
+    # NUMBER(p,s) with a scale is decimal; whole numbers get the smallest integer type that fits.
+    # A bare NUMBER has no declared precision and stays int.
+    numbers = parsed.int_params()
+    if len(numbers) >= 2 and numbers[1] > 0:
+        return _decimal(parsed)
+    if numbers:
+        if numbers[0] <= 9:
+            return "int"
+        if numbers[0] <= 18:
+            return "long"
+        return f"decimal({numbers[0]},0)"
+    return "int"
+
+
+_ORACLE_RULES: Dict[str, Rule] = {
+    "number": _oracle_number,
+    "integer": "int",
+    "float": "float",
+    "binary_float": "float",
+    "binary_double": "double",
+    "char": "string",
+    "nchar": "string",
+    "varchar": "string",
+    "varchar2": "string",
+    "nvarchar2": "string",
+    "clob": "string",
+    "nclob": "string",
+    "long": "string",
+    "date": "date",
+    "timestamp": "timestamp",
+    "timestamp with time zone": "timestamp",
+    "timestamp with local time zone": "timestamp",
+    "blob": "bytes",
+    "raw": "bytes",
+    "long raw": "bytes",
+    "boolean": "boolean",
+}
+
+TYPE_MAPPERS: Dict[str, TypeMapper] = {
+    "postgresql": TypeMapper("postgresql", _POSTGRESQL_RULES),
+    "mysql": TypeMapper("mysql", _MYSQL_RULES),
+    "oracle": TypeMapper("oracle", _ORACLE_RULES),
+}
+
+
+def get_type_mapper(dialect: str) -> Optional[TypeMapper]:
+    return TYPE_MAPPERS.get(dialect.lower())
+
+
+def map_type(dialect: str, raw_type: str) -> str:
+    """Map a raw column type of ``dialect`` to a SeaTunnel schema type"""
+    mapper = TYPE_MAPPERS.get(dialect)
+    if mapper is None:
+        mapper = TYPE_MAPPERS.get(dialect.lower())
+        if mapper is None:
+            raise ValueError(f"Unsupported dialect: {dialect}")
+    return mapper.map(raw_type)
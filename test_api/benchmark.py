@@ -0,0 +1,219 @@
+"""Offline microbenchmarks for the request mapping and model layer.
+
+Run from the repository root:
+
+    python -m test_api.benchmark                      # full matrix
+    python -m test_api.benchmark --quick              # smaller inputs
+    python -m test_api.benchmark --filter parse_job   # subset by name
+    python -m test_api.benchmark --compare test_api/benchmark_results/<old>.json
+
+Results are written as JSON (one file per commit by default) so runs can be
+compared between commits; --compare exits non-zero on regressions.
+"""
+import argparse
+import copy
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+import timeit
+import warnings
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, List, Optional
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+from app.models.job import JobConfig  # noqa: E402
+from app.models.payload import SeaTunnelRequest  # noqa: E402
+from app.utils import mapper  # noqa: E402
+from app.utils.db_connector import MySQLConnector, OracleConnector, PostgreSQLConnector  # noqa: E402
+from app.utils.type_mapping import TYPE_MAPPERS  # noqa: E402
+
+PAYLOAD_DIR = os.path.join(ROOT, "test_api", "payload")
+RESULTS_DIR = os.path.join(ROOT, "test_api", "benchmark_results")
+
+TABLE_COUNTS = [1, 10, 100, 1000]
+COLUMN_COUNTS = [10, 100, 2000]
+QUICK_TABLE_COUNTS = [1, 100]
+QUICK_COLUMN_COUNTS = [10, 200]
+
+# Raw catalog types as each connector sees them, cycled to build wide tables
+COLUMN_TYPES = {
+    "postgresql": [
+        "integer", "bigint", "character varying", "text", "numeric", "timestamp without time zone",
+        "timestamp with time zone", "boolean", "double precision", "date", "jsonb", "integer[]",
+    ],
+    "mysql": [
+        "int(11)", "bigint(20) unsigned", "varchar(255)", "text", "decimal(18,4)", "datetime(6)",
+        "timestamp", "tinyint(1)", "double", "date", "json", "blob",
+    ],
+    "oracle": [
+        "NUMBER", "VARCHAR2", "NVARCHAR2", "CLOB", "DATE", "TIMESTAMP(6)",
+        "TIMESTAMP(6) WITH TIME ZONE", "BINARY_DOUBLE", "FLOAT", "BLOB", "RAW", "CHAR",
+    ],
+}
+CONNECTORS = {
+    "postgresql": PostgreSQLConnector,
+    "mysql": MySQLConnector,
+    "oracle": OracleConnector,
+}
+
+
+def load_payload(name: str) -> Dict[str, Any]:
+    with open(os.path.join(PAYLOAD_DIR, name)) as f:
+        return json.load(f)
+
+
+def request_with_tables(base: Dict[str, Any], tables: int) -> Dict[str, Any]:
+    """Scale the sample API payload to ``tables`` CDC tables"""
+    payload = copy.deepcopy(base)
+    config = payload["source"]["config"]
+    database = config["database-names"][0]
+    schema = config["schema-names"][0]
+    config["table-names"] = [f"{database}.{schema}.table_{i:04d}" for i in range(tables)]
+    return payload
+
+
+def columns_for(dialect: str, columns: int) -> List[str]:
+    types = COLUMN_TYPES[dialect]
+    return [types[i % len(types)] for i in range(columns)]
+
+
+def measure(func: Callable[[], Any], repeat: int, min_time: float) -> Dict[str, float]:
+    timer = timeit.Timer(func)
+    number, elapsed = timer.autorange()
+    # Scale the loop so one sample takes at least min_time
+    if elapsed < min_time:
+        number = max(number, int(number * min_time / max(elapsed, 1e-9)))
+    samples = [t / number for t in timer.repeat(repeat=repeat, number=number)]
+    return {
+        "loops": number,
+        "min_us": min(samples) * 1e6,
+        "median_us": statistics.median(samples) * 1e6,
+        "ops_per_sec": 1.0 / min(samples),
+    }
+
+
+def build_cases(table_counts: List[int], column_counts: List[int]) -> Dict[str, Callable[[], Any]]:
+    cases: Dict[str, Callable[[], Any]] = {}
+    base = load_payload("create_job_api.json")
+
+    for tables in table_counts:
+        raw = request_with_tables(base, tables)
+        request = SeaTunnelRequest.from_dict(raw)
+        job_config = mapper.map_job_config(request)
+        source_model = mapper.map_source_item(request.source)
+        inputs = [source_model.plugin_output]
+
+        suffix = f"[tables={tables}]"
+        cases[f"payload.from_dict{suffix}"] = lambda raw=raw: SeaTunnelRequest.from_dict(raw)
+        cases[f"payload.to_json{suffix}"] = lambda request=request: request.to_json()
+        cases[f"mapper.map_source_item{suffix}"] = lambda request=request: mapper.map_source_item(request.source)
+        cases[f"mapper.map_sink_item{suffix}"] = lambda request=request: mapper.map_sink_item(request.sink, inputs)
+        cases[f"mapper.parse_job{suffix}"] = lambda request=request: mapper.parse_job(request)
+        cases[f"mapper.parse_job+dict{suffix}"] = (
+            lambda request=request: mapper.parse_job(request).dict(by_alias=True, exclude_none=True)
+        )
+        cases[f"mapper.map_job_config{suffix}"] = lambda request=request: mapper.map_job_config(request)
+        cases[f"mapper.compile_job{suffix}"] = lambda request=request: mapper.compile_job(request)
+        cases[f"models.JobConfig.validate{suffix}"] = lambda job_config=job_config: JobConfig.model_validate(job_config)
+
+    for dialect, connector_class in CONNECTORS.items():
+        connector = connector_class(None)
+        mapper_cache = TYPE_MAPPERS[dialect].map
+        for columns in column_counts:
+            raw_types = columns_for(dialect, columns)
+
+            def map_warm(connector=connector, raw_types=raw_types):
+                return {f"c{i}": connector._map_type_to_seatunnel(t) for i, t in enumerate(raw_types)}
+
+            def map_cold(connector=connector, raw_types=raw_types, mapper_cache=mapper_cache):
+                mapper_cache.cache_clear()
+                return {f"c{i}": connector._map_type_to_seatunnel(t) for i, t in enumerate(raw_types)}
+
+            suffix = f"[columns={columns}]"
+            cases[f"{connector_class.__name__}._map_type_to_seatunnel{suffix}"] = map_warm
+            cases[f"{connector_class.__name__}._map_type_to_seatunnel.cold{suffix}"] = map_cold
+
+    return cases
+
+
+def git_revision() -> Optional[str]:
+    try:
+        return subprocess.check_output(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=ROOT, stderr=subprocess.DEVNULL
+        ).decode().strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def compare(current: Dict[str, Any], baseline_path: str, threshold: float) -> int:
+    with open(baseline_path) as f:
+        baseline = json.load(f)["results"]
+    regressions = 0
+    print(f"\n{'benchmark':<72} {'base us':>10} {'now us':>10} {'ratio':>7}")
+    for name, result in current["results"].items():
+        old = baseline.get(name)
+        if not old:
+            continue
+        ratio = result["min_us"] / old["min_us"] if old["min_us"] else float("inf")
+        flag = ""
+        if ratio > 1 + threshold:
+            regressions += 1
+            flag = "  REGRESSION"
+        print(f"{name:<72} {old['min_us']:>10.2f} {result['min_us']:>10.2f} {ratio:>7.2f}{flag}")
+    return regressions
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--quick", action="store_true", help="smaller input sizes")
+    parser.add_argument("--filter", default=None, help="only run benchmarks whose name contains this")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--min-time", type=float, default=0.05, help="minimum seconds per sample")
+    parser.add_argument("--output", default=None, help="result file (default: benchmark_results/<rev>.json)")
+    parser.add_argument("--compare", default=None, help="baseline result file to compare against")
+    parser.add_argument("--threshold", type=float, default=0.10, help="allowed slowdown ratio for --compare")
+    args = parser.parse_args(argv)
+
+    warnings.simplefilter("ignore", DeprecationWarning)
+    table_counts = QUICK_TABLE_COUNTS if args.quick else TABLE_COUNTS
+    column_counts = QUICK_COLUMN_COUNTS if args.quick else COLUMN_COUNTS
+    cases = build_cases(table_counts, column_counts)
+
+    results: Dict[str, Dict[str, float]] = {}
+    for name, func in cases.items():
+        if args.filter and args.filter not in name:
+            continue
+        results[name] = measure(func, args.repeat, args.min_time)
+        print(f"{name:<72} {results[name]['min_us']:>12.2f} us")
+
+    revision = git_revision()
+    report = {
+        "meta": {
+            "revision": revision,
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "quick": args.quick,
+        },
+        "results": results,
+    }
+    output = args.output or os.path.join(RESULTS_DIR, f"{revision or int(time.time())}.json")
+    os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+    with open(output, "w") as f:
+        json.dump(report, f, indent=2)
+    print(f"\nResults written to {output}")
+
+    if args.compare:
+        return 1 if compare(report, args.compare, args.threshold) else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
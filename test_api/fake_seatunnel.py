@@ -0,0 +1,251 @@
+"""In-process stand-in for the SeaTunnel master REST API (v2 endpoints).
+
+Implements /submit-job, /submit-jobs, /stop-job, /job-info/{id}, /running-jobs
+and /system-monitoring-information with configurable latency, error rate and
+slow responses, so the API can be load tested without a cluster.
+
+Mount it through ``httpx.ASGITransport`` (see test_api/load_test.py) or serve
+it on its own:
+
+    python -m test_api.fake_seatunnel --port 5801 --latency lognormal:20 --error-rate 0.01
+"""
+import argparse
+import asyncio
+import itertools
+import math
+import random
+import time
+from dataclasses import dataclass, field
+from typing import Any, Dict, Optional
+
+from starlette.applications import Starlette
+from starlette.requests import Request
+from starlette.responses import JSONResponse
+from starlette.routing import Route
+
+DISTRIBUTIONS = ("fixed", "uniform", "exponential", "lognormal")
+
+
+@dataclass
+class LatencyProfile:
+    """Response latency in milliseconds drawn from ``distribution`` around ``mean_ms``"""
+    distribution: str = "fixed"
+    mean_ms: float = 0.0
+    # Lognormal shape; larger values give a heavier tail
+    sigma: float = 0.5
+
+    @classmethod
+    def parse(cls, spec: str) -> "LatencyProfile":
+        """Parse ``<distribution>:<mean_ms>``, e.g. ``lognormal:20`` or ``fixed:5``"""
+        distribution, _, mean = spec.partition(":")
+        if distribution not in DISTRIBUTIONS:
+            raise ValueError(f"Unknown latency distribution: {distribution}")
+        return cls(distribution=distribution, mean_ms=float(mean or 0))
+
+    def sample(self, rng: random.Random) -> float:
+        if self.mean_ms <= 0:
+            return 0.0
+        if self.distribution == "uniform":
+            return rng.uniform(0, 2 * self.mean_ms)
+        if self.distribution == "exponential":
+            return rng.expovariate(1 / self.mean_ms)
+        if self.distribution == "lognormal":
+            # Shift mu so the distribution mean stays at mean_ms
+            mu = math.log(self.mean_ms) - self.sigma ** 2 / 2
+            return rng.lognormvariate(mu, self.sigma)
+        return self.mean_ms
+
+
+@dataclass
+class FakeMasterConfig:
+    latency: LatencyProfile = field(default_factory=LatencyProfile)
+    # Per-endpoint overrides keyed by route name ("submit-job", "job-info", ...)
+    endpoint_latency: Dict[str, LatencyProfile] = field(default_factory=dict)
+    error_rate: float = 0.0
+    error_status: int = 500
+    slow_rate: float = 0.0
+    slow_ms: float = 2000.0
+    # Jobs created up front so status/stop traffic has something to hit
+    seed_jobs: int = 0
+    seed: Optional[int] = None
+
+
+class FakeSeaTunnelMaster:
+    """Keeps job state in memory and serves it through a Starlette app"""
+
+    def __init__(self, config: Optional[FakeMasterConfig] = None):
+        self.config = config or FakeMasterConfig()
+        self.rng = random.Random(self.config.seed)
+        self.jobs: Dict[str, Dict[str, Any]] = {}
+        self.requests: Dict[str, int] = {}
+        self.errors: Dict[str, int] = {}
+        self._ids = itertools.count(900_000_000_000_000_000)
+        for index in range(self.config.seed_jobs):
+            self._create(None, f"seed-{index}")
+        self.app = Starlette(routes=[
+            Route("/submit-job", self.submit_job, methods=["POST"]),
+            Route("/submit-jobs", self.submit_jobs, methods=["POST"]),
+            Route("/stop-job", self.stop_job, methods=["POST"]),
+            Route("/job-info/{job_id}", self.job_info, methods=["GET"]),
+            Route("/running-jobs", self.running_jobs, methods=["GET"]),
+            Route("/finished-jobs", self.finished_jobs, methods=["GET"]),
+            Route("/system-monitoring-information", self.system_monitoring, methods=["GET"]),
+            Route("/overview", self.overview, methods=["GET"]),
+        ])
+
+    def _create(self, job_id: Optional[str], job_name: Optional[str]) -> Dict[str, Any]:
+        job_id = str(job_id or next(self._ids))
+        self.jobs[job_id] = {
+            "jobId": job_id,
+            "jobName": job_name or "SeaTunnel_Job",
+            "jobStatus": "RUNNING",
+            "createTime": time.strftime("%Y-%m-%d %H:%M:%S"),
+            "metrics": {"SourceReceivedCount": "0", "SourceReceivedQPS": "0", "SinkWriteCount": "0"},
+        }
+        return self.jobs[job_id]
+
+    async def _behave(self, endpoint: str) -> Optional[JSONResponse]:
+        """Apply latency and fault injection; return an error response to short-circuit"""
+        self.requests[endpoint] = self.requests.get(endpoint, 0) + 1
+        profile = self.config.endpoint_latency.get(endpoint, self.config.latency)
+        delay = profile.sample(self.rng)
+        if self.config.slow_rate and self.rng.random() < self.config.slow_rate:
+            delay += self.config.slow_ms
+        if delay > 0:
+            await asyncio.sleep(delay / 1000)
+        if self.config.error_rate and self.rng.random() < self.config.error_rate:
+            self.errors[endpoint] = self.errors.get(endpoint, 0) + 1
+            return JSONResponse(
+                {"status": "fail", "message": "injected failure"}, status_code=self.config.error_status
+            )
+        return None
+
+    async def submit_job(self, request: Request) -> JSONResponse:
+        error = await self._behave("submit-job")
+        if error is not None:
+            return error
+        await request.body()
+        job = self._create(request.query_params.get("jobId"), request.query_params.get("jobName"))
+        return JSONResponse({"jobId": job["jobId"], "jobName": job["jobName"]})
+
+    async def submit_jobs(self, request: Request) -> JSONResponse:
+        error = await self._behave("submit-jobs")
+        if error is not None:
+            return error
+        items = await request.json()
+        results = []
+        for item in items:
+            params = item.get("params") or {}
+            job = self._create(params.get("jobId"), params.get("jobName"))
+            results.append({"jobId": job["jobId"], "jobName": job["jobName"]})
+        return JSONResponse(results)
+
+    async def stop_job(self, request: Request) -> JSONResponse:
+        error = await self._behave("stop-job")
+        if error is not None:
+            return error
+        body = await request.json()
+        job = self.jobs.get(str(body.get("jobId")))
+        if job is None:
+            return JSONResponse({"status": "fail", "message": "job not found"}, status_code=400)
+        job["jobStatus"] = "SAVEPOINT_DONE" if body.get("isStopWithSavePoint") else "CANCELED"
+        return JSONResponse({"jobId": job["jobId"]})
+
+    async def job_info(self, request: Request) -> JSONResponse:
+        error = await self._behave("job-info")
+        if error is not None:
+            return error
+        job = self.jobs.get(request.path_params["job_id"])
+        if job is None:
+            return JSONResponse({"status": "fail", "message": "job not found"}, status_code=404)
+        return JSONResponse(job)
+
+    async def running_jobs(self, request: Request) -> JSONResponse:
+        error = await self._behave("running-jobs")
+        if error is not None:
+            return error
+        return JSONResponse([job for job in self.jobs.values() if job["jobStatus"] == "RUNNING"])
+
+    async def finished_jobs(self, request: Request) -> JSONResponse:
+        error = await self._behave("finished-jobs")
+        if error is not None:
+            return error
+        return JSONResponse([job for job in self.jobs.values() if job["jobStatus"] != "RUNNING"])
+
+    async def system_monitoring(self, request: Request) -> JSONResponse:
+        error = await self._behave("system-monitoring-information")
+        if error is not None:
+            return error
+        return JSONResponse([{
+            "isMaster": "true",
+            "host": "localhost",
+            "port": "5801",
+            "processors": "8",
+            "physical.memory.total": "16.0G",
+            "heap.memory.used": "512.0M",
+            "heap.memory.max": "4.0G",
+            "load.process": "0.0%",
+            "load.system": "0.0%",
+            "runningJobs": str(sum(1 for job in self.jobs.values() if job["jobStatus"] == "RUNNING")),
+        }])
+
+    async def overview(self, request: Request) -> JSONResponse:
+        error = await self._behave("overview")
+        if error is not None:
+            return error
+        states = [job["jobStatus"] for job in self.jobs.values()]
+        return JSONResponse({
+            "projectVersion": "2.3.8",
+            "totalSlot": "0",
+            "unassignedSlot": "0",
+            "works": "1",
+            "runningJobs": str(states.count("RUNNING")),
+            "finishedJobs": str(states.count("FINISHED")),
+            "failedJobs": str(states.count("FAILED")),
+            "cancelledJobs": str(states.count("CANCELED")),
+        })
+
+
+def build_config(args: argparse.Namespace) -> FakeMasterConfig:
+    return FakeMasterConfig(
+        latency=LatencyProfile.parse(args.latency),
+        endpoint_latency={
+            endpoint: LatencyProfile.parse(spec)
+            for endpoint, _, spec in (item.partition("=") for item in args.endpoint_latency)
+        },
+        error_rate=args.error_rate,
+        error_status=args.error_status,
+        slow_rate=args.slow_rate,
+        slow_ms=args.slow_ms,
+        seed_jobs=args.seed_jobs,
+        seed=args.seed,
+    )
+
+
+def add_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument("--latency", default="fixed:0", help="<fixed|uniform|exponential|lognormal>:<mean_ms>")
+    parser.add_argument(
+        "--endpoint-latency", action="append", default=[],
+        help="per-endpoint override, e.g. job-info=lognormal:50 (repeatable)",
+    )
+    parser.add_argument("--error-rate", type=float, default=0.0, help="fraction of requests that fail")
+    parser.add_argument("--error-status", type=int, default=500)
+    parser.add_argument("--slow-rate", type=float, default=0.0, help="fraction of requests delayed by --slow-ms")
+    parser.add_argument("--slow-ms", type=float, default=2000.0)
+    parser.add_argument("--seed-jobs", type=int, default=1000, help="jobs present at startup")
+    parser.add_argument("--seed", type=int, default=None, help="random seed for reproducible runs")
+
+
+def main() -> None:
+    import uvicorn
+
+    parser = argparse.ArgumentParser(description="Fake SeaTunnel master")
+    add_arguments(parser)
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=5801)
+    args = parser.parse_args()
+    uvicorn.run(FakeSeaTunnelMaster(build_config(args)).app, host=args.host, port=args.port, log_level="warning")
+
+
+if __name__ == "__main__":
+    main()
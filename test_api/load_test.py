@@ -0,0 +1,219 @@
+"""Load driver for the FastAPI app against the fake SeaTunnel master.
+
+Runs app.main in-process (lifespan included) behind ``httpx.ASGITransport``,
+with the app's SeaTunnel client wired to test_api/fake_seatunnel.py, and
+drives the submit, status and stop routes at increasing concurrency:
+
+    python -m test_api.load_test --concurrency 1,8,32,128 --duration 5 --latency lognormal:20
+
+For each route and concurrency level it reports throughput, p50/p95/p99
+latency and event-loop lag. The fake master shares the app's event loop;
+pass --upstream-url to target one started separately
+(``python -m test_api.fake_seatunnel``) and keep its work off the loop.
+"""
+import argparse
+import asyncio
+import itertools
+import json
+import logging
+import os
+import random
+import sys
+import time
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+import httpx
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+from app.config.setting import settings  # noqa: E402
+from app.main import app  # noqa: E402
+from test_api.fake_seatunnel import FakeSeaTunnelMaster, add_arguments, build_config  # noqa: E402
+
+PAYLOAD_PATH = os.path.join(ROOT, "test_api", "payload", "create_job_api.json")
+ROUTES = ("submit", "status", "stop")
+
+
+def percentile(sorted_values: List[float], pct: float) -> float:
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, max(0, int(round(pct / 100 * len(sorted_values))) - 1))
+    return sorted_values[index]
+
+
+class LoopLagMonitor:
+    """Measures how late a periodic sleep wakes up, i.e. event-loop lag"""
+
+    def __init__(self, interval: float = 0.01):
+        self.interval = interval
+        self.samples: List[float] = []
+        self._task: Optional[asyncio.Task] = None
+
+    async def _run(self) -> None:
+        while True:
+            started = time.perf_counter()
+            await asyncio.sleep(self.interval)
+            self.samples.append(max(0.0, time.perf_counter() - started - self.interval))
+
+    def start(self) -> None:
+        self.samples = []
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> List[float]:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        return sorted(self.samples)
+
+
+class LoadDriver:
+    def __init__(self, client: httpx.AsyncClient, job_ids: List[str], unique_payloads: bool = True):
+        self.client = client
+        self.job_ids = job_ids
+        self.unique_payloads = unique_payloads
+        with open(PAYLOAD_PATH) as f:
+            self.payload = json.load(f)
+        self._counter = itertools.count()
+
+    def _submit_body(self) -> Dict[str, Any]:
+        if not self.unique_payloads:
+            return self.payload
+        # Distinct table names so no submit is deduplicated as a repeat of an earlier one
+        body = json.loads(json.dumps(self.payload))
+        body["source"]["config"]["table-names"] = [f"vikki_data.datalake.load_{next(self._counter)}"]
+        return body
+
+    async def submit(self) -> httpx.Response:
+        return await self.client.post("/api/v1/jobs", json=self._submit_body())
+
+    async def status(self) -> httpx.Response:
+        return await self.client.get(f"/api/v1/jobs/{random.choice(self.job_ids)}")
+
+    async def stop(self) -> httpx.Response:
+        return await self.client.post(f"/api/v1/jobs/{random.choice(self.job_ids)}/stop")
+
+    async def run_stage(self, route: str, concurrency: int, duration: float) -> Dict[str, Any]:
+        operation: Callable[[], Awaitable[httpx.Response]] = getattr(self, route)
+        latencies: List[float] = []
+        statuses: Dict[str, int] = {}
+        deadline = time.perf_counter() + duration
+
+        async def worker() -> None:
+            while time.perf_counter() < deadline:
+                started = time.perf_counter()
+                try:
+                    response = await operation()
+                    status = str(response.status_code)
+                except Exception as e:
+                    status = type(e).__name__
+                latencies.append(time.perf_counter() - started)
+                statuses[status] = statuses.get(status, 0) + 1
+
+        monitor = LoopLagMonitor()
+        monitor.start()
+        started = time.perf_counter()
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+        elapsed = time.perf_counter() - started
+        lag = await monitor.stop()
+
+        latencies.sort()
+        errors = sum(count for status, count in statuses.items() if not status.startswith("2"))
+        return {
+            "route": route,
+            "concurrency": concurrency,
+            "requests": len(latencies),
+            "errors": errors,
+            "statuses": statuses,
+            "throughput_rps": len(latencies) / elapsed if elapsed else 0.0,
+            "p50_ms": percentile(latencies, 50) * 1000,
+            "p95_ms": percentile(latencies, 95) * 1000,
+            "p99_ms": percentile(latencies, 99) * 1000,
+            "max_ms": (latencies[-1] if latencies else 0.0) * 1000,
+            "loop_lag_p50_ms": percentile(lag, 50) * 1000,
+            "loop_lag_p99_ms": percentile(lag, 99) * 1000,
+            "loop_lag_max_ms": (lag[-1] if lag else 0.0) * 1000,
+        }
+
+
+def print_row(row: Dict[str, Any]) -> None:
+    print(
+        f"{row['route']:<8} {row['concurrency']:>6} {row['requests']:>8} {row['errors']:>7} "
+        f"{row['throughput_rps']:>9.1f} {row['p50_ms']:>8.2f} {row['p95_ms']:>8.2f} {row['p99_ms']:>8.2f} "
+        f"{row['loop_lag_p50_ms']:>8.2f} {row['loop_lag_p99_ms']:>8.2f} {row['loop_lag_max_ms']:>8.2f}"
+    )
+
+
+async def upstream_job_ids(url: str) -> List[str]:
+    async with httpx.AsyncClient(base_url=url) as upstream:
+        response = await upstream.get("/running-jobs")
+        response.raise_for_status()
+        return [str(job["jobId"]) for job in response.json()]
+
+
+async def run(args: argparse.Namespace) -> List[Dict[str, Any]]:
+    if args.upstream_url:
+        settings.API_URL = args.upstream_url
+        job_ids = await upstream_job_ids(args.upstream_url)
+    else:
+        fake = FakeSeaTunnelMaster(build_config(args))
+        app.state.seatunnel_transport = httpx.ASGITransport(app=fake.app)
+        job_ids = list(fake.jobs)
+    if not job_ids:
+        raise SystemExit("The upstream has no jobs for the status and stop routes; seed some first")
+
+    levels = [int(level) for level in args.concurrency.split(",")]
+    routes = [route.strip() for route in args.routes.split(",")]
+    rows = []
+    async with app.router.lifespan_context(app):
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://load-test", timeout=None) as client:
+            driver = LoadDriver(client, job_ids, unique_payloads=not args.same_payload)
+            print(
+                f"{'route':<8} {'conc':>6} {'requests':>8} {'errors':>7} {'rps':>9} {'p50 ms':>8} "
+                f"{'p95 ms':>8} {'p99 ms':>8} {'lag p50':>8} {'lag p99':>8} {'lag max':>8}"
+            )
+            for route in routes:
+                for concurrency in levels:
+                    row = await driver.run_stage(route, concurrency, args.duration)
+                    rows.append(row)
+                    print_row(row)
+    return rows
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--concurrency", default="1,8,32,128", help="comma-separated concurrency levels")
+    parser.add_argument("--duration", type=float, default=5.0, help="seconds per route and level")
+    parser.add_argument("--routes", default=",".join(ROUTES), help="subset of submit,status,stop")
+    parser.add_argument(
+        "--same-payload", action="store_true",
+        help="submit one identical payload every time; repeats are deduplicated "
+        "unless SEATUNNEL_IDEMPOTENCY_DEDUP_CONFIGS=false",
+    )
+    parser.add_argument("--upstream-url", default=None, help="use a separately running fake master or cluster")
+    parser.add_argument("--output", default=None, help="write the results as JSON")
+    add_arguments(parser)
+    args = parser.parse_args(argv)
+
+    unknown = set(route.strip() for route in args.routes.split(",")) - set(ROUTES)
+    if unknown:
+        parser.error(f"Unknown routes: {', '.join(sorted(unknown))}")
+
+    # Per-request httpx logging would dominate the measurements
+    logging.getLogger("httpx").setLevel(logging.WARNING)
+    rows = asyncio.run(run(args))
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump({"args": vars(args), "results": rows}, f, indent=2)
+        print(f"\nResults written to {args.output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
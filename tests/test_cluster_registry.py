@@ -0,0 +1,51 @@
+import asyncio
+from collections import Counter
+
+import httpx
+import pytest
+
+from app.client.http_client import AsyncSeaTunnelClient
+from app.config.setting import settings
+from app.services.cluster_registry import ClusterRegistry
+from app.services.job_service import JobService
+
+
+@pytest.fixture(autouse=True)
+def no_retries(monkeypatch):
+    monkeypatch.setattr(settings, "RETRY_BACKOFF_BASE", 0.0)
+    monkeypatch.setattr(settings, "READ_RETRIES", 0)
+
+
+def cluster(name, code, calls, payload=None):
+    def handler(request):
+        calls[name] += 1
+        return httpx.Response(code, json=payload if payload is not None else {"message": "nope"})
+    return AsyncSeaTunnelClient(base_urls=[f"http://{name}:8080"], transport=httpx.MockTransport(handler))
+
+
+def test_found_job_info_is_not_fetched_twice():
+    calls = Counter()
+    info = {"jobId": "7", "jobStatus": "RUNNING"}
+    clusters = ClusterRegistry({"a": cluster("a", 404, calls), "b": cluster("b", 200, calls, info)})
+    service = JobService(clusters.client("a"), clusters=clusters)
+
+    async def scenario():
+        async with clusters.client("a"), clusters.client("b"):
+            return await service.get_job("7")
+
+    assert asyncio.run(scenario()) == info
+    assert calls == {"a": 1, "b": 1}
+    assert clusters.job_clusters.get("7") == "b"
+
+
+@pytest.mark.parametrize("code, searches", [(404, 1), (503, 2)], ids=["denied", "unavailable"])
+def test_miss_is_only_kept_when_every_cluster_denies_the_job(code, searches):
+    calls = Counter()
+    clusters = ClusterRegistry({"a": cluster("a", 404, calls), "b": cluster("b", code, calls)})
+
+    async def scenario():
+        async with clusters.client("a"), clusters.client("b"):
+            return [await clusters.locate("7") for _ in range(2)]
+
+    assert asyncio.run(scenario()) == ["a", "a"]
+    assert calls["a"] == searches
@@ -0,0 +1,111 @@
+import pytest
+
+from app.client import endpoints
+from app.client.endpoints import CLOSED, HALF_OPEN, OPEN, Endpoint, EndpointPool
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    fake = FakeClock()
+    monkeypatch.setattr(endpoints.time, "monotonic", fake)
+    return fake
+
+
+def test_breaker_opens_after_consecutive_failures(clock):
+    endpoint = Endpoint("http://a", failure_threshold=3, open_seconds=30)
+    endpoint.record_failure()
+    endpoint.record_failure()
+    assert endpoint.state == CLOSED and endpoint.available()
+
+    endpoint.record_failure()
+    assert endpoint.state == OPEN
+    assert not endpoint.available()
+
+
+def test_success_resets_the_failure_count(clock):
+    endpoint = Endpoint("http://a", failure_threshold=2, open_seconds=30)
+    endpoint.record_failure()
+    endpoint.record_success(0.01)
+    endpoint.record_failure()
+    assert endpoint.state == CLOSED
+
+
+def test_open_breaker_admits_a_single_trial_after_cool_down(clock):
+    endpoint = Endpoint("http://a", failure_threshold=1, open_seconds=30)
+    endpoint.record_failure()
+    clock.now += 29
+    assert not endpoint.available()
+
+    clock.now += 1
+    assert endpoint.available()
+    assert endpoint.state == HALF_OPEN
+    endpoint.acquire()
+    # A second caller does not get through while the trial is out
+    assert not endpoint.available()
+
+    endpoint.record_success(0.01)
+    endpoint.release()
+    assert endpoint.state == CLOSED
+    assert endpoint.available()
+
+
+def test_failed_trial_opens_the_breaker_again(clock):
+    endpoint = Endpoint("http://a", failure_threshold=5, open_seconds=30)
+    for _ in range(5):
+        endpoint.record_failure()
+    clock.now += 30
+    assert endpoint.available()
+    endpoint.acquire()
+
+    endpoint.record_failure()
+    endpoint.release()
+    assert endpoint.state == OPEN
+    assert endpoint.opened_at == clock.now
+    assert not endpoint.available()
+
+
+def test_trial_ending_without_a_verdict_frees_the_slot(clock):
+    endpoint = Endpoint("http://a", failure_threshold=1, open_seconds=30)
+    endpoint.record_failure()
+    clock.now += 30
+    assert endpoint.available()
+    endpoint.acquire()
+    # e.g. a hedge that lost the race and was cancelled
+    endpoint.release()
+    assert endpoint.state == HALF_OPEN
+    assert endpoint.available()
+
+
+def test_passing_probe_lets_an_open_endpoint_try_early(clock):
+    endpoint = Endpoint("http://a", failure_threshold=1, open_seconds=30)
+    endpoint.record_failure()
+    endpoint.record_probe(True)
+    assert endpoint.state == HALF_OPEN
+    assert endpoint.available()
+
+
+def test_pool_skips_open_and_prefers_healthy_endpoints(clock):
+    pool = EndpointPool(["http://a", "http://b", "http://c"])
+    a, b, c = pool.endpoints
+    a.failure_threshold = 1
+    a.record_failure()
+    b.record_probe(False)
+
+    assert pool.select() is c
+    # An unhealthy endpoint is still better than none
+    assert pool.select(exclude={c}) is b
+    # Once everything has been tried, the closed ones are offered again
+    assert pool.select(exclude={b, c}) in (b, c)
+
+    c.failure_threshold = b.failure_threshold = 1
+    b.record_failure()
+    c.record_failure()
+    assert pool.select() is None
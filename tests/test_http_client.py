@@ -0,0 +1,235 @@
+import asyncio
+from collections import Counter
+from typing import Callable, Dict, List
+
+import httpx
+import pytest
+
+from app.client.endpoints import CLOSED, OPEN
+from app.client.http_client import AsyncSeaTunnelClient, SeaTunnelAPIError
+from app.config.setting import settings
+
+A = "http://a:8080"
+B = "http://b:8080"
+
+
+@pytest.fixture(autouse=True)
+def no_backoff(monkeypatch):
+    monkeypatch.setattr(settings, "RETRY_BACKOFF_BASE", 0.0)
+
+
+def run(coro):
+    return asyncio.run(coro)
+
+
+def make_client(handler: Callable, urls: List[str], **kwargs) -> AsyncSeaTunnelClient:
+    return AsyncSeaTunnelClient(base_urls=urls, transport=httpx.MockTransport(handler), **kwargs)
+
+
+def endpoint(client: AsyncSeaTunnelClient, url: str):
+    return next(e for e in client.pool.endpoints if e.url == url)
+
+
+def prefer(client: AsyncSeaTunnelClient, url: str) -> None:
+    # select() picks the lowest latency first; make ``url`` the obvious choice
+    for e in client.pool.endpoints:
+        e.latency = 0.001 if e.url == url else 1.0
+
+
+def by_host(routes: Dict[str, Callable[[httpx.Request], httpx.Response]], calls: Counter):
+    async def handler(request: httpx.Request) -> httpx.Response:
+        host = f"http://{request.url.host}:{request.url.port}"
+        calls[host] += 1
+        result = routes[host](request)
+        if asyncio.iscoroutine(result):
+            result = await result
+        return result
+    return handler
+
+
+def ok(payload):
+    return lambda request: httpx.Response(200, json=payload)
+
+
+def status(code):
+    return lambda request: httpx.Response(code, json={"message": "nope"})
+
+
+def raises(error_class):
+    def handler(request):
+        raise error_class("boom", request=request)
+    return handler
+
+
+def test_read_retries_on_another_endpoint_after_a_5xx():
+    calls = Counter()
+    client = make_client(by_host({A: status(503), B: ok({"jobId": "1"})}, calls), [A, B])
+    prefer(client, A)
+
+    async def scenario():
+        async with client:
+            return await client.get_overview()
+
+    assert run(scenario()) == {"jobId": "1"}
+    assert calls == {A: 1, B: 1}
+    assert endpoint(client, A).failures == 1
+
+
+def test_read_is_not_retried_after_a_4xx():
+    calls = Counter()
+    client = make_client(by_host({A: status(404), B: ok({})}, calls), [A, B])
+    prefer(client, A)
+
+    async def scenario():
+        async with client:
+            await client.get_overview()
+
+    with pytest.raises(SeaTunnelAPIError) as info:
+        run(scenario())
+    assert info.value.status_code == 404
+    assert calls == {A: 1}
+    # The node answered, so its breaker does not count it against it
+    assert endpoint(client, A).failures == 0
+
+
+def test_write_fails_over_when_the_connection_was_never_made():
+    calls = Counter()
+    client = make_client(by_host({A: raises(httpx.ConnectError), B: ok({"jobId": "7"})}, calls), [A, B])
+    prefer(client, A)
+
+    async def scenario():
+        async with client:
+            return await client.create_job({"jobId": "7", "jobName": "j", "config": {}})
+
+    assert run(scenario()) == {"jobId": "7"}
+    assert calls == {A: 1, B: 1}
+
+
+@pytest.mark.parametrize("route_a", [raises(httpx.ReadTimeout), status(503)], ids=["read-timeout", "503"])
+def test_write_is_not_retried_once_it_may_have_been_received(route_a):
+    calls = Counter()
+    client = make_client(by_host({A: route_a, B: ok({})}, calls), [A, B])
+    prefer(client, A)
+
+    async def scenario():
+        async with client:
+            await client.stop_job("7")
+
+    with pytest.raises(SeaTunnelAPIError):
+        run(scenario())
+    assert calls == {A: 1}
+
+
+def test_open_breaker_takes_the_endpoint_out_of_rotation(monkeypatch):
+    monkeypatch.setattr(settings, "ENDPOINT_FAILURE_THRESHOLD", 1)
+    calls = Counter()
+    client = make_client(by_host({A: raises(httpx.ConnectError), B: ok({})}, calls), [A, B])
+    prefer(client, A)
+
+    async def scenario():
+        async with client:
+            for _ in range(3):
+                await client.get_overview()
+
+    run(scenario())
+    assert endpoint(client, A).state == OPEN
+    assert calls == {A: 1, B: 3}
+
+
+def test_no_call_is_made_while_every_breaker_is_open(monkeypatch):
+    monkeypatch.setattr(settings, "ENDPOINT_FAILURE_THRESHOLD", 1)
+    monkeypatch.setattr(settings, "READ_RETRIES", 0)
+    calls = Counter()
+    client = make_client(by_host({A: status(503)}, calls), [A])
+
+    async def scenario():
+        async with client:
+            with pytest.raises(SeaTunnelAPIError):
+                await client.get_overview()
+            with pytest.raises(SeaTunnelAPIError, match="no SeaTunnel endpoint available"):
+                await client.get_overview()
+
+    run(scenario())
+    assert calls == {A: 1}
+
+
+def test_half_open_trial_success_closes_the_breaker(monkeypatch):
+    monkeypatch.setattr(settings, "ENDPOINT_FAILURE_THRESHOLD", 1)
+    monkeypatch.setattr(settings, "ENDPOINT_OPEN_SECONDS", 0.05)
+    monkeypatch.setattr(settings, "READ_RETRIES", 0)
+    answers = iter([status(503), ok({"ok": True})])
+    client = make_client(lambda request: next(answers)(request), [A])
+
+    async def scenario():
+        async with client:
+            with pytest.raises(SeaTunnelAPIError):
+                await client.get_overview()
+            assert endpoint(client, A).state == OPEN
+            await asyncio.sleep(0.06)
+            return await client.get_overview()
+
+    assert run(scenario()) == {"ok": True}
+    assert endpoint(client, A).state == CLOSED
+
+
+def test_hedge_returns_the_faster_answer_and_cancels_the_slow_one():
+    calls = Counter()
+    cancelled = []
+
+    async def slow(request):
+        try:
+            await asyncio.sleep(5)
+        except asyncio.CancelledError:
+            cancelled.append(request.url.host)
+            raise
+        return httpx.Response(200, json={"from": "a"})
+
+    client = make_client(by_host({A: slow, B: ok({"from": "b"})}, calls), [A, B], hedge_delay=0.02)
+    prefer(client, A)
+
+    async def scenario():
+        async with client:
+            result = await client.get_job("1")
+            await asyncio.sleep(0)
+            return result
+
+    assert run(scenario()) == {"from": "b"}
+    assert calls == {A: 1, B: 1}
+    assert cancelled == ["a"]
+    slow_endpoint = endpoint(client, A)
+    # Losing the race is not a failure, but it does count as slow
+    assert slow_endpoint.state == CLOSED and slow_endpoint.failures == 0
+    assert slow_endpoint.latency > 0.001
+    assert all(e.in_flight == 0 for e in client.pool.endpoints)
+
+
+def test_hedge_is_not_sent_when_the_first_answer_is_quick():
+    calls = Counter()
+    client = make_client(by_host({A: ok({"from": "a"}), B: ok({"from": "b"})}, calls), [A, B], hedge_delay=0.5)
+    prefer(client, A)
+
+    async def scenario():
+        async with client:
+            return await client.get_job("1")
+
+    assert run(scenario()) == {"from": "a"}
+    assert calls == {A: 1}
+
+
+def test_failed_hedge_waits_for_the_primary():
+    calls = Counter()
+
+    async def slow_ok(request):
+        await asyncio.sleep(0.05)
+        return httpx.Response(200, json={"from": "a"})
+
+    client = make_client(by_host({A: slow_ok, B: status(503)}, calls), [A, B], hedge_delay=0.01)
+    prefer(client, A)
+
+    async def scenario():
+        async with client:
+            return await client.get_job("1")
+
+    assert run(scenario()) == {"from": "a"}
+    assert calls == {A: 1, B: 1}
+    assert endpoint(client, B).failures == 1
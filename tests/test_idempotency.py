@@ -0,0 +1,75 @@
+import asyncio
+
+import pytest
+
+from app.config.setting import settings
+from app.services.idempotency import IdempotencyConflict, IdempotencyStore, SubmissionDeduplicator
+
+CONFIG = {"env": {"job.mode": "STREAMING"}, "source": [{"plugin_name": "Postgres-CDC"}]}
+
+
+class FakeJobService:
+    def __init__(self):
+        self.state = "RUNNING"
+
+    async def get_job(self, job_id):
+        await asyncio.sleep(0)
+        return {"jobStatus": self.state}
+
+
+@pytest.fixture
+def dedup(monkeypatch):
+    monkeypatch.setattr(settings, "IDEMPOTENCY_DEDUP_CONFIGS", True)
+    return SubmissionDeduplicator(IdempotencyStore(path=""), FakeJobService())
+
+
+def counting_submit(calls):
+    async def submit():
+        calls.append(1)
+        await asyncio.sleep(0.01)
+        return {"job_id": str(len(calls)), "name": "job"}
+    return submit
+
+
+@pytest.mark.parametrize("key", ["order-sync", None], ids=["same-key", "same-config"])
+def test_concurrent_duplicates_share_one_submit(dedup, key):
+    calls = []
+    submit = counting_submit(calls)
+
+    async def scenario():
+        return await asyncio.gather(*(dedup.submit_once(CONFIG, key, submit) for _ in range(5)))
+
+    results = asyncio.run(scenario())
+
+    assert len(calls) == 1
+    assert {record["job_id"] for record, _ in results} == {"1"}
+    assert sorted(replayed for _, replayed in results) == [False, True, True, True, True]
+
+
+def test_repeats_of_a_finished_config_run_it_again_once(dedup):
+    calls = []
+    submit = counting_submit(calls)
+
+    async def scenario():
+        await dedup.submit_once(CONFIG, None, submit)
+        dedup.job_service.state = "FINISHED"
+        # Each repeat has to ask the master whether the original still runs
+        return await asyncio.gather(*(dedup.submit_once(CONFIG, None, submit) for _ in range(3)))
+
+    results = asyncio.run(scenario())
+
+    assert len(calls) == 2
+    assert {record["job_id"] for record, _ in results} == {"2"}
+    assert sorted(replayed for _, replayed in results) == [False, True, True]
+
+
+def test_reused_key_for_a_different_job_conflicts(dedup):
+    calls = []
+
+    async def scenario():
+        await dedup.submit_once(CONFIG, "order-sync", counting_submit(calls))
+        await dedup.submit_once({**CONFIG, "sink": []}, "order-sync", counting_submit(calls))
+
+    with pytest.raises(IdempotencyConflict):
+        asyncio.run(scenario())
+    assert len(calls) == 1
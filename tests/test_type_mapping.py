@@ -0,0 +1,126 @@
+import asyncio
+from contextlib import asynccontextmanager, contextmanager
+
+import pytest
+
+from app.utils.connectors.oracle import OracleConnector
+from app.utils.connectors.postgresql import PostgreSQLConnector
+from app.utils.db_connector import DBConfig
+from app.utils.type_mapping import map_type
+
+CONFIG = DBConfig(host="db", port=1, username="scott", password="tiger", database="d", service_name="s")
+
+
+class FakePostgresPool:
+    """Answers every fetch with pg_catalog rows as format_type renders them"""
+
+    def __init__(self, rows):
+        self.rows = rows
+
+    async def fetch(self, query, *args):
+        return self.rows
+
+    @asynccontextmanager
+    async def acquire(self):
+        yield self
+
+
+class FakeOracleCursor:
+    def __init__(self, rows):
+        self.rows = rows
+
+    async def execute(self, sql, params=None):
+        pass
+
+    async def fetchall(self):
+        return self.rows
+
+
+class FakeOraclePool:
+    """Answers every query with all_tab_columns rows"""
+
+    def __init__(self, rows):
+        self.rows = rows
+
+    @asynccontextmanager
+    async def acquire(self):
+        yield self
+
+
+@pytest.fixture
+def oracle(monkeypatch):
+    def make(rows):
+        connector = OracleConnector(CONFIG)
+        connector.pool = FakeOraclePool(rows)
+
+        @contextmanager
+        def cursor(conn):
+            yield FakeOracleCursor(conn.rows)
+
+        monkeypatch.setattr(connector, "_cursor", cursor)
+        return connector
+    return make
+
+
+POSTGRES_ROWS = [
+    ("id", "bigint", "long"),
+    ("amount", "numeric(10,2)", "decimal(10,2)"),
+    ("ratio", "numeric", "decimal"),
+    ("name", "character varying(255)", "string"),
+    ("tags", "integer[]", "array<int>"),
+    ("created", "timestamp(6) without time zone", "timestamp"),
+    ("updated", "timestamp with time zone", "timestamp"),
+]
+
+
+def test_postgres_single_and_bulk_lookups_map_columns_identically():
+    rows = [{"table_name": "orders", "column_name": name, "data_type": raw} for name, raw, _ in POSTGRES_ROWS]
+    connector = PostgreSQLConnector(CONFIG)
+    connector.pool = FakePostgresPool(rows)
+    expected = {name: mapped for name, _, mapped in POSTGRES_ROWS}
+
+    single = asyncio.run(connector.get_columns("orders"))
+    bulk = asyncio.run(connector.get_columns_bulk(["orders"]))
+
+    assert single == expected
+    assert bulk == {"orders": expected}
+
+
+ORACLE_ROWS = [
+    # column, data_type, data_precision, data_scale, expected SeaTunnel type
+    ("PRICE", "NUMBER", 10, 2, "decimal(10,2)"),
+    ("QTY", "NUMBER", 9, 0, "int"),
+    ("ORDER_ID", "NUMBER", 18, 0, "long"),
+    ("BIG_ID", "NUMBER", 38, 0, "decimal(38,0)"),
+    ("SEQ", "NUMBER", None, 0, "int"),
+    ("ANY_NUMBER", "NUMBER", None, None, "int"),
+    ("NAME", "VARCHAR2", None, None, "string"),
+    ("CREATED", "TIMESTAMP(6)", None, 6, "timestamp"),
+]
+
+
+def test_oracle_columns_keep_number_precision_and_scale(oracle):
+    connector = oracle([(name, data_type, p, s) for name, data_type, p, s, _ in ORACLE_ROWS])
+
+    columns = asyncio.run(connector.get_columns("orders"))
+
+    assert columns == {name: mapped for name, _, _, _, mapped in ORACLE_ROWS}
+
+
+def test_oracle_bulk_lookup_matches_single_lookup(oracle):
+    connector = oracle([("ORDERS", name, data_type, p, s) for name, data_type, p, s, _ in ORACLE_ROWS])
+
+    columns = asyncio.run(connector.get_columns_bulk(["orders"]))
+
+    assert columns == {"ORDERS": {name: mapped for name, _, _, _, mapped in ORACLE_ROWS}}
+
+
+@pytest.mark.parametrize("raw, expected", [
+    ("decimal(12,4)", "decimal(12,4)"),
+    ("tinyint(1)", "boolean"),
+    ("tinyint(4)", "short"),
+    ("bigint(20) unsigned", "decimal(20,0)"),
+    ("int(11) unsigned", "long"),
+])
+def test_mysql_column_types(raw, expected):
+    assert map_type("mysql", raw) == expected